@@ -0,0 +1,179 @@
+"""
+News API Key Pool
+Spreads News API requests across several keys so throughput scales with the
+number of configured keys instead of being capped by a single key's quota
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from config import (
+    NEWS_API_KEYS, NEWS_API_DAILY_QUOTA,
+    NEWS_API_KEY_COOLDOWN, NEWS_API_INVALID_KEY_COOLDOWN
+)
+
+
+class NoAvailableKeyError(Exception):
+    """Raised when every key in the pool is exhausted or quarantined"""
+
+
+class APIKeyPool:
+    """
+    Thread-safe pool of News API keys
+
+    Each request picks the usable key with the most remaining daily quota.
+    Keys answering 401 (invalid) or 429 (rate limited) are quarantined for a
+    cool-down period and skipped until it expires. Only a 429 whose error
+    code says the daily allowance is used up (apiKeyExhausted) takes the
+    key out until the next UTC day.
+    """
+
+    def __init__(self, keys, daily_quota=NEWS_API_DAILY_QUOTA,
+                 cooldown=NEWS_API_KEY_COOLDOWN,
+                 invalid_cooldown=NEWS_API_INVALID_KEY_COOLDOWN):
+        self.daily_quota = daily_quota
+        self.cooldown = cooldown
+        self.invalid_cooldown = invalid_cooldown
+        self._lock = threading.Lock()
+        self._usage = {}
+        for key in keys:
+            if key and key not in self._usage:
+                self._usage[key] = self._new_usage()
+        self._day = self._today()
+
+    @staticmethod
+    def _new_usage():
+        return {
+            'requests': 0,          # Requests sent today
+            'total_requests': 0,    # Requests sent since the pool started
+            'failures': 0,
+            'quarantined_until': 0.0,
+            'last_status': None,
+            'last_used': None
+        }
+
+    @staticmethod
+    def _today():
+        # NewsAPI resets quotas on UTC days
+        return datetime.now(timezone.utc).date()
+
+    def _reset_if_new_day(self):
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            for usage in self._usage.values():
+                usage['requests'] = 0
+
+    def __len__(self):
+        return len(self._usage)
+
+    def acquire(self):
+        """
+        Reserve a request on the key with the most remaining quota
+
+        Returns:
+            str: API key to use for the next request
+
+        Raises:
+            NoAvailableKeyError: If all keys are quarantined or out of quota
+        """
+        with self._lock:
+            self._reset_if_new_day()
+            now = time.time()
+            best_key = None
+            best_remaining = 0
+            for key, usage in self._usage.items():
+                if usage['quarantined_until'] > now:
+                    continue
+                remaining = self.daily_quota - usage['requests']
+                if remaining > best_remaining:
+                    best_key, best_remaining = key, remaining
+
+            if best_key is None:
+                raise NoAvailableKeyError("All News API keys are exhausted or cooling down")
+
+            usage = self._usage[best_key]
+            usage['requests'] += 1
+            usage['total_requests'] += 1
+            usage['last_used'] = now
+            return best_key
+
+    def report(self, key, status_code, error_code=None):
+        """
+        Record the HTTP status a key received
+
+        Args:
+            key (str): Key used for the request
+            status_code (int): HTTP status code of the response
+            error_code (str): News API error `code` from the response body,
+                if any (e.g. "rateLimited", "apiKeyExhausted")
+        """
+        with self._lock:
+            usage = self._usage.get(key)
+            if usage is None:
+                return
+            usage['last_status'] = status_code
+            if status_code == 401:
+                usage['failures'] += 1
+                usage['quarantined_until'] = time.time() + self.invalid_cooldown
+            elif status_code == 429:
+                usage['failures'] += 1
+                usage['quarantined_until'] = time.time() + self.cooldown
+                if error_code == 'apiKeyExhausted':
+                    # The server says this key is spent for the day, trust
+                    # it over our own count
+                    usage['requests'] = max(usage['requests'], self.daily_quota)
+
+    def remaining_quota(self):
+        """Total requests left today across keys that are not quarantined"""
+        with self._lock:
+            self._reset_if_new_day()
+            now = time.time()
+            return sum(
+                max(self.daily_quota - usage['requests'], 0)
+                for usage in self._usage.values()
+                if usage['quarantined_until'] <= now
+            )
+
+    def get_usage_stats(self):
+        """
+        Get per-key usage statistics
+
+        Returns:
+            list: One dict per key, with the key masked for display
+        """
+        with self._lock:
+            self._reset_if_new_day()
+            now = time.time()
+            stats = []
+            for key, usage in self._usage.items():
+                stats.append({
+                    'key': mask_key(key),
+                    'requests_today': usage['requests'],
+                    'remaining_today': max(self.daily_quota - usage['requests'], 0),
+                    'total_requests': usage['total_requests'],
+                    'failures': usage['failures'],
+                    'last_status': usage['last_status'],
+                    'quarantined': usage['quarantined_until'] > now,
+                    'cooldown_remaining': max(int(usage['quarantined_until'] - now), 0)
+                })
+            return stats
+
+
+def mask_key(key):
+    """Hide all but the last four characters of an API key"""
+    if len(key) <= 4:
+        return "****"
+    return "*" * (len(key) - 4) + key[-4:]
+
+
+# Singleton instance for easy import
+_pool_instance = None
+
+def get_key_pool():
+    """Get singleton instance of APIKeyPool built from config"""
+    global _pool_instance
+    if _pool_instance is None:
+        _pool_instance = APIKeyPool(NEWS_API_KEYS)
+    return _pool_instance
@@ -1,12 +1,18 @@
 import streamlit as st
-import requests
-from datetime import datetime
-from users_db import verify_user, add_user, get_user_info
-import os
+import math
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from users_db import verify_user, add_user, get_user_info, record_login
 from colors import (
     MAIN_BLUE, ACTION_RED, POSITIVE_GREEN, NEUTRAL_AMBER, 
     NEGATIVE_RED, INFO_BLUE, SUCCESS_GREEN, SENTIMENT_COLORS
 )
+from image_cache import get_image_cache
+from ui_resources import INDIAN_PARTIES, INDIAN_STATES, load_logo_bytes, build_sentiment_figures
+
+_rerun_started = time.perf_counter()
 
 # Configure the page - MUST be first Streamlit command
 st.set_page_config(
@@ -16,7 +22,11 @@ st.set_page_config(
 )
 
 # Now import config after set_page_config
-from config import NEWS_API_KEY
+from config import NEWS_API_KEYS, RSS_FEEDS, MAX_ARTICLES_LIMIT, ARTICLES_PAGE_SIZE, SHOW_RENDER_TIMINGS, PDF_POLL_INTERVAL
+from api_key_pool import get_key_pool
+from news_sources import get_sources, fetch_from_sources, NewsSourceError
+from news_ingester import start_ingester, is_watched, get_ingested_articles
+from database import save_analysis_to_db, start_retention_worker, get_analysis_history
 
 # Add custom CSS for smooth scroll to top
 st.markdown("""
@@ -27,6 +37,25 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+@st.cache_resource
+def _background_ingester():
+    """Start the watch-list ingester once per server process"""
+    return start_ingester(get_key_pool())
+
+@st.cache_resource
+def _analysis_history():
+    """Open the analysis history once per server process, before any page saves to it"""
+    return get_analysis_history()
+
+@st.cache_resource
+def _background_retention():
+    """Start the analysis history retention thread once per server process"""
+    return start_retention_worker()
+
+_background_ingester()
+_analysis_history()
+_background_retention()
+
 # Initialize session state for login
 if 'logged_in' not in st.session_state:
     st.session_state.logged_in = False
@@ -42,6 +71,10 @@ if 'selected_state' not in st.session_state:
     st.session_state.selected_state = ''
 if 'show_signup' not in st.session_state:
     st.session_state.show_signup = False
+if 'analysis_cache' not in st.session_state:
+    st.session_state.analysis_cache = None
+if 'pdf_job_id' not in st.session_state:
+    st.session_state.pdf_job_id = None
 
 def login(username, password):
     """
@@ -50,6 +83,8 @@ def login(username, password):
     if verify_user(username, password):
         st.session_state.logged_in = True
         st.session_state.username = username
+        # Buffered; written to the users table in the background
+        record_login(username)
         return True
     return False
 
@@ -59,48 +94,193 @@ def logout():
     st.session_state.username = ''
     st.session_state.current_page = 'news'
     st.session_state.articles = None
+    st.session_state.analysis_cache = None
+    st.session_state.pdf_job_id = None
 
-def fetch_news(party, state, api_key, max_articles=10, sort_by="Latest"):
+def fetch_and_score_news(party, state, max_articles=10, sort_by="Latest", oldest=None, progress=None,
+                         preview=None, preview_count=ARTICLES_PAGE_SIZE):
     """
-    Fetch news articles using News API
+    Fetch news page by page from every configured source and score each
+    article as it arrives
+    
+    Args:
+        progress: Optional st.empty() for a running count and breakdown
+        preview: Optional container; the first preview_count articles are
+            shown in it as soon as each is scored, so the first results do
+            not wait for the whole batch
+    
+    Returns:
+        tuple: (articles, analysis_results) or (None, None) on error
     """
-    # Construct search query
-    query = f"{party}"
-    if state != "All States":
-        query += f" {state}"
-    query += " India politics"
-    
-    # Map sort_by option to API parameter
-    sort_mapping = {
-        "Latest": "publishedAt",
-        "Relevance": "relevancy",
-        "Popularity": "popularity"
-    }
+    from sentiment_analyzer import get_analyzer, SentimentStats
     
-    url = "https://newsapi.org/v2/everything"
-    params = {
-        'q': query,
-        'language': 'en',
-        'sortBy': sort_mapping.get(sort_by, 'publishedAt'),
-        'pageSize': max_articles,
-        'apiKey': api_key
-    }
+    analyzer = get_analyzer()
+    articles = []
+    individual_results = []
+    stats = SentimentStats()
+    last_refresh = 0
     
     try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data['status'] == 'ok':
-            return data['articles']
-        else:
-            return None
-    except requests.exceptions.RequestException as e:
+        sources = get_sources(get_key_pool())
+        pages = fetch_from_sources(sources, party, state, max_articles, sort_by, oldest=oldest)
+        for page in pages:
+            for article, sentiment in analyzer.analyze_articles_stream(page, target_party=party):
+                articles.append(article)
+                individual_results.append(sentiment)
+                stats.add(sentiment)
+                if preview is not None and len(articles) <= preview_count:
+                    with preview:
+                        classification = sentiment['classification']
+                        st.caption(f"{SENTIMENT_EMOJI.get(classification, '')} {classification} "
+                                   f"(score {sentiment['compound_score']:+.2f})")
+                        display_news_article(article, len(articles))
+                if progress is not None and time.time() - last_refresh > 0.5:
+                    counts = stats.to_dict()
+                    progress.caption(
+                        f"Fetched and scored {len(articles)} articles so far: "
+                        f"{counts['positive_count']} positive, {counts['neutral_count']} neutral, "
+                        f"{counts['negative_count']} negative"
+                    )
+                    last_refresh = time.time()
+    except NewsSourceError as e:
         st.error(f"Error fetching news: {str(e)}")
-        return None
+        if not articles:
+            return None, None
+    
+    if not articles:
+        return None, None
+    
+    analysis_results = {
+        'individual_results': individual_results,
+        'overall_statistics': stats.to_dict()
+    }
+    return articles, analysis_results
+
+@st.cache_resource
+def _shared_analysis_cache():
+    """LRU of analysis results shared by all sessions, keyed by fingerprint"""
+    return {'lock': threading.Lock(), 'entries': OrderedDict(), 'max_entries': 64}
+
+def remember_analysis(articles, target_party, analysis_results):
+    """Keep computed results so later reruns and sessions do not rescore"""
+    from sentiment_analyzer import fingerprint_articles
+    fingerprint = fingerprint_articles(articles, target_party)
+    st.session_state.analysis_cache = {'fingerprint': fingerprint, 'results': analysis_results}
+    
+    shared = _shared_analysis_cache()
+    with shared['lock']:
+        shared['entries'][fingerprint] = analysis_results
+        shared['entries'].move_to_end(fingerprint)
+        while len(shared['entries']) > shared['max_entries']:
+            shared['entries'].popitem(last=False)
+
+def lookup_analysis(articles, target_party):
+    """
+    Get cached batch analysis results for these inputs, or None
+    
+    The session cache answers plain reruns; the shared cache covers other
+    sessions scoring the same articles for the same party.
+    """
+    from sentiment_analyzer import fingerprint_articles
+    fingerprint = fingerprint_articles(articles, target_party)
+    cached = st.session_state.analysis_cache
+    if cached and cached['fingerprint'] == fingerprint:
+        return cached['results']
+    
+    shared = _shared_analysis_cache()
+    with shared['lock']:
+        analysis_results = shared['entries'].get(fingerprint)
+        if analysis_results is not None:
+            shared['entries'].move_to_end(fingerprint)
+    if analysis_results is not None:
+        st.session_state.analysis_cache = {'fingerprint': fingerprint, 'results': analysis_results}
+    return analysis_results
+
+LIST_SORT_OPTIONS = ["Original order", "Most positive first", "Most negative first", "Highest confidence first"]
+SENTIMENT_CLASSES = ["Positive", "Neutral", "Negative"]
+SENTIMENT_EMOJI = {'Positive': '😊', 'Neutral': '😐', 'Negative': '😢'}
+
+def article_list_controls(key, with_sentiment=True):
+    """
+    Sort/filter/page-size widgets shown above an article list
+    
+    Returns:
+        dict: Selected classes, sort order, score range and page size
+    """
+    page_size_options = sorted({10, 25, 50, 100, ARTICLES_PAGE_SIZE})
+    controls = {'classes': SENTIMENT_CLASSES, 'sort': LIST_SORT_OPTIONS[0], 'score_range': (-1.0, 1.0)}
+    
+    if with_sentiment:
+        col1, col2, col3 = st.columns([2, 2, 1])
+        with col1:
+            controls['classes'] = st.multiselect("Show sentiment", SENTIMENT_CLASSES, default=SENTIMENT_CLASSES, key=f"{key}_classes")
+        with col2:
+            controls['sort'] = st.selectbox("Order", LIST_SORT_OPTIONS, key=f"{key}_sort")
+        with col3:
+            controls['page_size'] = st.selectbox("Per page", page_size_options, index=page_size_options.index(ARTICLES_PAGE_SIZE), key=f"{key}_page_size")
+        controls['score_range'] = st.slider("Compound score range", -1.0, 1.0, (-1.0, 1.0), 0.05, key=f"{key}_score_range")
+    else:
+        controls['page_size'] = st.selectbox("Articles per page", page_size_options, index=page_size_options.index(ARTICLES_PAGE_SIZE), key=f"{key}_page_size")
+    
+    return controls
 
-def display_news_article(article, index):
-    """Display a single news article"""
+def filter_and_sort_articles(entries, controls):
+    """
+    Apply list controls to (index, article, sentiment) entries
+    
+    Entries without a sentiment are only paged, never filtered out.
+    """
+    low, high = controls['score_range']
+    selected = [
+        entry for entry in entries
+        if entry[2] is None or (
+            entry[2]['classification'] in controls['classes']
+            and low <= entry[2]['compound_score'] <= high
+        )
+    ]
+    
+    sort = controls['sort']
+    if sort == "Most positive first":
+        selected.sort(key=lambda entry: entry[2]['compound_score'] if entry[2] else 0, reverse=True)
+    elif sort == "Most negative first":
+        selected.sort(key=lambda entry: entry[2]['compound_score'] if entry[2] else 0)
+    elif sort == "Highest confidence first":
+        selected.sort(key=lambda entry: entry[2]['confidence'] if entry[2] else 0, reverse=True)
+    return selected
+
+def page_slice(key, total, page_size, controls=None):
+    """
+    Previous/next page navigation for a list of `total` items
+    
+    The page resets to the first one whenever the list controls change.
+    
+    Returns:
+        tuple: (start, end) indices of the current page
+    """
+    page_count = max(1, math.ceil(total / page_size))
+    signature = repr(controls)
+    if st.session_state.get(f"{key}_signature") != signature:
+        st.session_state[f"{key}_signature"] = signature
+        st.session_state[f"{key}_page"] = 1
+    page = min(max(st.session_state.get(f"{key}_page", 1), 1), page_count)
+    
+    if page_count > 1:
+        col_prev, col_info, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            if st.button("← Previous", disabled=page <= 1, use_container_width=True, key=f"{key}_prev"):
+                page -= 1
+        with col_next:
+            if st.button("Next →", disabled=page >= page_count, use_container_width=True, key=f"{key}_next"):
+                page += 1
+        with col_info:
+            st.caption(f"Page {page} of {page_count} ({total} articles)")
+    
+    st.session_state[f"{key}_page"] = page
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total)
+
+def display_news_article(article, index, image=None):
+    """Display a single news article (image: cached thumbnail bytes)"""
     with st.container():
         st.markdown(f"### {index}. {article.get('title', 'No Title')}")
         
@@ -121,8 +301,8 @@ def display_news_article(article, index):
                 st.caption(f"Published: {pub_date}")
         
         with col2:
-            if article.get('urlToImage'):
-                st.image(article['urlToImage'], use_column_width=True)
+            if image:
+                st.image(image, use_column_width=True)
         
         if article.get('url'):
             st.link_button("Read Full Article", article['url'], use_container_width=True)
@@ -134,7 +314,7 @@ def login_page():
     # Display logo at the top center - smaller size to prevent scrolling
     col1, col2, col3 = st.columns([2, 1, 2])
     with col2:
-        st.image("assets/svgviewer-png-output.png", width=130)
+        st.image(load_logo_bytes(), width=130)
     
     # Title with custom styling
     st.markdown(
@@ -223,7 +403,7 @@ def news_page():
     # Display logo in sidebar and header - compact layout
     col1, col2 = st.columns([1, 4])
     with col1:
-        st.image("assets/svgviewer-png-output.png", width=80)
+        st.image(load_logo_bytes(), width=80)
     with col2:
         st.markdown(
             f"<h1 style='color: {MAIN_BLUE}; margin-top: 10px;'>Political News Sentiment Analysis</h1>",
@@ -233,9 +413,17 @@ def news_page():
     # Sidebar with user info and logout
     with st.sidebar:
         # Logo in sidebar - smaller
-        st.image("assets/svgviewer-png-output.png", width=120)
+        st.image(load_logo_bytes(), width=120)
         st.markdown("---")
         st.write(f"👤 Logged in as: **{st.session_state.username}**")
+        if st.button("📜 My Analysis History", use_container_width=True):
+            st.session_state.current_page = 'history'
+            st.session_state.history_cursors = [None]
+            st.session_state.history_open_id = None
+            st.rerun()
+        if st.button("🔎 Search Stored Articles", use_container_width=True):
+            st.session_state.current_page = 'search'
+            st.rerun()
         if st.button("Logout", use_container_width=True):
             logout()
             st.rerun()
@@ -258,81 +446,13 @@ def news_page():
     st.markdown("---")
     st.subheader("Select Analysis Parameters")
     
-    # Indian Political Parties
-    indian_parties = [
-        "Bharatiya Janata Party (BJP)",
-        "Indian National Congress (INC)",
-        "Aam Aadmi Party (AAP)",
-        "Trinamool Congress (TMC)",
-        "Dravida Munnetra Kazhagam (DMK)",
-        "All India Anna Dravida Munnetra Kazhagam (AIADMK)",
-        "Shiv Sena",
-        "Nationalist Congress Party (NCP)",
-        "Communist Party of India (Marxist) (CPI-M)",
-        "Communist Party of India (CPI)",
-        "Bahujan Samaj Party (BSP)",
-        "Samajwadi Party (SP)",
-        "Rashtriya Janata Dal (RJD)",
-        "Janata Dal (United) (JD-U)",
-        "Janata Dal (Secular) (JD-S)",
-        "Biju Janata Dal (BJD)",
-        "Telangana Rashtra Samithi (TRS/BRS)",
-        "YSR Congress Party (YSRCP)",
-        "Telugu Desam Party (TDP)",
-        "Shiromani Akali Dal (SAD)",
-        "Indian Union Muslim League (IUML)",
-        "All India Majlis-e-Ittehadul Muslimeen (AIMIM)",
-        "Other"
-    ]
-    
-    # Indian States and Union Territories
-    indian_states = [
-        "Andhra Pradesh",
-        "Arunachal Pradesh",
-        "Assam",
-        "Bihar",
-        "Chhattisgarh",
-        "Goa",
-        "Gujarat",
-        "Haryana",
-        "Himachal Pradesh",
-        "Jharkhand",
-        "Karnataka",
-        "Kerala",
-        "Madhya Pradesh",
-        "Maharashtra",
-        "Manipur",
-        "Meghalaya",
-        "Mizoram",
-        "Nagaland",
-        "Odisha",
-        "Punjab",
-        "Rajasthan",
-        "Sikkim",
-        "Tamil Nadu",
-        "Telangana",
-        "Tripura",
-        "Uttar Pradesh",
-        "Uttarakhand",
-        "West Bengal",
-        "Andaman and Nicobar Islands",
-        "Chandigarh",
-        "Dadra and Nagar Haveli and Daman and Diu",
-        "Delhi",
-        "Jammu and Kashmir",
-        "Ladakh",
-        "Lakshadweep",
-        "Puducherry",
-        "All States"
-    ]
-    
     # Create two columns for selections with enhanced features
     col1, col2 = st.columns(2)
     
     with col1:
         selected_party = st.selectbox(
             "Select Political Party",
-            options=indian_parties,
+            options=INDIAN_PARTIES,
             index=0,
             help="Choose the political party for sentiment analysis"
         )
@@ -340,7 +460,7 @@ def news_page():
         with st.expander("Quick Party Search"):
             search_term = st.text_input("Type party name to filter", key="party_search")
             if search_term:
-                filtered = [p for p in indian_parties if search_term.lower() in p.lower()]
+                filtered = [p for p in INDIAN_PARTIES if search_term.lower() in p.lower()]
                 if filtered:
                     st.write("**Matching parties:**")
                     for p in filtered[:5]:
@@ -349,8 +469,8 @@ def news_page():
     with col2:
         selected_state = st.selectbox(
             "Select State/UT",
-            options=indian_states,
-            index=len(indian_states) - 1,  # Default to "All States"
+            options=INDIAN_STATES,
+            index=len(INDIAN_STATES) - 1,  # Default to "All States"
             help="Choose the state or union territory"
         )
         # Add state info
@@ -370,8 +490,15 @@ def news_page():
         with col_a:
             # Get default value from session state or use 10
             default_max = st.session_state.get('max_articles', 10)
-            max_articles = st.slider("Max articles to fetch", 5, 20, default_max, key="max_slider")
+            max_articles = st.slider("Max articles to fetch", 5, MAX_ARTICLES_LIMIT, default_max, step=5, key="max_slider")
             st.session_state.max_articles = max_articles
+            # Optional date cut-off - fetching stops once older articles are reached
+            use_cutoff = st.checkbox("Only recent articles", value=st.session_state.get('oldest') is not None, key="cutoff_check")
+            if use_cutoff:
+                default_oldest = st.session_state.get('oldest') or datetime.now().date()
+                st.session_state.oldest = st.date_input("Published on or after", value=default_oldest, key="oldest_input")
+            else:
+                st.session_state.oldest = None
         with col_b:
             # Get default value from session state or use "Latest"
             sort_options = ["Latest", "Relevance", "Popularity"]
@@ -382,28 +509,62 @@ def news_page():
         
         # Show current settings
         st.caption(f"Current settings: {max_articles} articles, sorted by {sort_by}")
+        
+        # Per-key quota usage
+        key_pool = get_key_pool()
+        if len(key_pool) > 0:
+            st.caption(f"API quota left today: {key_pool.remaining_quota()} requests across {len(key_pool)} key(s)")
+            for key_stats in key_pool.get_usage_stats():
+                status = f"cooling down ({key_stats['cooldown_remaining']}s)" if key_stats['quarantined'] else "active"
+                st.caption(f"• {key_stats['key']}: {key_stats['requests_today']} used, {key_stats['remaining_today']} left, {status}")
     
     # Show Live News button with enhanced styling
     if st.button("Show Live News", type="primary", use_container_width=True):
-        if not NEWS_API_KEY or NEWS_API_KEY == "your_api_key_here":
+        if not NEWS_API_KEYS and not RSS_FEEDS:
             st.warning("⚠️ Please configure your News API key in config.py file.")
             st.info("💡 Get your free API key from [newsapi.org](https://newsapi.org) and add it to config.py")
         else:
             # Get advanced options from session state or use defaults
             max_articles_param = st.session_state.get('max_articles', 10)
             sort_by_param = st.session_state.get('sort_by', 'Latest')
+            oldest_param = st.session_state.get('oldest')
+            oldest_param = oldest_param.isoformat() if oldest_param else None
             
-            with st.spinner(f"Fetching {max_articles_param} articles for **{selected_party}** in **{selected_state}** (sorted by {sort_by_param})..."):
-                articles = fetch_news(selected_party, selected_state, NEWS_API_KEY, max_articles_param, sort_by_param)
-                
-                if articles:
-                    # Store articles and parameters in session state
-                    st.session_state.articles = articles
-                    st.session_state.selected_party = selected_party
-                    st.session_state.selected_state = selected_state
-                else:
-                    st.error("❌ No articles found or there was an error fetching news.")
-                    st.info("💡 Tip: Make sure your API key is valid in config.py and try again.")
+            articles = None
+            if is_watched(selected_party, selected_state) and sort_by_param == "Latest" and not oldest_param:
+                # Watched queries are kept fresh in the background - read them locally
+                articles, analysis_results = get_ingested_articles(
+                    selected_party, selected_state, limit=max_articles_param
+                )
+            
+            if not articles:
+                with st.spinner(f"Fetching {max_articles_param} articles for **{selected_party}** in **{selected_state}** (sorted by {sort_by_param})..."):
+                    progress = st.empty()
+                    # Articles appear here while the rest are still being
+                    # fetched and scored; replaced by the full list below
+                    preview_area = st.empty()
+                    articles, analysis_results = fetch_and_score_news(
+                        selected_party, selected_state, max_articles_param, sort_by_param,
+                        oldest=oldest_param, progress=progress, preview=preview_area.container()
+                    )
+                    progress.empty()
+                    preview_area.empty()
+            
+            if articles:
+                # Store articles and parameters in session state
+                st.session_state.articles = articles
+                st.session_state.selected_party = selected_party
+                st.session_state.selected_state = selected_state
+                # A finished export belongs to the previous results
+                st.session_state.pdf_job_id = None
+                # Scores computed while fetching, reused by the results page
+                remember_analysis(articles, selected_party, analysis_results)
+                # Queued; written to the search history in the background
+                save_analysis_to_db(st.session_state.username, selected_party, selected_state,
+                                    articles, analysis_results)
+            else:
+                st.error("❌ No articles found or there was an error fetching news.")
+                st.info("💡 Tip: Make sure your API key is valid in config.py and try again.")
     
     # Display news articles if available
     if st.session_state.articles:
@@ -411,8 +572,23 @@ def news_page():
         st.markdown("---")
         st.subheader("Latest News Articles")
         
-        for idx, article in enumerate(st.session_state.articles, 1):
-            display_news_article(article, idx)
+        # Scores are usually already known from fetching, which enables
+        # sorting and filtering by sentiment
+        analysis_results = lookup_analysis(st.session_state.articles, st.session_state.selected_party)
+        sentiments = analysis_results['individual_results'] if analysis_results else [None] * len(st.session_state.articles)
+        entries = list(zip(range(1, len(sentiments) + 1), st.session_state.articles, sentiments))
+        
+        controls = article_list_controls("news_list", with_sentiment=analysis_results is not None)
+        entries = filter_and_sort_articles(entries, controls)
+        start, end = page_slice("news_list", len(entries), controls['page_size'], controls)
+        st.markdown("---")
+        # Thumbnails come from the local image cache instead of publisher CDNs
+        page_entries = entries[start:end]
+        images = get_image_cache().get_many([article.get('urlToImage') for _, article, _ in page_entries])
+        for idx, article, _ in page_entries:
+            display_news_article(article, idx, images.get(article.get('urlToImage')))
+        if not entries:
+            st.info("No articles match the selected filters.")
         
         # Analyze Sentiment button and Reset button after news display
         st.markdown("---")
@@ -432,8 +608,203 @@ def news_page():
                     del st.session_state.max_articles
                 if 'sort_by' in st.session_state:
                     del st.session_state.sort_by
+                if 'oldest' in st.session_state:
+                    del st.session_state.oldest
+                st.session_state.analysis_cache = None
                 st.rerun()
     
+def render_sentiment_summary(analyzer, stats, party):
+    """Overall sentiment, narrative and metric cards for the results page"""
+    # Overall sentiment summary with color-coded metrics
+    st.markdown("---")
+    st.subheader(f"Overall Sentiment Summary for {party}")
+    
+    # Display overall sentiment with emoji and color
+    overall_sentiment = stats['overall_sentiment']
+    sentiment_emoji = analyzer.get_sentiment_emoji(overall_sentiment)
+    sentiment_color = analyzer.get_sentiment_color(overall_sentiment)
+    
+    st.markdown(f"### {sentiment_emoji} Overall Sentiment: <span style='color: {sentiment_color};'>{overall_sentiment}</span>", unsafe_allow_html=True)
+    
+    # Add human-readable narrative summary
+    narrative_summary = analyzer.get_human_readable_summary({'overall_statistics': stats})
+    st.info(f"📝 **What does this mean for {party}?**\n\n{narrative_summary}")
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric(
+            label="😊 Positive", 
+            value=f"{stats['positive_percentage']}%",
+            delta=f"{stats['positive_count']} articles"
+        )
+    with col2:
+        st.metric(
+            label="😐 Neutral", 
+            value=f"{stats['neutral_percentage']}%",
+            delta=f"{stats['neutral_count']} articles"
+        )
+    with col3:
+        st.metric(
+            label="😢 Negative", 
+            value=f"{stats['negative_percentage']}%",
+            delta=f"{stats['negative_count']} articles"
+        )
+    
+    # Analysis quality metrics
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    with col1:
+        confidence_explanation = analyzer.explain_score('confidence', stats['average_confidence'])
+        st.metric(
+            label="🎯 Average Confidence",
+            value=f"{stats['average_confidence']}%",
+            help=confidence_explanation
+        )
+        st.caption(f"💬 {confidence_explanation}")
+    with col2:
+        compound_explanation = analyzer.explain_score('compound', stats['average_compound_score'])
+        st.metric(
+            label="Compound Score",
+            value=f"{stats['average_compound_score']:.4f}",
+            help=compound_explanation
+        )
+        st.caption(f"💬 {compound_explanation}")
+
+def render_sentiment_charts(stats, key_suffix="final"):
+    """Pie and bar charts of the sentiment distribution"""
+    # Clean, minimal visualizations
+    st.markdown("---")
+    st.subheader("Sentiment Distribution")
+    
+    fig_pie, fig_bar = build_sentiment_figures(
+        (stats['positive_count'], stats['neutral_count'], stats['negative_count']),
+        (stats['positive_percentage'], stats['neutral_percentage'], stats['negative_percentage'])
+    )
+    
+    # Create two columns for compact chart layout
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Pie chart - Sentiment distribution
+        st.plotly_chart(fig_pie, use_container_width=True, key=f"sentiment_pie_{key_suffix}")
+    
+    with col2:
+        # Bar chart - Sentiment counts
+        st.plotly_chart(fig_bar, use_container_width=True, key=f"sentiment_bar_{key_suffix}")
+
+def render_article_sentiment(analyzer, idx, article, sentiment, party):
+    """Expander with the detailed sentiment breakdown of one article"""
+    classification = sentiment['classification']
+    emoji = analyzer.get_sentiment_emoji(classification)
+    color = analyzer.get_sentiment_color(classification)
+    
+    # Create colored header for expander
+    expander_title = f"{emoji} {idx}. {article.get('title', 'No Title')}"
+    
+    with st.expander(expander_title):
+        # Article metadata
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Source:** {article.get('source', {}).get('name', 'Unknown')}")
+            st.write(f"**Published:** {article.get('publishedAt', 'Unknown')[:10]}")
+        with col2:
+            st.write(f"**Author:** {article.get('author', 'Unknown')}")
+        
+        st.markdown("---")
+        
+        # Sentiment breakdown with color
+        st.markdown(f"### Sentiment: <span style='color: {color}; font-weight: bold;'>{classification}</span>", unsafe_allow_html=True)
+        
+        # Add plain English explanation
+        compound_explanation = analyzer.explain_score('compound', sentiment['compound_score'])
+        confidence_explanation = analyzer.explain_score('confidence', sentiment['confidence'])
+        st.markdown(f"**In simple terms:** {compound_explanation}")
+        st.markdown(f"**AI Certainty:** {confidence_explanation}")
+        
+        # Show party-specific context note if available
+        if sentiment.get('party_specific') and sentiment.get('context_note'):
+            st.info(f"🎯 **Party Context:** {sentiment['context_note']}")
+            if sentiment.get('context_adjustment') and abs(sentiment['context_adjustment']) > 0.05:
+                adjustment_direction = "more positive" if sentiment['context_adjustment'] > 0 else "more negative"
+                st.caption(f"Adjusted {adjustment_direction} by {abs(sentiment['context_adjustment']):.2f} based on impact to {party}")
+        
+        st.markdown("---")
+        # Detailed scores
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Positive", f"{sentiment['positive']*100:.1f}%")
+        with col2:
+            st.metric("Neutral", f"{sentiment['neutral']*100:.1f}%")
+        with col3:
+            st.metric("Negative", f"{sentiment['negative']*100:.1f}%")
+        with col4:
+            st.metric("Confidence", f"{sentiment['confidence']:.1f}%")
+        
+        # Advanced metrics (displayed directly, not nested)
+        st.markdown("**Advanced Metrics:**")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Compound Score:** {sentiment['compound_score']:.4f}")
+            st.write(f"**VADER Score:** {sentiment['vader_compound']:.4f}")
+        with col2:
+            st.write(f"**TextBlob Score:** {sentiment['textblob_polarity']:.4f}")
+            subjectivity_explanation = analyzer.explain_score('subjectivity', sentiment['subjectivity'])
+            st.write(f"**Subjectivity:** {sentiment['subjectivity']:.2f}")
+            st.caption(f"💬 {subjectivity_explanation}")
+        
+        # Article description
+        st.markdown("---")
+        st.write(f"**Description:** {article.get('description', 'No description available')}")
+        
+        # Link to full article
+        if article.get('url'):
+            st.markdown(f"[🔗 Read Full Article]({article['url']})")
+
+def render_pdf_export_status():
+    """
+    Show this session's PDF export: progress while it renders, then the download
+    
+    While the job is running the page reruns every PDF_POLL_INTERVAL seconds.
+    """
+    job_id = st.session_state.get('pdf_job_id')
+    if not job_id:
+        return
+    
+    from pdf_jobs import get_pdf_job_queue
+    job = get_pdf_job_queue().get(job_id)
+    if job is None:
+        st.session_state.pdf_job_id = None
+        st.info("ℹ️ The generated report has expired. Please export it again.")
+        return
+    
+    if job.status == 'failed':
+        st.session_state.pdf_job_id = None
+        st.error(f"❌ Error generating PDF: {job.error}")
+        if 'reportlab' in job.error:
+            st.info("💡 Install it using: `pip install reportlab`")
+        return
+    
+    if job.status == 'done':
+        from pdf_cache import stamp_report, REPORT_TIME_FORMAT
+        
+        # The report may be shared from the cache; put this user and time on it
+        report = stamp_report(job.result, username=st.session_state.username,
+                              generated=datetime.now().strftime(REPORT_TIME_FORMAT))
+        timestamp = datetime.fromtimestamp(job.created_at).strftime("%Y%m%d_%H%M%S")
+        st.download_button(
+            label="⬇️ Download PDF Report",
+            data=report,
+            file_name=f"sentiment_analysis_{timestamp}.pdf",
+            mime="application/pdf",
+            use_container_width=True
+        )
+        st.success("✅ PDF report generated successfully!")
+        return
+    
+    st.progress(job.progress, text=f"📄 Generating PDF report: {job.message}...")
+    time.sleep(PDF_POLL_INTERVAL)
+    st.rerun()
+
 def sentiment_analysis_page():
     """Sentiment Analysis Results Page"""
     # Add anchor at top and auto-scroll script
@@ -451,7 +822,7 @@ def sentiment_analysis_page():
     # Display logo in header - compact layout
     col1, col2 = st.columns([1, 4])
     with col1:
-        st.image("assets/svgviewer-png-output.png", width=80)
+        st.image(load_logo_bytes(), width=80)
     with col2:
         st.markdown(
             f"<h1 style='color: {MAIN_BLUE}; margin-top: 10px;'>Sentiment Analysis Results</h1>",
@@ -461,7 +832,7 @@ def sentiment_analysis_page():
     # Sidebar with user info and logout
     with st.sidebar:
         # Logo in sidebar - smaller
-        st.image("assets/svgviewer-png-output.png", width=120)
+        st.image(load_logo_bytes(), width=120)
         st.markdown("---")
         st.write(f"👤 Logged in as: **{st.session_state.username}**")
         if st.button("← Back to News", use_container_width=True):
@@ -485,207 +856,77 @@ def sentiment_analysis_page():
     
     # Check if we have articles to analyze
     if st.session_state.articles:
-        st.subheader(f"Analyzing {len(st.session_state.articles)} Articles")
+        articles = st.session_state.articles
+        party = st.session_state.selected_party
+        st.subheader(f"Analyzing {len(articles)} Articles")
         
         # Perform real sentiment analysis WITH PARTY-SPECIFIC CONTEXT
-        from sentiment_analyzer import get_analyzer
-        
-        with st.spinner(f"Performing AI-powered sentiment analysis for {st.session_state.selected_party}..."):
-            analyzer = get_analyzer()
-            # Pass the selected party for party-specific analysis
-            analysis_results = analyzer.analyze_articles_batch(
-                st.session_state.articles, 
-                target_party=st.session_state.selected_party
-            )
-        
-        # Display sentiment analysis results
-        st.success(f"✅ Sentiment Analysis Complete! Results show impact on **{st.session_state.selected_party}**")
-        
-        # Get overall statistics
-        stats = analysis_results['overall_statistics']
-        
-        # Overall sentiment summary with color-coded metrics
-        st.markdown("---")
-        st.subheader(f"Overall Sentiment Summary for {st.session_state.selected_party}")
-        
-        # Display overall sentiment with emoji and color
-        overall_sentiment = stats['overall_sentiment']
-        sentiment_emoji = analyzer.get_sentiment_emoji(overall_sentiment)
-        sentiment_color = analyzer.get_sentiment_color(overall_sentiment)
-        
-        st.markdown(f"### {sentiment_emoji} Overall Sentiment: <span style='color: {sentiment_color};'>{overall_sentiment}</span>", unsafe_allow_html=True)
+        from sentiment_analyzer import get_analyzer, SentimentStats
         
-        # Add human-readable narrative summary
-        narrative_summary = analyzer.get_human_readable_summary(analysis_results)
-        st.info(f"📝 **What does this mean for {st.session_state.selected_party}?**\n\n{narrative_summary}")
+        analyzer = get_analyzer()
+        status_area = st.empty()
+        summary_area = st.empty()
+        charts_area = st.empty()
         
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric(
-                label="😊 Positive", 
-                value=f"{stats['positive_percentage']}%",
-                delta=f"{stats['positive_count']} articles"
-            )
-        with col2:
-            st.metric(
-                label="😐 Neutral", 
-                value=f"{stats['neutral_percentage']}%",
-                delta=f"{stats['neutral_count']} articles"
-            )
-        with col3:
-            st.metric(
-                label="😢 Negative", 
-                value=f"{stats['negative_percentage']}%",
-                delta=f"{stats['negative_count']} articles"
-            )
-        
-        # Analysis quality metrics
-        st.markdown("---")
-        col1, col2 = st.columns(2)
-        with col1:
-            confidence_explanation = analyzer.explain_score('confidence', stats['average_confidence'])
-            st.metric(
-                label="🎯 Average Confidence",
-                value=f"{stats['average_confidence']}%",
-                help=confidence_explanation
-            )
-            st.caption(f"💬 {confidence_explanation}")
-        with col2:
-            compound_explanation = analyzer.explain_score('compound', stats['average_compound_score'])
-            st.metric(
-                label="Compound Score",
-                value=f"{stats['average_compound_score']:.4f}",
-                help=compound_explanation
-            )
-            st.caption(f"💬 {compound_explanation}")
-        
-        # Clean, minimal visualizations
+        # Individual article sentiments with detailed breakdown
         st.markdown("---")
-        st.subheader("Sentiment Distribution")
-        
-        import plotly.graph_objects as go
-        import plotly.express as px
-        
-        # Create two columns for compact chart layout
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            # Pie chart - Sentiment distribution
-            fig_pie = go.Figure(data=[go.Pie(
-                labels=['Positive', 'Neutral', 'Negative'],
-                values=[stats['positive_count'], stats['neutral_count'], stats['negative_count']],
-                marker=dict(colors=SENTIMENT_COLORS),
-                hole=0.4,  # Donut chart for modern look
-                textinfo='label+percent',
-                textfont=dict(size=12),
-                hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-            )])
-            
-            fig_pie.update_layout(
-                showlegend=False,
-                margin=dict(t=30, b=0, l=0, r=0),
-                height=300,
-                title=dict(text="Sentiment Split", font=dict(size=14, color=MAIN_BLUE), x=0.5, xanchor='center')
-            )
-            
-            st.plotly_chart(fig_pie, use_container_width=True)
+        st.subheader("Individual Article Sentiments")
+        controls = article_list_controls("sentiment_list")
+        articles_area = st.empty()
         
-        with col2:
-            # Bar chart - Sentiment counts
-            fig_bar = go.Figure(data=[
-                go.Bar(
-                    x=['Positive', 'Neutral', 'Negative'],
-                    y=[stats['positive_count'], stats['neutral_count'], stats['negative_count']],
-                    marker=dict(color=SENTIMENT_COLORS),
-                    text=[stats['positive_count'], stats['neutral_count'], stats['negative_count']],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Articles: %{y}<br>Percentage: %{customdata}%<extra></extra>',
-                    customdata=[stats['positive_percentage'], stats['neutral_percentage'], stats['negative_percentage']]
-                )
-            ])
-            
-            fig_bar.update_layout(
-                yaxis_title="Article Count",
-                margin=dict(t=30, b=40, l=40, r=0),
-                height=300,
-                showlegend=False,
-                title=dict(text="Article Count by Sentiment", font=dict(size=14, color=MAIN_BLUE), x=0.5, xanchor='center')
-            )
+        # Reruns (expanding an article, exporting...) reuse the cached scores;
+        # only a new article list or party triggers a fresh analysis
+        analysis_results = lookup_analysis(articles, party)
+        if analysis_results is None:
+            # Score articles one by one, showing the first page of expanders
+            # as soon as each is ready and refreshing the summary a couple of
+            # times per second
+            individual_results = []
+            running_stats = SentimentStats()
+            last_refresh = 0
+            stream_area = articles_area.container()
+            for idx, (article, sentiment) in enumerate(analyzer.analyze_articles_stream(articles, target_party=party), 1):
+                individual_results.append(sentiment)
+                running_stats.add(sentiment)
+                if idx <= controls['page_size']:
+                    with stream_area:
+                        render_article_sentiment(analyzer, idx, article, sentiment, party)
+                
+                if time.time() - last_refresh > 0.5 and idx < len(articles):
+                    status_area.info(f"⏳ Performing AI-powered sentiment analysis for {party}... {idx}/{len(articles)} articles scored")
+                    partial_stats = running_stats.to_dict()
+                    with summary_area.container():
+                        render_sentiment_summary(analyzer, partial_stats, party)
+                    with charts_area.container():
+                        render_sentiment_charts(partial_stats, key_suffix=idx)
+                    last_refresh = time.time()
             
-            st.plotly_chart(fig_bar, use_container_width=True)
+            analysis_results = {
+                'individual_results': individual_results,
+                'overall_statistics': running_stats.to_dict()
+            }
+            remember_analysis(articles, party, analysis_results)
         
-        # Individual article sentiments with detailed breakdown
-        st.markdown("---")
-        st.subheader("Individual Article Sentiments")
+        # Only the selected page of (filtered, sorted) articles is rendered
+        entries = list(zip(range(1, len(articles) + 1), articles, analysis_results['individual_results']))
+        entries = filter_and_sort_articles(entries, controls)
+        with articles_area.container():
+            start, end = page_slice("sentiment_list", len(entries), controls['page_size'], controls)
+            for idx, article, sentiment in entries[start:end]:
+                render_article_sentiment(analyzer, idx, article, sentiment, party)
+            if not entries:
+                st.info("No articles match the selected filters.")
         
+        # Get overall statistics
+        stats = analysis_results['overall_statistics']
         individual_results = analysis_results['individual_results']
         
-        for idx, (article, sentiment) in enumerate(zip(st.session_state.articles, individual_results), 1):
-            classification = sentiment['classification']
-            emoji = analyzer.get_sentiment_emoji(classification)
-            color = analyzer.get_sentiment_color(classification)
-            
-            # Create colored header for expander
-            expander_title = f"{emoji} {idx}. {article.get('title', 'No Title')}"
-            
-            with st.expander(expander_title):
-                # Article metadata
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Source:** {article.get('source', {}).get('name', 'Unknown')}")
-                    st.write(f"**Published:** {article.get('publishedAt', 'Unknown')[:10]}")
-                with col2:
-                    st.write(f"**Author:** {article.get('author', 'Unknown')}")
-                
-                st.markdown("---")
-                
-                # Sentiment breakdown with color
-                st.markdown(f"### Sentiment: <span style='color: {color}; font-weight: bold;'>{classification}</span>", unsafe_allow_html=True)
-                
-                # Add plain English explanation
-                compound_explanation = analyzer.explain_score('compound', sentiment['compound_score'])
-                confidence_explanation = analyzer.explain_score('confidence', sentiment['confidence'])
-                st.markdown(f"**In simple terms:** {compound_explanation}")
-                st.markdown(f"**AI Certainty:** {confidence_explanation}")
-                
-                # Show party-specific context note if available
-                if sentiment.get('party_specific') and sentiment.get('context_note'):
-                    st.info(f"🎯 **Party Context:** {sentiment['context_note']}")
-                    if sentiment.get('context_adjustment') and abs(sentiment['context_adjustment']) > 0.05:
-                        adjustment_direction = "more positive" if sentiment['context_adjustment'] > 0 else "more negative"
-                        st.caption(f"Adjusted {adjustment_direction} by {abs(sentiment['context_adjustment']):.2f} based on impact to {st.session_state.selected_party}")
-                
-                st.markdown("---")
-                # Detailed scores
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Positive", f"{sentiment['positive']*100:.1f}%")
-                with col2:
-                    st.metric("Neutral", f"{sentiment['neutral']*100:.1f}%")
-                with col3:
-                    st.metric("Negative", f"{sentiment['negative']*100:.1f}%")
-                with col4:
-                    st.metric("Confidence", f"{sentiment['confidence']:.1f}%")
-                
-                # Advanced metrics (displayed directly, not nested)
-                st.markdown("**Advanced Metrics:**")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.write(f"**Compound Score:** {sentiment['compound_score']:.4f}")
-                    st.write(f"**VADER Score:** {sentiment['vader_compound']:.4f}")
-                with col2:
-                    st.write(f"**TextBlob Score:** {sentiment['textblob_polarity']:.4f}")
-                    subjectivity_explanation = analyzer.explain_score('subjectivity', sentiment['subjectivity'])
-                    st.write(f"**Subjectivity:** {sentiment['subjectivity']:.2f}")
-                    st.caption(f"💬 {subjectivity_explanation}")
-                
-                # Article description
-                st.markdown("---")
-                st.write(f"**Description:** {article.get('description', 'No description available')}")
-                
-                # Link to full article
-                if article.get('url'):
-                    st.markdown(f"[🔗 Read Full Article]({article['url']})")
+        # Display sentiment analysis results
+        status_area.success(f"✅ Sentiment Analysis Complete! Results show impact on **{party}**")
+        with summary_area.container():
+            render_sentiment_summary(analyzer, stats, party)
+        with charts_area.container():
+            render_sentiment_charts(stats)
         
         # AI-Generated Key Insights
         st.markdown("---")
@@ -755,61 +996,34 @@ def sentiment_analysis_page():
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
             if st.button("📄 Export as PDF", use_container_width=True, type="primary"):
+                from pdf_jobs import get_pdf_job_queue, ExportError
+                
+                # Prepare data for PDF with real sentiment analysis results
+                pdf_data = {
+                    'party': st.session_state.selected_party,
+                    'state': st.session_state.selected_state,
+                    'articles_count': stats['total_articles'],
+                    'positive_pct': stats['positive_percentage'],
+                    'neutral_pct': stats['neutral_percentage'],
+                    'negative_pct': stats['negative_percentage'],
+                    'positive_count': stats['positive_count'],
+                    'neutral_count': stats['neutral_count'],
+                    'negative_count': stats['negative_count'],
+                    'insights': insights,
+                    'articles': st.session_state.articles,
+                    'individual_sentiments': individual_results,
+                    'average_confidence': stats['average_confidence'],
+                    'overall_sentiment': stats['overall_sentiment']
+                }
+                
+                # Render in a background worker so this page stays responsive
                 try:
-                    # Import PDF generator
-                    from pdf_generator import generate_sentiment_pdf
-                    
-                    # Prepare data for PDF with real sentiment analysis results
-                    pdf_data = {
-                        'party': st.session_state.selected_party,
-                        'state': st.session_state.selected_state,
-                        'username': st.session_state.username,
-                        'articles_count': stats['total_articles'],
-                        'positive_pct': stats['positive_percentage'],
-                        'neutral_pct': stats['neutral_percentage'],
-                        'negative_pct': stats['negative_percentage'],
-                        'positive_count': stats['positive_count'],
-                        'neutral_count': stats['neutral_count'],
-                        'negative_count': stats['negative_count'],
-                        'insights': insights,
-                        'articles': st.session_state.articles,
-                        'individual_sentiments': individual_results,
-                        'average_confidence': stats['average_confidence'],
-                        'overall_sentiment': stats['overall_sentiment']
-                    }
-                    
-                    # Generate PDF filename
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    filename = f"sentiment_analysis_{timestamp}.pdf"
-                    
-                    # Generate PDF
-                    with st.spinner("Generating comprehensive PDF report with AI analysis..."):
-                        generate_sentiment_pdf(filename, pdf_data)
-                    
-                    # Provide download button
-                    with open(filename, "rb") as pdf_file:
-                        pdf_bytes = pdf_file.read()
-                        st.download_button(
-                            label="⬇️ Download PDF Report",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf",
-                            use_container_width=True
-                        )
-                    
-                    st.success("✅ PDF report generated successfully!")
-                    
-                    # Clean up file after download
-                    try:
-                        os.remove(filename)
-                    except:
-                        pass
-                        
-                except ImportError:
-                    st.error("❌ ReportLab library is required for PDF generation.")
-                    st.info("💡 Install it using: `pip install reportlab`")
-                except Exception as e:
-                    st.error(f"❌ Error generating PDF: {str(e)}")
+                    job = get_pdf_job_queue().submit(pdf_data, owner=st.session_state.username)
+                    st.session_state.pdf_job_id = job.id
+                except ExportError as e:
+                    st.warning(f"⏳ {e}")
+            
+            render_pdf_export_status()
         
     else:
         st.warning("⚠️ No articles available for analysis. Please fetch news first.")
@@ -817,12 +1031,208 @@ def sentiment_analysis_page():
             st.session_state.current_page = 'news'
             st.rerun()
 
+def search_page():
+    """Full-text search over the articles stored by past analyses"""
+    from database import search_stored_articles, count_stored_articles
+    
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        st.image(load_logo_bytes(), width=80)
+    with col2:
+        st.markdown(
+            f"<h1 style='color: {MAIN_BLUE}; margin-top: 10px;'>Search Stored Articles</h1>",
+            unsafe_allow_html=True
+        )
+    
+    with st.sidebar:
+        st.image(load_logo_bytes(), width=120)
+        st.markdown("---")
+        st.write(f"👤 Logged in as: **{st.session_state.username}**")
+        if st.button("← Back to News", use_container_width=True):
+            st.session_state.current_page = 'news'
+            st.rerun()
+        if st.button("Logout", use_container_width=True):
+            logout()
+            st.rerun()
+    
+    st.markdown("---")
+    query = st.text_input(
+        "Search titles, descriptions and content",
+        key="search_query",
+        placeholder='e.g. "farm laws" protest',
+        help='All words must appear; put exact phrases in "quotes"'
+    )
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        party = st.selectbox("Party", ("Any party",) + INDIAN_PARTIES, key="search_party")
+    with col2:
+        state = st.selectbox("State/UT", ("Any state",) + INDIAN_STATES, key="search_state")
+    with col3:
+        classification = st.selectbox("Sentiment", ["Any sentiment"] + SENTIMENT_CLASSES, key="search_class")
+    
+    filters = {
+        'party': None if party == "Any party" else party,
+        'state': None if state == "Any state" else state,
+        'classification': None if classification == "Any sentiment" else classification
+    }
+    if st.checkbox("Limit by publication date", key="search_dates"):
+        col1, col2 = st.columns(2)
+        with col1:
+            start = st.date_input("Published on or after", key="search_start")
+        with col2:
+            end = st.date_input("Published on or before", key="search_end")
+        filters['published_after'] = start.isoformat()
+        filters['published_before'] = (end + timedelta(days=1)).isoformat()
+    
+    if not query.strip():
+        st.info("💡 Articles from every analysis you and other users have run are searchable here.")
+        return
+    
+    total = count_stored_articles(query, **filters)
+    if total == 0:
+        st.warning("No stored articles match this search.")
+        return
+    st.success(f"Found {total} matching articles")
+    
+    page_size_options = sorted({10, 25, 50, ARTICLES_PAGE_SIZE})
+    page_size = st.selectbox("Results per page", page_size_options,
+                             index=page_size_options.index(ARTICLES_PAGE_SIZE), key="search_page_size")
+    start, end = page_slice("search_results", total, page_size, (query, filters, page_size))
+    
+    # Only the current page is read from the database
+    for idx, result in enumerate(search_stored_articles(query, limit=end - start, offset=start, **filters), start + 1):
+        article = result['article']
+        classification = result['classification']
+        st.markdown(f"### {SENTIMENT_EMOJI.get(classification, '😐')} {idx}. {article.get('title') or 'No Title'}")
+        st.markdown(result['snippet'])
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.caption(f"Source: {(article.get('source') or {}).get('name') or 'Unknown'}")
+            st.caption(f"Published: {(article.get('publishedAt') or 'Unknown')[:10]}")
+        with col2:
+            st.caption(f"Party: {result['party']}")
+            st.caption(f"State: {result['state']}")
+        with col3:
+            st.caption(f"Sentiment: {classification} ({result['compound_score']:+.2f})")
+            st.caption(f"Confidence: {result['confidence']:.1f}%")
+        if article.get('url'):
+            st.markdown(f"[🔗 Read Full Article]({article['url']})")
+        st.markdown("---")
+
+def render_history_detail(analysis):
+    """Articles and scores of one stored analysis"""
+    from sentiment_analyzer import SentimentStats
+    
+    st.markdown(
+        f"**{analysis['articles_count']} articles** · "
+        f"😊 {analysis['positive_pct']:.1f}% · 😐 {analysis['neutral_pct']:.1f}% · "
+        f"😢 {analysis['negative_pct']:.1f}% · confidence {analysis['average_confidence']:.1f}%"
+    )
+    if st.button("Open in results page", key=f"history_results_{analysis['id']}"):
+        # The stored scores are reused, so the results page does not rescore
+        st.session_state.articles = analysis['articles']
+        st.session_state.selected_party = analysis['party']
+        st.session_state.selected_state = analysis['state']
+        st.session_state.pdf_job_id = None
+        stats = SentimentStats()
+        for sentiment in analysis['individual_results']:
+            stats.add(sentiment)
+        remember_analysis(analysis['articles'], analysis['party'], {
+            'individual_results': analysis['individual_results'],
+            'overall_statistics': stats.to_dict()
+        })
+        st.session_state.current_page = 'sentiment'
+        st.rerun()
+    
+    entries = list(zip(analysis['articles'], analysis['individual_results']))
+    start, end = page_slice(f"history_detail_{analysis['id']}", len(entries), ARTICLES_PAGE_SIZE)
+    for idx, (article, sentiment) in enumerate(entries[start:end], start + 1):
+        classification = sentiment.get('classification')
+        title = article.get('title') or 'No Title'
+        link = f"[{title}]({article['url']})" if article.get('url') else title
+        st.markdown(
+            f"{SENTIMENT_EMOJI.get(classification, '😐')} {idx}. {link} "
+            f"({classification}, {sentiment.get('compound_score', 0):+.2f})"
+        )
+
+def analysis_history_page():
+    """The user's past analyses, newest first, one page at a time"""
+    from database import get_history_page, get_analysis_by_id
+    
+    col1, col2 = st.columns([1, 4])
+    with col1:
+        st.image(load_logo_bytes(), width=80)
+    with col2:
+        st.markdown(
+            f"<h1 style='color: {MAIN_BLUE}; margin-top: 10px;'>My Analysis History</h1>",
+            unsafe_allow_html=True
+        )
+    
+    with st.sidebar:
+        st.image(load_logo_bytes(), width=120)
+        st.markdown("---")
+        st.write(f"👤 Logged in as: **{st.session_state.username}**")
+        if st.button("← Back to News", use_container_width=True):
+            st.session_state.current_page = 'news'
+            st.rerun()
+        if st.button("Logout", use_container_width=True):
+            logout()
+            st.rerun()
+    
+    st.markdown("---")
+    # Cursors of the pages visited so far; the last one is shown
+    cursors = st.session_state.setdefault('history_cursors', [None])
+    analyses, next_cursor = get_history_page(st.session_state.username, ARTICLES_PAGE_SIZE, cursors[-1])
+    if not analyses:
+        st.info("💡 No analyses yet. Every search you run on the news page is saved here.")
+        return
+    
+    open_id = st.session_state.get('history_open_id')
+    for analysis in analyses:
+        emoji = SENTIMENT_EMOJI.get(analysis['overall_sentiment'], '😐')
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.markdown(f"**{emoji} {analysis['party']}** — {analysis['state']}")
+            st.caption(
+                f"{analysis['search_date']} · {analysis['articles_count']} articles · "
+                f"{analysis['overall_sentiment']} overall"
+            )
+        with col2:
+            is_open = analysis['id'] == open_id
+            if st.button("Hide" if is_open else "Details", key=f"history_toggle_{analysis['id']}",
+                         use_container_width=True):
+                st.session_state.history_open_id = None if is_open else analysis['id']
+                st.rerun()
+        # Article-level detail is only read for the opened row
+        if analysis['id'] == open_id:
+            detail = get_analysis_by_id(open_id)
+            if detail is not None:
+                with st.container():
+                    render_history_detail(detail)
+        st.markdown("---")
+    
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("← Newer", disabled=len(cursors) == 1, use_container_width=True, key="history_newer"):
+            cursors.pop()
+            st.rerun()
+    with col_next:
+        if st.button("Older →", disabled=next_cursor is None, use_container_width=True, key="history_older"):
+            cursors.append(next_cursor)
+            st.rerun()
+    with col_info:
+        st.caption(f"Page {len(cursors)}")
+
 def main_app():
     """Main app router"""
     if st.session_state.current_page == 'news':
         news_page()
     elif st.session_state.current_page == 'sentiment':
         sentiment_analysis_page()
+    elif st.session_state.current_page == 'search':
+        search_page()
+    elif st.session_state.current_page == 'history':
+        analysis_history_page()
 
 
 # Main app logic
@@ -830,3 +1240,6 @@ if st.session_state.logged_in:
     main_app()
 else:
     login_page()
+
+if SHOW_RENDER_TIMINGS:
+    st.sidebar.caption(f"⏱️ Rendered in {(time.perf_counter() - _rerun_started) * 1000:.1f} ms")
@@ -0,0 +1,261 @@
+"""
+Bulk Report Generation
+Renders sentiment reports for many party/state analyses at once: one PDF
+per combination on parallel worker processes, or a single combined PDF
+with an outline entry per party and state
+
+Usage:
+    python bulk_reports.py --out reports/weekly
+    python bulk_reports.py --combined --out reports/weekly.pdf \\
+        --pairs "Bharatiya Janata Party (BJP)|All States;Aam Aadmi Party (AAP)|Punjab"
+
+Analyses are read from the background ingester's store, so the pairs
+default to INGEST_WATCH_LIST. In one-file-per-pair mode a pair with more
+than LARGE_REPORT_THRESHOLD stored articles gets a large report detailing
+every article, streamed from the store in constant memory.
+"""
+
+import argparse
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import (
+    BULK_REPORT_WORKERS, DATABASE_PATH, INGEST_WATCH_LIST, LARGE_REPORT_THRESHOLD, _parse_watch_list
+)
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "_", (text or "").lower()).strip("_") or "report"
+
+
+def report_file_names(analyses):
+    """
+    File names for a list of analyses, e.g. sentiment_bjp_punjab.pdf
+
+    A repeated party/state combination gets a numeric suffix.
+    """
+    names = []
+    seen = {}
+    for data in analyses:
+        stem = f"sentiment_{_slug(data.get('party'))}_{_slug(data.get('state'))}"
+        seen[stem] = seen.get(stem, 0) + 1
+        names.append(f"{stem}.pdf" if seen[stem] == 1 else f"{stem}_{seen[stem]}.pdf")
+    return names
+
+
+def _warm_worker():
+    """Load the shared styles, logo and chart modules once per worker process"""
+    from pdf_generator import get_report_styles, load_report_logo, build_chart_flowables
+
+    get_report_styles()
+    load_report_logo()
+    build_chart_flowables({})
+
+
+def _render_file(data, path):
+    from pdf_generator import generate_sentiment_pdf, generate_large_sentiment_pdf
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if data.get('large_report'):
+        from news_ingester import iter_ingested_articles
+
+        scored_articles = iter_ingested_articles(data['party'], data['state'], data['db_path'])
+        generate_large_sentiment_pdf(tmp_path, data, scored_articles)
+    else:
+        generate_sentiment_pdf(tmp_path, data)
+    os.replace(tmp_path, path)
+    return path
+
+
+def generate_report_files(analyses, output_dir, max_workers=BULK_REPORT_WORKERS, progress=None):
+    """
+    Render one PDF per analysis
+
+    Each worker process builds the styles, the downscaled logo and the chart
+    modules once and reuses them for every report it renders.
+
+    Args:
+        analyses (list): Report data dicts as taken by generate_sentiment_pdf,
+            or large-report entries from load_ingested_analyses
+        output_dir (str): Directory for the PDF files (created if missing)
+        max_workers (int): Worker processes (at most one per CPU); 1 renders
+            in this process
+        progress: Optional callback(done, total, path)
+
+    Returns:
+        list: Paths of the written files, in the order of analyses
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = [os.path.join(output_dir, name) for name in report_file_names(analyses)]
+    total = len(paths)
+    max_workers = min(max_workers, total, os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        for done, (data, path) in enumerate(zip(analyses, paths), 1):
+            _render_file(data, path)
+            if progress:
+                progress(done, total, path)
+        return paths
+
+    # spawn: do not fork a process that may be running Streamlit's threads
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                             initializer=_warm_worker) as executor:
+        futures = [executor.submit(_render_file, data, path) for data, path in zip(analyses, paths)]
+        for done, future in enumerate(as_completed(futures), 1):
+            path = future.result()
+            if progress:
+                progress(done, total, path)
+    return paths
+
+
+def generate_combined_report(analyses, path, progress=None):
+    """
+    Render all analyses into one PDF with a party > state outline
+
+    Reports of the same party are grouped together (keeping the order in
+    which parties first appear). Each report's story is only built when the
+    previous one has been laid out, so memory does not grow with the number
+    of reports. One document cannot be split across processes, so this mode
+    renders in the calling process.
+
+    Args:
+        analyses (list): Report data dicts as taken by generate_sentiment_pdf
+        path (str): Output PDF file name or writable binary file object
+        progress: Optional callback(done, total, path)
+
+    Returns:
+        str: path
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, PageBreak
+    from pdf_generator import get_report_styles, build_report_story, LazyStory, OutlineEntry
+
+    party_order = {}
+    for data in analyses:
+        party_order.setdefault(data.get('party'), len(party_order))
+    ordered = sorted(analyses, key=lambda data: party_order[data.get('party')])
+    styles = get_report_styles()
+    total = len(ordered)
+
+    def story():
+        current_party = object()
+        for index, data in enumerate(ordered):
+            if index:
+                yield PageBreak()
+            if data.get('party') != current_party:
+                current_party = data.get('party')
+                yield OutlineEntry(current_party or 'Unknown party', f"party-{index}", level=0)
+            yield OutlineEntry(data.get('state') or 'All States', f"report-{index}", level=1)
+            yield from build_report_story(data, styles)
+            if progress:
+                progress(index + 1, total, path)
+
+    doc = SimpleDocTemplate(path, pagesize=letter,
+                            rightMargin=72, leftMargin=72,
+                            topMargin=72, bottomMargin=18)
+    doc.build(LazyStory(story()), onFirstPage=lambda canv, doc: canv.showOutline())
+    return path
+
+
+def build_report_data(party, state, articles, analysis_results, username, analyzer):
+    """
+    Build the report data dict for one analysis (same shape as the app's export)
+
+    Args:
+        party (str): Political party
+        state (str): State/UT name
+        articles (list): Article dictionaries, newest first
+        analysis_results (dict): Result in the analyze_articles_batch format
+        username (str): Name printed as "Analyzed By"
+        analyzer (SentimentAnalyzer): Used to phrase the insights
+
+    Returns:
+        dict: Data for generate_sentiment_pdf
+    """
+    from pdf_generator import REPORT_ARTICLE_LIMIT
+
+    stats = analysis_results['overall_statistics']
+    return {
+        'party': party,
+        'state': state,
+        'username': username,
+        'articles_count': stats['total_articles'],
+        'positive_pct': stats['positive_percentage'],
+        'neutral_pct': stats['neutral_percentage'],
+        'negative_pct': stats['negative_percentage'],
+        'positive_count': stats['positive_count'],
+        'neutral_count': stats['neutral_count'],
+        'negative_count': stats['negative_count'],
+        'insights': analyzer.get_sentiment_insights(analysis_results),
+        # Only the detailed articles are needed; keeps worker payloads small
+        'articles': articles[:REPORT_ARTICLE_LIMIT],
+        'individual_sentiments': analysis_results['individual_results'][:REPORT_ARTICLE_LIMIT],
+        'average_confidence': stats['average_confidence'],
+        'overall_sentiment': stats['overall_sentiment']
+    }
+
+
+def load_ingested_analyses(pairs, username, large_threshold=None, db_path=DATABASE_PATH):
+    """
+    Build report data for each (party, state) from the ingester's store
+
+    Pairs with nothing stored yet are skipped. A pair with more than
+    large_threshold stored articles is not loaded; its entry only names the
+    pair and the store, and generate_report_files renders it as a large
+    report streamed from there.
+
+    Returns:
+        list: Report data dicts
+    """
+    from news_ingester import get_ingested_articles, count_ingested_articles
+    from sentiment_analyzer import get_analyzer
+
+    analyzer = get_analyzer()
+    analyses = []
+    for party, state in pairs:
+        if large_threshold is not None and count_ingested_articles(party, state, db_path) > large_threshold:
+            analyses.append({'party': party, 'state': state, 'username': username,
+                             'large_report': True, 'db_path': db_path})
+            continue
+        articles, analysis_results = get_ingested_articles(party, state, db_path=db_path)
+        if articles is None:
+            print(f"No stored articles for {party} / {state}, skipping")
+            continue
+        analyses.append(build_report_data(party, state, articles, analysis_results, username, analyzer))
+    return analyses
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate sentiment reports for many party/state pairs")
+    parser.add_argument('--out', required=True,
+                        help='Output directory, or PDF file name with --combined')
+    parser.add_argument('--combined', action='store_true',
+                        help='Write one PDF with an outline instead of one file per pair')
+    parser.add_argument('--pairs', default=None,
+                        help='"party|state" pairs separated by ";" (default: INGEST_WATCH_LIST)')
+    parser.add_argument('--username', default='bulk-report', help='Name printed as "Analyzed By"')
+    parser.add_argument('--workers', type=int, default=BULK_REPORT_WORKERS, help='Worker processes')
+    args = parser.parse_args()
+
+    pairs = _parse_watch_list(args.pairs) if args.pairs is not None else INGEST_WATCH_LIST
+    # One combined document is laid out in this process from loaded analyses
+    large_threshold = None if args.combined else LARGE_REPORT_THRESHOLD
+    analyses = load_ingested_analyses(pairs, args.username, large_threshold)
+    if not analyses:
+        print("Nothing to report")
+        return
+
+    def progress(done, total, path):
+        print(f"[{done}/{total}] {path}")
+
+    if args.combined:
+        generate_combined_report(analyses, args.out, progress)
+    else:
+        generate_report_files(analyses, args.out, args.workers, progress)
+
+
+if __name__ == '__main__':
+    main()
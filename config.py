@@ -2,13 +2,136 @@
 # Get your free API key from https://newsapi.org
 
 import os
+import sys
 
-# Try to get API key from Streamlit secrets (for cloud deployment)
-# Otherwise use the hardcoded value (for local development)
-try:
-    # Only import streamlit if needed
-    import streamlit as st
-    NEWS_API_KEY = st.secrets["NEWS_API_KEY"]
-except (ImportError, FileNotFoundError, KeyError):
-    # Fallback to environment variable or empty string
-    NEWS_API_KEY = os.getenv("NEWS_API_KEY", "your_api_key_here")
+# Try to get API keys from Streamlit secrets (for cloud deployment)
+# Otherwise use the environment (for local development)
+# Several keys can be configured to pool their quotas:
+#   - secrets.toml:  NEWS_API_KEYS = ["key1", "key2"]
+#   - environment:   NEWS_API_KEYS="key1,key2"
+# A single NEWS_API_KEY is still accepted as before.
+
+def _parse_keys(value):
+    """Turn a list or a comma-separated string of keys into a clean list"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [key.strip() for key in value if key and key.strip()]
+
+_secret_keys = []
+# Secrets are only read inside the Streamlit app, which has already imported
+# streamlit; worker processes and command-line tools skip the heavy import
+st = sys.modules.get("streamlit")
+if st is not None:
+    try:
+        try:
+            _secret_keys = _parse_keys(st.secrets["NEWS_API_KEYS"])
+        except (FileNotFoundError, KeyError):
+            _secret_keys = _parse_keys(st.secrets["NEWS_API_KEY"])
+    except (FileNotFoundError, KeyError):
+        pass
+
+NEWS_API_KEYS = (
+    _secret_keys
+    or _parse_keys(os.getenv("NEWS_API_KEYS"))
+    or _parse_keys(os.getenv("NEWS_API_KEY"))
+)
+
+# Fallback to placeholder so the app can tell the key is missing
+NEWS_API_KEY = NEWS_API_KEYS[0] if NEWS_API_KEYS else "your_api_key_here"
+
+# Key pool tuning
+NEWS_API_DAILY_QUOTA = int(os.getenv("NEWS_API_DAILY_QUOTA", "100"))  # Free tier: 100 requests/day per key
+NEWS_API_KEY_COOLDOWN = int(os.getenv("NEWS_API_KEY_COOLDOWN", "900"))  # Seconds a rate-limited (429) key sits out
+NEWS_API_INVALID_KEY_COOLDOWN = int(os.getenv("NEWS_API_INVALID_KEY_COOLDOWN", "86400"))  # Seconds a 401'd key sits out
+
+# News API endpoint - point this at newsapi_standin.py for offline load tests,
+# e.g. NEWS_API_BASE_URL="http://127.0.0.1:8765"
+NEWS_API_BASE_URL = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org").rstrip("/")
+# When set, every live News API response is also saved here as a replay fixture
+NEWS_API_RECORD_DIR = os.getenv("NEWS_API_RECORD_DIR", "")
+
+# Paginated fetching
+NEWS_API_RESULT_LIMIT = int(os.getenv("NEWS_API_RESULT_LIMIT", "100"))  # Max results the account may page through (developer plan: 100)
+NEWS_API_PAGE_SIZE = int(os.getenv("NEWS_API_PAGE_SIZE", "100"))  # Articles per request (News API max: 100)
+NEWS_API_FETCH_WORKERS = int(os.getenv("NEWS_API_FETCH_WORKERS", "4"))  # Pages requested concurrently
+MAX_ARTICLES_LIMIT = int(os.getenv("MAX_ARTICLES_LIMIT", "500"))  # Upper bound of the "Max articles" slider
+
+# RSS/Atom feeds used alongside News API (comma-separated URLs or local paths)
+RSS_FEEDS = _parse_keys(os.getenv("RSS_FEEDS"))
+RSS_MAX_ITEMS_PER_FEED = int(os.getenv("RSS_MAX_ITEMS_PER_FEED", "200"))  # Parsing stops after this many items
+
+# Local SQLite database
+DATABASE_PATH = os.getenv("DATABASE_PATH", "political_news_app.db")
+
+# Background ingestion of watched queries
+# Format: "party|state" pairs separated by ";", e.g.
+#   INGEST_WATCH_LIST="Bharatiya Janata Party (BJP)|All States;Aam Aadmi Party (AAP)|Punjab"
+def _parse_watch_list(value):
+    """Turn "party|state;party|state" into a list of (party, state) tuples"""
+    watch_list = []
+    for entry in (value or "").split(";"):
+        if not entry.strip():
+            continue
+        party, _, state = entry.partition("|")
+        watch_list.append((party.strip(), state.strip() or "All States"))
+    return watch_list
+
+INGEST_WATCH_LIST = _parse_watch_list(os.getenv("INGEST_WATCH_LIST", ""))
+INGEST_INTERVAL = int(os.getenv("INGEST_INTERVAL", "900"))  # Seconds between polls of the watch-list
+INGEST_MAX_ARTICLES = int(os.getenv("INGEST_MAX_ARTICLES", "100"))  # Max new articles pulled per query per poll
+
+# Article lists - how many articles each page of results shows by default
+ARTICLES_PAGE_SIZE = int(os.getenv("ARTICLES_PAGE_SIZE", "10"))
+
+# Show how long each Streamlit rerun took to render (sidebar caption)
+SHOW_RENDER_TIMINGS = os.getenv("SHOW_RENDER_TIMINGS", "").lower() in ("1", "true", "yes")
+
+# Local thumbnail cache for article images
+IMAGE_CACHE_DIR = os.getenv("IMAGE_CACHE_DIR", "image_cache")
+IMAGE_CACHE_MAX_MB = int(os.getenv("IMAGE_CACHE_MAX_MB", "100"))  # Oldest thumbnails are evicted beyond this
+IMAGE_THUMBNAIL_SIZE = int(os.getenv("IMAGE_THUMBNAIL_SIZE", "320"))  # Longest side in pixels
+IMAGE_FETCH_TIMEOUT = float(os.getenv("IMAGE_FETCH_TIMEOUT", "2"))  # Seconds before the placeholder is shown
+IMAGE_FETCH_WORKERS = int(os.getenv("IMAGE_FETCH_WORKERS", "8"))  # Concurrent image downloads
+IMAGE_RETRY_AFTER = int(os.getenv("IMAGE_RETRY_AFTER", "3600"))  # Seconds before a failed image is tried again
+
+# PDF chart backend: "reportlab" draws native vector charts, "matplotlib"
+# embeds raster PNGs (also used as a fallback if vector drawing fails)
+PDF_CHART_BACKEND = os.getenv("PDF_CHART_BACKEND", "reportlab").lower()
+
+# Background PDF export jobs (rendered in separate processes)
+PDF_EXPORT_WORKERS = int(os.getenv("PDF_EXPORT_WORKERS", "2"))  # Reports rendered at the same time
+PDF_EXPORT_MAX_PENDING = int(os.getenv("PDF_EXPORT_MAX_PENDING", "8"))  # Queued + running exports before new ones are refused
+PDF_JOB_TTL = int(os.getenv("PDF_JOB_TTL", "900"))  # Seconds a finished export stays downloadable
+PDF_POLL_INTERVAL = float(os.getenv("PDF_POLL_INTERVAL", "1"))  # Seconds between progress refreshes while exporting
+
+# Rendered PDF reports are cached by a fingerprint of their data
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "pdf_cache")
+PDF_CACHE_MEMORY_MB = int(os.getenv("PDF_CACHE_MEMORY_MB", "32"))  # In-memory tier, least recently used evicted first
+PDF_CACHE_DISK_MB = int(os.getenv("PDF_CACHE_DISK_MB", "200"))  # Disk tier, least recently used evicted first
+LARGE_REPORT_TOP_SOURCES = int(os.getenv("LARGE_REPORT_TOP_SOURCES", "25"))  # Sources listed in a large report's appendix
+
+# Bulk report generation (bulk_reports.py)
+BULK_REPORT_WORKERS = int(os.getenv("BULK_REPORT_WORKERS", "4"))  # Worker processes rendering one file each
+LARGE_REPORT_THRESHOLD = int(os.getenv("LARGE_REPORT_THRESHOLD", "500"))  # Pairs with more stored articles get a large report streamed from the store
+
+# Startup import budget checked by test_import_budget.py: the app's own
+# module-level imports (streamlit itself excluded) must load within this
+STARTUP_IMPORT_BUDGET_MS = int(os.getenv("STARTUP_IMPORT_BUDGET_MS", "150"))
+
+# Login telemetry (last_login / login_count) is buffered and written in batches
+LOGIN_FLUSH_INTERVAL = float(os.getenv("LOGIN_FLUSH_INTERVAL", "30"))  # Seconds between flushes
+LOGIN_FLUSH_SIZE = int(os.getenv("LOGIN_FLUSH_SIZE", "50"))  # Pending logins that trigger an early flush
+
+# Analysis history (database.py): pooled SQLite connections, background writes
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))  # Connections shared by the app's threads
+DB_BUSY_TIMEOUT = float(os.getenv("DB_BUSY_TIMEOUT", "30"))  # Seconds a write waits for another writer
+HISTORY_WRITE_BATCH = int(os.getenv("HISTORY_WRITE_BATCH", "20"))  # Queued analyses inserted per transaction
+
+# Analysis history retention: older analyses are moved to monthly gzip
+# archives (still listed in the history) and their space is reclaimed
+HISTORY_RETENTION_DAYS = int(os.getenv("HISTORY_RETENTION_DAYS", "0"))  # Days analyses stay in the database; 0 (default) keeps them forever
+HISTORY_RETENTION_INTERVAL = int(os.getenv("HISTORY_RETENTION_INTERVAL", "21600"))  # Seconds between retention runs
+HISTORY_ARCHIVE_DIR = os.getenv("HISTORY_ARCHIVE_DIR", "history_archive")  # Folder for the monthly archive files
+HISTORY_VACUUM_PAGES = int(os.getenv("HISTORY_VACUUM_PAGES", "2000"))  # Free pages returned to the OS per retention run
@@ -0,0 +1,1282 @@
+"""
+Analysis History Database
+Saves every analysis to the app database and reads it back. Articles are
+stored once in `articles` (deduplicated by URL); each analysis is a row in
+`analysis_runs` and its per-article scores are rows in `run_articles`.
+Connections come from a small pool shared by Streamlit's threads; saving is
+handed to a background writer so it never slows a page
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import queue
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from config import (
+    DATABASE_PATH, DB_POOL_SIZE, DB_BUSY_TIMEOUT, HISTORY_WRITE_BATCH,
+    HISTORY_RETENTION_DAYS, HISTORY_RETENTION_INTERVAL, HISTORY_VACUUM_PAGES
+)
+from history_archive import HistoryArchive
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_history (
+    id INTEGER NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    party VARCHAR(100),
+    state VARCHAR(100),
+    articles_count INTEGER,
+    positive_pct FLOAT,
+    neutral_pct FLOAT,
+    negative_pct FLOAT,
+    overall_sentiment VARCHAR(20),
+    average_confidence FLOAT,
+    search_date DATETIME,
+    articles_data JSON,
+    PRIMARY KEY (id)
+);
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    article_key TEXT NOT NULL UNIQUE,
+    url TEXT,
+    source_id VARCHAR(100),
+    source_name VARCHAR(200),
+    author TEXT,
+    title TEXT,
+    description TEXT,
+    url_to_image TEXT,
+    published_at VARCHAR(30),
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_articles_published_at ON articles (published_at);
+CREATE TABLE IF NOT EXISTS analysis_runs (
+    id INTEGER PRIMARY KEY,
+    username VARCHAR(50) NOT NULL,
+    party VARCHAR(100),
+    state VARCHAR(100),
+    articles_count INTEGER,
+    positive_pct FLOAT,
+    neutral_pct FLOAT,
+    negative_pct FLOAT,
+    overall_sentiment VARCHAR(20),
+    average_confidence FLOAT,
+    search_date DATETIME
+);
+-- Index entries end with the rowid (id), so this is the (username,
+-- search_date, id) key that history pages seek on
+CREATE INDEX IF NOT EXISTS ix_analysis_runs_username ON analysis_runs (username, search_date);
+CREATE INDEX IF NOT EXISTS ix_analysis_runs_party_state ON analysis_runs (party, state, search_date);
+CREATE TABLE IF NOT EXISTS run_articles (
+    run_id INTEGER NOT NULL REFERENCES analysis_runs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    article_id INTEGER NOT NULL REFERENCES articles (id),
+    classification VARCHAR(20),
+    compound_score FLOAT,
+    confidence FLOAT,
+    sentiment_json JSON NOT NULL,
+    PRIMARY KEY (run_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_run_articles_article ON run_articles (article_id);
+CREATE TABLE IF NOT EXISTS daily_sentiment_articles (
+    party VARCHAR(100) NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    article_id INTEGER NOT NULL,
+    day DATE NOT NULL,
+    classification VARCHAR(20),
+    compound_score FLOAT,
+    confidence FLOAT,
+    PRIMARY KEY (party, state, article_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_daily_sentiment_articles_article ON daily_sentiment_articles (article_id);
+CREATE TABLE IF NOT EXISTS archived_runs (
+    id INTEGER PRIMARY KEY,
+    username VARCHAR(50) NOT NULL,
+    party VARCHAR(100),
+    state VARCHAR(100),
+    articles_count INTEGER,
+    positive_pct FLOAT,
+    neutral_pct FLOAT,
+    negative_pct FLOAT,
+    overall_sentiment VARCHAR(20),
+    average_confidence FLOAT,
+    search_date DATETIME,
+    -- Archive file and byte offset of the gzip member holding the analysis
+    archive_file VARCHAR(100) NOT NULL,
+    archive_offset INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_archived_runs_username ON archived_runs (username, search_date);
+CREATE TABLE IF NOT EXISTS daily_sentiment (
+    party VARCHAR(100) NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    day DATE NOT NULL,
+    positive_count INTEGER NOT NULL DEFAULT 0,
+    neutral_count INTEGER NOT NULL DEFAULT 0,
+    negative_count INTEGER NOT NULL DEFAULT 0,
+    compound_sum FLOAT NOT NULL DEFAULT 0,
+    confidence_sum FLOAT NOT NULL DEFAULT 0,
+    PRIMARY KEY (party, state, day)
+) WITHOUT ROWID;
+"""
+
+# Full-text index over the articles table, kept in sync by triggers
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content,
+    content='articles', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, description, content)
+    VALUES ('delete', old.id, old.title, old.description, old.content);
+    INSERT INTO articles_fts (rowid, title, description, content)
+    VALUES (new.id, new.title, new.description, new.content);
+END;
+INSERT INTO articles_fts (articles_fts) VALUES ('rebuild');
+"""
+
+# Statements are constant strings so each pooled connection compiles them
+# once and reuses them from sqlite3's per-connection statement cache
+RUN_COLUMNS = (
+    "username, party, state, articles_count, positive_pct, neutral_pct, negative_pct, "
+    "overall_sentiment, average_confidence, search_date"
+)
+ARTICLE_COLUMNS = (
+    "url, source_id, source_name, author, title, description, url_to_image, published_at, content"
+)
+RUN_FIELDS = ", ".join(f"r.{column}" for column in RUN_COLUMNS.split(", "))
+ARTICLE_FIELDS = ", ".join(f"a.{column}" for column in ARTICLE_COLUMNS.split(", "))
+INSERT_RUN = f"INSERT INTO analysis_runs ({RUN_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+# An article whose text was dropped by the retention policy gets it back
+# when a new analysis includes it again
+INSERT_ARTICLE = (
+    f"INSERT INTO articles (article_key, {ARTICLE_COLUMNS}) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (article_key) DO UPDATE SET author = excluded.author, title = excluded.title, "
+    "description = excluded.description, url_to_image = excluded.url_to_image, "
+    "content = excluded.content "
+    "WHERE articles.title IS NULL AND articles.description IS NULL AND articles.content IS NULL"
+)
+SELECT_ARTICLE_ID = "SELECT id FROM articles WHERE article_key = ?"
+INSERT_RUN_ARTICLE = (
+    "INSERT INTO run_articles (run_id, position, article_id, classification, compound_score, "
+    "confidence, sentiment_json) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_ROLLUP_ARTICLE = (
+    "INSERT OR IGNORE INTO daily_sentiment_articles "
+    "(party, state, article_id, day, classification, compound_score, confidence) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+UPSERT_DAILY_SENTIMENT = (
+    "INSERT INTO daily_sentiment (party, state, day, positive_count, neutral_count, "
+    "negative_count, compound_sum, confidence_sum) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (party, state, day) DO UPDATE SET "
+    "positive_count = positive_count + excluded.positive_count, "
+    "neutral_count = neutral_count + excluded.neutral_count, "
+    "negative_count = negative_count + excluded.negative_count, "
+    "compound_sum = compound_sum + excluded.compound_sum, "
+    "confidence_sum = confidence_sum + excluded.confidence_sum"
+)
+# Day bucket -> week (starting Monday) or month bucket
+TREND_PERIODS = {
+    'day': "day",
+    'week': "date(day, 'weekday 0', '-6 days')",
+    'month': "strftime('%Y-%m-01', day)"
+}
+SELECT_USER_ANALYSES = (
+    f"SELECT id, {RUN_COLUMNS} FROM analysis_runs "
+    "WHERE username = ? ORDER BY search_date DESC, id DESC LIMIT ?"
+)
+# Keyset pagination: continue strictly after the last (search_date, id) seen
+SELECT_USER_ANALYSES_AFTER = (
+    f"SELECT id, {RUN_COLUMNS} FROM analysis_runs "
+    "WHERE username = ? AND (search_date, id) < (?, ?) "
+    "ORDER BY search_date DESC, id DESC LIMIT ?"
+)
+SELECT_ARCHIVED_ANALYSES = (
+    f"SELECT id, {RUN_COLUMNS} FROM archived_runs "
+    "WHERE username = ? ORDER BY search_date DESC, id DESC LIMIT ?"
+)
+SELECT_ARCHIVED_ANALYSES_AFTER = (
+    f"SELECT id, {RUN_COLUMNS} FROM archived_runs "
+    "WHERE username = ? AND (search_date, id) < (?, ?) "
+    "ORDER BY search_date DESC, id DESC LIMIT ?"
+)
+# New runs take MAX(id) + 1, so the newest run is never archived and
+# archived ids are never handed out again
+SELECT_EXPIRED_RUNS = (
+    f"SELECT id, {RUN_COLUMNS} FROM analysis_runs WHERE search_date < ? "
+    "AND id < (SELECT MAX(id) FROM analysis_runs) ORDER BY id LIMIT ?"
+)
+INSERT_ARCHIVED_RUN = (
+    f"INSERT OR IGNORE INTO archived_runs (id, {RUN_COLUMNS}, archive_file, archive_offset) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SELECT_ORPHAN_ARTICLE = (
+    "SELECT id, article_key, url, source_id, source_name, published_at FROM articles "
+    "WHERE id = ? AND (title IS NOT NULL OR description IS NOT NULL OR content IS NOT NULL) "
+    "AND NOT EXISTS (SELECT 1 FROM run_articles WHERE article_id = articles.id)"
+)
+INSERT_ARTICLE_STUB = (
+    "INSERT INTO articles (id, article_key, url, source_id, source_name, published_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+SELECT_ANALYSIS = f"SELECT id, {RUN_COLUMNS} FROM analysis_runs WHERE id = ?"
+SELECT_RUN_ARTICLES = (
+    f"SELECT ra.article_id, {ARTICLE_FIELDS}, ra.sentiment_json "
+    "FROM run_articles ra JOIN articles a ON a.id = ra.article_id "
+    "WHERE ra.run_id = ? ORDER BY ra.position"
+)
+SELECT_LEGACY_ROWS = (
+    f"SELECT id, {RUN_COLUMNS}, articles_data FROM search_history "
+    "WHERE id > ? ORDER BY id LIMIT ?"
+)
+
+
+def _now():
+    return datetime.now().isoformat(sep=' ', timespec='seconds')
+
+
+def fts_query(text):
+    """
+    Turn search box input into an FTS5 query
+
+    Words and "quoted phrases" are all required; characters that FTS5 would
+    read as operators are taken literally.
+
+    Returns:
+        str: MATCH expression, or None if the input has no words
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', text or ""):
+        term = (phrase or word).replace('"', ' ').strip()
+        if term:
+            terms.append(f'"{term}"')
+    return " AND ".join(terms) or None
+
+
+class ConnectionPool:
+    """
+    Fixed-size pool of SQLite connections to one database file
+
+    The database is switched to WAL mode, so readers never wait for the
+    writer and the writer only waits for other writers (up to busy_timeout
+    seconds). A connection is used by one thread at a time; connections are
+    opened lazily, up to size, and callers wait when all are in use.
+    """
+
+    def __init__(self, db_path=DATABASE_PATH, size=DB_POOL_SIZE, busy_timeout=DB_BUSY_TIMEOUT):
+        self.db_path = db_path
+        self.size = size
+        self.busy_timeout = busy_timeout
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+        with self.connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.executescript(SCHEMA)
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        # Safe with WAL: a power loss may drop the last commits, never corrupt
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        """Borrow a connection for the duration of a with block"""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._open()
+                except sqlite3.Error:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def close(self):
+        """Close the idle connections"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+
+def article_key(article):
+    """
+    Deduplication key of an article: its URL, or a hash of its title,
+    source and publication time when it has none
+    """
+    if article.get('url'):
+        return article['url']
+    source = (article.get('source') or {}).get('name') or ''
+    identity = f"{article.get('title') or ''}|{source}|{article.get('publishedAt') or ''}"
+    return "sha1:" + hashlib.sha1(identity.encode()).hexdigest()
+
+
+def _article_params(article):
+    source = article.get('source') or {}
+    return (
+        article_key(article), article.get('url'), source.get('id'), source.get('name'),
+        article.get('author'), article.get('title'), article.get('description'),
+        article.get('urlToImage'), article.get('publishedAt'), article.get('content')
+    )
+
+
+def _article_from_row(row):
+    """Rebuild the News API-style article dict from an articles row"""
+    return {
+        'source': {'id': row['source_id'], 'name': row['source_name']},
+        'author': row['author'],
+        'title': row['title'],
+        'description': row['description'],
+        'url': row['url'],
+        'urlToImage': row['url_to_image'],
+        'publishedAt': row['published_at'],
+        'content': row['content']
+    }
+
+
+def insert_analysis(conn, username, party, state, articles, sentiments, stats, search_date=None):
+    """
+    Insert one analysis (call inside a transaction)
+
+    Articles already stored under the same key are reused, not copied.
+
+    Args:
+        conn: Connection from the pool
+        username (str): User who ran the analysis
+        party (str): Political party
+        state (str): State/UT name
+        articles (list): Article dictionaries
+        sentiments (list): Matching results from analyze_article
+        stats (dict): 'overall_statistics' of the analysis
+        search_date (str): Defaults to now
+
+    Returns:
+        int: Id of the new analysis_runs row
+    """
+    run_id = conn.execute(INSERT_RUN, (
+        username, party, state, stats['total_articles'],
+        stats['positive_percentage'], stats['neutral_percentage'], stats['negative_percentage'],
+        stats['overall_sentiment'], stats['average_confidence'], search_date or _now()
+    )).lastrowid
+
+    article_rows = [_article_params(article) for article in articles]
+    conn.executemany(INSERT_ARTICLE, article_rows)
+    article_ids = [conn.execute(SELECT_ARTICLE_ID, (row[0],)).fetchone()[0] for row in article_rows]
+    conn.executemany(INSERT_RUN_ARTICLE, [
+        (run_id, position, article_id,
+         sentiment.get('classification'), sentiment.get('compound_score'),
+         sentiment.get('confidence'), json.dumps(sentiment))
+        for position, (article_id, sentiment) in enumerate(zip(article_ids, sentiments))
+    ])
+
+    search_day = (search_date or _now())[:10]
+    roll_up(conn, party, state, [
+        (article_id, (row[8] or search_day)[:10], sentiment)
+        for row, article_id, sentiment in zip(article_rows, article_ids, sentiments)
+    ])
+    return run_id
+
+
+def roll_up(conn, party, state, scored):
+    """
+    Add article scores to the daily rollups (call inside a transaction)
+
+    An article already counted for this party and state (by an earlier
+    run) is not counted again, so this can be repeated safely.
+
+    Args:
+        conn: Connection from the pool
+        party (str): Political party
+        state (str): State/UT name
+        scored (list): (article id, "YYYY-MM-DD" publication day, result
+            from analyze_article) tuples
+    """
+    days = {}
+    for article_id, day, sentiment in scored:
+        classification = sentiment.get('classification')
+        compound = sentiment.get('compound_score') or 0.0
+        confidence = sentiment.get('confidence') or 0.0
+        added = conn.execute(INSERT_ROLLUP_ARTICLE, (
+            party, state, article_id, day, classification, compound, confidence
+        )).rowcount
+        if not added:
+            continue
+        totals = days.setdefault(day, [0, 0, 0, 0.0, 0.0])
+        totals[{'Positive': 0, 'Negative': 2}.get(classification, 1)] += 1
+        totals[3] += compound
+        totals[4] += confidence
+    conn.executemany(UPSERT_DAILY_SENTIMENT, [
+        (party, state, day, *totals) for day, totals in days.items()
+    ])
+
+
+class AnalysisWriter:
+    """
+    Background writer for the analysis tables
+
+    save() only queues the analysis. A daemon thread inserts up to
+    batch_size queued analyses per transaction; whatever is still queued at
+    interpreter exit is written before the process ends. call() queues other
+    database work (e.g. schema migrations) to run on the same thread, in
+    order with the saves.
+    """
+
+    def __init__(self, pool, batch_size=HISTORY_WRITE_BATCH):
+        self.pool = pool
+        self.batch_size = batch_size
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def save(self, username, party, state, articles, analysis_results):
+        """Queue one analysis for saving (the lists must not be changed afterwards)"""
+        self._queue.put((username, party, state, articles, analysis_results, _now()))
+
+    def call(self, task):
+        """Queue a function to run on the writer thread after the saves queued so far"""
+        self._queue.put(task)
+
+    def _call(self, task):
+        try:
+            task()
+        except Exception as e:
+            # Keep the thread alive; later saves and flush() still work
+            print(f"History writer task {getattr(task, '__name__', task)} failed: {e}")
+
+    def _write(self, batch):
+        try:
+            with self.pool.connection() as conn:
+                with conn:
+                    # One transaction per batch; a savepoint per analysis lets
+                    # a malformed one be skipped without losing the others
+                    conn.execute("BEGIN")
+                    for username, party, state, articles, analysis_results, search_date in batch:
+                        conn.execute("SAVEPOINT analysis")
+                        try:
+                            insert_analysis(conn, username, party, state, articles,
+                                            analysis_results['individual_results'],
+                                            analysis_results['overall_statistics'], search_date)
+                        except (KeyError, TypeError, ValueError) as e:
+                            conn.execute("ROLLBACK TO analysis")
+                            print(f"Skipping malformed analysis for {username}: {e}")
+                        conn.execute("RELEASE analysis")
+        except sqlite3.Error as e:
+            print(f"Error saving {len(batch)} analyses to search history: {e}")
+
+    def _run(self):
+        task = None
+        while True:
+            item = task if task is not None else self._queue.get()
+            task = None
+            if callable(item):
+                self._call(item)
+                self._queue.task_done()
+                continue
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if callable(item):
+                    # Run after this batch, keeping queue order
+                    task = item
+                    break
+                batch.append(item)
+            stop = None in batch
+            entries = [entry for entry in batch if entry is not None]
+            if entries:
+                self._write(entries)
+            for _ in batch:
+                self._queue.task_done()
+            if stop:
+                return
+
+    def flush(self):
+        """Wait until every queued analysis has been written"""
+        if self._thread.is_alive():
+            self._queue.join()
+
+    def close(self):
+        """Write what is still queued and stop the thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=10)
+
+
+class AnalysisHistory:
+    """Analysis reads and writes on top of a ConnectionPool"""
+
+    def __init__(self, pool, writer=None, archive=None):
+        self.pool = pool
+        self.archive = archive or HistoryArchive()
+        self.writer = writer or AnalysisWriter(pool)
+        # Migrations and index builds can take a while on an old database;
+        # run them on the writer thread so building the history never holds
+        # up a page. Reads flush the writer first, so they see the result.
+        self.writer.call(self.prepare)
+
+    def prepare(self):
+        """Migrate legacy rows and build missing rollups and the search index"""
+        self.migrate_search_history()
+        with self.pool.connection() as conn:
+            missing_rollups = (conn.execute("SELECT 1 FROM run_articles LIMIT 1").fetchone() is not None
+                               and conn.execute("SELECT 1 FROM daily_sentiment LIMIT 1").fetchone() is None)
+        if missing_rollups:
+            self.rebuild_rollups()
+        self._ensure_search_index()
+
+    def migrate_search_history(self, batch_size=200):
+        """
+        Move rows saved with an articles_data JSON blob into the normalized
+        tables, deleting each search_history row once it has been moved
+
+        A row whose blob cannot be read is logged and left in search_history.
+
+        Returns:
+            int: Number of analyses migrated
+        """
+        migrated = 0
+        last_id = 0
+        with self.pool.connection() as conn:
+            while True:
+                rows = conn.execute(SELECT_LEGACY_ROWS, (last_id, batch_size)).fetchall()
+                if not rows:
+                    break
+                moved = []
+                with conn:
+                    conn.execute("BEGIN")
+                    for row in rows:
+                        conn.execute("SAVEPOINT legacy_row")
+                        try:
+                            entries = json.loads(row['articles_data'] or '[]')
+                            insert_analysis(
+                                conn, row['username'], row['party'], row['state'],
+                                [entry['article'] for entry in entries],
+                                [entry['sentiment'] for entry in entries],
+                                {
+                                    'total_articles': row['articles_count'],
+                                    'positive_percentage': row['positive_pct'],
+                                    'neutral_percentage': row['neutral_pct'],
+                                    'negative_percentage': row['negative_pct'],
+                                    'overall_sentiment': row['overall_sentiment'],
+                                    'average_confidence': row['average_confidence']
+                                },
+                                row['search_date']
+                            )
+                            moved.append((row['id'],))
+                        except (KeyError, TypeError, ValueError) as e:
+                            conn.execute("ROLLBACK TO legacy_row")
+                            print(f"Skipping unreadable search_history row {row['id']}: {e!r}")
+                        conn.execute("RELEASE legacy_row")
+                    conn.executemany("DELETE FROM search_history WHERE id = ?", moved)
+                migrated += len(moved)
+                last_id = rows[-1]['id']
+        if migrated:
+            print(f"Migrated {migrated} analyses out of search_history")
+        return migrated
+
+    def _ensure_search_index(self):
+        """Create the full-text index and its triggers, indexing stored articles"""
+        with self.pool.connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+            ).fetchone()
+            if not exists:
+                conn.executescript(f"BEGIN;{SEARCH_SCHEMA}COMMIT;")
+
+    def rebuild_rollups(self):
+        """
+        Recompute the daily rollups from the stored runs
+
+        Used once for databases that have runs saved before the rollups
+        existed; afterwards insert_analysis keeps them up to date. Scores
+        of articles only archived analyses include are kept as they are.
+        """
+        with self.pool.connection() as conn:
+            with conn:
+                conn.execute(
+                    "DELETE FROM daily_sentiment_articles "
+                    "WHERE article_id IN (SELECT article_id FROM run_articles)"
+                )
+                conn.execute("DELETE FROM daily_sentiment")
+                # Earliest run first, so the first score of an article wins
+                # as it does when rolling up incrementally
+                conn.execute(
+                    "INSERT OR IGNORE INTO daily_sentiment_articles "
+                    "(party, state, article_id, day, classification, compound_score, confidence) "
+                    "SELECT r.party, r.state, ra.article_id, "
+                    "substr(COALESCE(a.published_at, r.search_date), 1, 10), "
+                    "ra.classification, COALESCE(ra.compound_score, 0), COALESCE(ra.confidence, 0) "
+                    "FROM analysis_runs r JOIN run_articles ra ON ra.run_id = r.id "
+                    "JOIN articles a ON a.id = ra.article_id "
+                    "ORDER BY r.id, ra.position"
+                )
+                conn.execute(
+                    "INSERT INTO daily_sentiment (party, state, day, positive_count, neutral_count, "
+                    "negative_count, compound_sum, confidence_sum) "
+                    "SELECT party, state, day, SUM(classification = 'Positive'), "
+                    "SUM(classification IS NOT 'Positive' AND classification IS NOT 'Negative'), "
+                    "SUM(classification = 'Negative'), SUM(compound_score), SUM(confidence) "
+                    "FROM daily_sentiment_articles GROUP BY party, state, day"
+                )
+
+    def sentiment_trend(self, party, state="All States", start_date=None, end_date=None, period="day"):
+        """
+        Sentiment of a party's coverage over time, from the daily rollups
+
+        Args:
+            party (str): Political party
+            state (str): State/UT name; None covers every state, counting
+                an article stored under several states once
+            start_date (str): First day included, "YYYY-MM-DD"
+            end_date (str): Last day included, "YYYY-MM-DD"
+            period (str): "day", "week" (starting Monday) or "month"
+
+        Returns:
+            list: dicts with date (first day of the period), counts,
+                total_articles, percentages, average_compound_score and
+                average_confidence, oldest first
+        """
+        if period not in TREND_PERIODS:
+            raise ValueError(f"period must be one of {', '.join(TREND_PERIODS)}")
+        conditions, params = ["party = ?"], [party]
+        if state is not None:
+            conditions.append("state = ?")
+            params.append(state)
+        if start_date is not None:
+            conditions.append("day >= ?")
+            params.append(start_date)
+        if end_date is not None:
+            conditions.append("day <= ?")
+            params.append(end_date)
+        if state is not None:
+            sql = (
+                f"SELECT {TREND_PERIODS[period]} AS bucket, SUM(positive_count), SUM(neutral_count), "
+                "SUM(negative_count), SUM(compound_sum), SUM(confidence_sum) FROM daily_sentiment "
+                f"WHERE {' AND '.join(conditions)} GROUP BY bucket ORDER BY bucket"
+            )
+        else:
+            # The per-state rollups overlap: an article analyzed for "All
+            # States" and for a state is in both. Count each article once,
+            # with the score of its first state by name (bare columns come
+            # from the MIN() row).
+            sql = (
+                f"SELECT {TREND_PERIODS[period]} AS bucket, SUM(classification = 'Positive'), "
+                "SUM(classification IS NOT 'Positive' AND classification IS NOT 'Negative'), "
+                "SUM(classification = 'Negative'), SUM(compound_score), SUM(confidence) FROM ("
+                "SELECT day, classification, compound_score, confidence, MIN(state) "
+                f"FROM daily_sentiment_articles WHERE {' AND '.join(conditions)} GROUP BY article_id"
+                ") GROUP BY bucket ORDER BY bucket"
+            )
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        trend = []
+        for bucket, positive, neutral, negative, compound_sum, confidence_sum in rows:
+            total = positive + neutral + negative
+            if not total:
+                continue
+            trend.append({
+                'date': bucket,
+                'positive_count': positive,
+                'neutral_count': neutral,
+                'negative_count': negative,
+                'total_articles': total,
+                'positive_pct': round(positive / total * 100, 2),
+                'neutral_pct': round(neutral / total * 100, 2),
+                'negative_pct': round(negative / total * 100, 2),
+                'average_compound_score': round(compound_sum / total, 4),
+                'average_confidence': round(confidence_sum / total, 2)
+            })
+        return trend
+
+    def _search_filters(self, query, party, state, classification, published_after, published_before):
+        match = fts_query(query)
+        if match is None:
+            return None, None
+        conditions, params = ["articles_fts MATCH ?"], [match]
+        for column, value in (("s.party", party), ("s.state", state), ("s.classification", classification)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if published_after is not None:
+            conditions.append("a.published_at >= ?")
+            params.append(published_after)
+        if published_before is not None:
+            conditions.append("a.published_at < ?")
+            params.append(published_before)
+        # CROSS JOIN keeps the full-text match as the outer loop; otherwise
+        # the planner may walk every score of a party and test each article
+        joins = (
+            "FROM articles_fts CROSS JOIN articles a ON a.id = articles_fts.rowid "
+            "CROSS JOIN daily_sentiment_articles s ON s.article_id = a.id "
+            f"WHERE {' AND '.join(conditions)}"
+        )
+        return joins, params
+
+    def search_articles(self, query, party=None, state=None, classification=None,
+                        published_after=None, published_before=None, limit=20, offset=0):
+        """
+        Full-text search over stored titles, descriptions and content
+
+        Matches in the title rank highest, then the description, then the
+        content. An article analyzed for several parties or states is
+        returned once for each, with that party's score.
+
+        Args:
+            query (str): Words and "quoted phrases", all of which must match
+            party (str): Only scores for this party
+            state (str): Only scores for this state
+            classification (str): "Positive", "Neutral" or "Negative"
+            published_after (str): ISO publishedAt lower bound (inclusive)
+            published_before (str): ISO publishedAt upper bound (exclusive)
+            limit (int): Page size
+            offset (int): Results to skip
+
+        Returns:
+            list: dicts with 'article', 'party', 'state', 'classification',
+                'compound_score', 'confidence' and 'snippet' (matches in
+                **bold**), best match first
+        """
+        joins, params = self._search_filters(query, party, state, classification,
+                                             published_after, published_before)
+        if joins is None:
+            return []
+        sql = (
+            f"SELECT {ARTICLE_FIELDS}, s.party, s.state, s.classification, s.compound_score, "
+            "s.confidence, snippet(articles_fts, -1, '**', '**', '…', 24) AS snippet "
+            f"{joins} ORDER BY bm25(articles_fts, 10.0, 4.0, 1.0), a.published_at DESC LIMIT ? OFFSET ?"
+        )
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, params + [limit, offset]).fetchall()
+        return [
+            {
+                'article': _article_from_row(row),
+                'party': row['party'],
+                'state': row['state'],
+                'classification': row['classification'],
+                'compound_score': row['compound_score'],
+                'confidence': row['confidence'],
+                'snippet': row['snippet']
+            }
+            for row in rows
+        ]
+
+    def count_search_results(self, query, party=None, state=None, classification=None,
+                             published_after=None, published_before=None):
+        """Number of results search_articles would page through"""
+        joins, params = self._search_filters(query, party, state, classification,
+                                             published_after, published_before)
+        if joins is None:
+            return 0
+        with self.pool.connection() as conn:
+            return conn.execute(f"SELECT COUNT(*) {joins}", params).fetchone()[0]
+
+    def user_analyses(self, username, limit=50):
+        return self.history_page(username, limit)[0]
+
+    def history_page(self, username, limit=20, cursor=None):
+        """
+        One page of a user's analyses, newest first
+
+        Pages seek on the (username, search_date, id) index instead of
+        counting past earlier rows with OFFSET, so every page costs the
+        same however deep it is, and analyses saved while paging do not
+        shift the following pages. Analyses moved to the archive by the
+        retention policy are listed too, after the newer ones, from their
+        summary rows in archived_runs.
+
+        Args:
+            username (str): User whose history to read
+            limit (int): Page size
+            cursor (tuple): next_cursor of the previous page; None for the
+                first page
+
+        Returns:
+            tuple: (summary dicts, next_cursor or None on the last page)
+        """
+        rows = []
+        with self.pool.connection() as conn:
+            for first_page, after in ((SELECT_USER_ANALYSES, SELECT_USER_ANALYSES_AFTER),
+                                      (SELECT_ARCHIVED_ANALYSES, SELECT_ARCHIVED_ANALYSES_AFTER)):
+                if cursor is None:
+                    rows += conn.execute(first_page, (username, limit + 1)).fetchall()
+                else:
+                    search_date, last_id = cursor
+                    rows += conn.execute(after, (username, search_date, last_id, limit + 1)).fetchall()
+        rows.sort(key=lambda row: (row['search_date'], row['id']), reverse=True)
+        page = [dict(row) for row in rows[:limit]]
+        next_cursor = (page[-1]['search_date'], page[-1]['id']) if len(rows) > limit else None
+        return page, next_cursor
+
+    def analysis(self, analysis_id):
+        with self.pool.connection() as conn:
+            row = conn.execute(SELECT_ANALYSIS, (analysis_id,)).fetchone()
+            if row is None:
+                archived = conn.execute(
+                    "SELECT archive_file, archive_offset FROM archived_runs WHERE id = ?", (analysis_id,)
+                ).fetchone()
+                return self.archive.load(archived[0], analysis_id, archived[1]) if archived else None
+            article_rows = conn.execute(SELECT_RUN_ARTICLES, (analysis_id,)).fetchall()
+        record = dict(row)
+        record['articles'] = [_article_from_row(article) for article in article_rows]
+        record['individual_results'] = [json.loads(article['sentiment_json']) for article in article_rows]
+        return record
+
+    def find_articles(self, party=None, state=None, username=None, classification=None,
+                      published_after=None, published_before=None, limit=100):
+        """
+        Stored article scores matching all given filters, newest article first
+
+        Args:
+            party (str): Analyses of this party
+            state (str): Analyses of this state
+            username (str): Analyses run by this user
+            classification (str): "Positive", "Neutral" or "Negative"
+            published_after (str): ISO publishedAt lower bound (inclusive)
+            published_before (str): ISO publishedAt upper bound (exclusive)
+            limit (int): Maximum number of results
+
+        Returns:
+            list: dicts with 'article', 'sentiment', 'run_id', 'username',
+                'party', 'state' and 'search_date'
+        """
+        conditions, params = [], []
+        for column, value in (("r.party", party), ("r.state", state), ("r.username", username),
+                              ("ra.classification", classification)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if published_after is not None:
+            conditions.append("a.published_at >= ?")
+            params.append(published_after)
+        if published_before is not None:
+            conditions.append("a.published_at < ?")
+            params.append(published_before)
+        sql = (
+            f"SELECT {ARTICLE_FIELDS}, ra.sentiment_json, ra.run_id, "
+            "r.username, r.party, r.state, r.search_date "
+            "FROM run_articles ra "
+            "JOIN analysis_runs r ON r.id = ra.run_id "
+            "JOIN articles a ON a.id = ra.article_id"
+        )
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY a.published_at DESC, ra.run_id DESC LIMIT ?"
+        params.append(limit)
+
+        with self.pool.connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {
+                'article': _article_from_row(row),
+                'sentiment': json.loads(row['sentiment_json']),
+                'run_id': row['run_id'],
+                'username': row['username'],
+                'party': row['party'],
+                'state': row['state'],
+                'search_date': row['search_date']
+            }
+            for row in rows
+        ]
+
+    def article_runs(self, url):
+        """Summaries of every analysis that included the article at url, newest first"""
+        with self.pool.connection() as conn:
+            return [dict(row) for row in conn.execute(
+                f"SELECT r.id, {RUN_FIELDS} FROM articles a "
+                "JOIN run_articles ra ON ra.article_id = a.id "
+                "JOIN analysis_runs r ON r.id = ra.run_id "
+                "WHERE a.article_key = ? ORDER BY r.search_date DESC, r.id DESC",
+                (url,)
+            )]
+
+    def get_stats(self):
+        """Row counts of the analysis tables"""
+        with self.pool.connection() as conn:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table in ("analysis_runs", "archived_runs", "articles", "run_articles")
+            }
+
+
+class HistoryRetention:
+    """
+    Retention policy for the analysis tables
+
+    Analyses older than retention_days are written to the monthly archive
+    files and removed from the database, keeping only a summary row in
+    archived_runs so they still appear in the history. Their scores are
+    folded into the daily rollups first (normally already counted when the
+    analysis was saved), so trends are unaffected. Stored articles that no
+    remaining analysis includes keep only their key, URL and date: the
+    rollups count articles by id, and the row is filled again if a later
+    analysis includes it. Freed pages are then returned to the file system
+    with incremental VACUUM, a bounded number per run.
+    """
+
+    def __init__(self, history, retention_days=HISTORY_RETENTION_DAYS,
+                 vacuum_pages=HISTORY_VACUUM_PAGES, batch_size=100):
+        self.history = history
+        self.pool = history.pool
+        self.archive = history.archive
+        self.retention_days = retention_days
+        self.vacuum_pages = vacuum_pages
+        self.batch_size = batch_size
+
+    def enable_incremental_vacuum(self):
+        """
+        Switch the database to auto_vacuum=INCREMENTAL
+
+        Takes one full VACUUM, which rewrites the file and blocks every
+        writer while it runs, so it is a maintenance step run by hand
+        (python database.py --enable-incremental-vacuum), never by the
+        retention worker. Until then, vacuum() frees nothing.
+        """
+        with self.pool.connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                # The mode only takes effect once the file is rebuilt
+                conn.execute("VACUUM")
+
+    def _archive_batch(self, conn, cutoff):
+        """Archive up to batch_size analyses older than cutoff; returns (count, article ids)"""
+        runs = conn.execute(SELECT_EXPIRED_RUNS, (cutoff, self.batch_size)).fetchall()
+        if not runs:
+            return 0, set()
+
+        files = {}
+        rollups = []
+        article_ids = set()
+        for run in runs:
+            article_rows = conn.execute(SELECT_RUN_ARTICLES, (run['id'],)).fetchall()
+            sentiments = [json.loads(row['sentiment_json']) for row in article_rows]
+            record = dict(run)
+            record['articles'] = [_article_from_row(row) for row in article_rows]
+            record['individual_results'] = sentiments
+            file_name = self.archive.file_name(run['search_date'])
+            files.setdefault(file_name, []).append(record)
+            rollups.append((run, file_name, [
+                (row['article_id'], (row['published_at'] or run['search_date'])[:10], sentiment)
+                for row, sentiment in zip(article_rows, sentiments)
+            ]))
+            article_ids.update(row['article_id'] for row in article_rows)
+
+        # Archive first: if the process dies before the delete commits, the
+        # analyses are archived again next time and the earlier copy is
+        # never read
+        offsets = {file_name: self.archive.append(file_name, records)
+                   for file_name, records in files.items()}
+
+        with conn:
+            for run, _, scored in rollups:
+                roll_up(conn, run['party'], run['state'], scored)
+            conn.executemany(INSERT_ARCHIVED_RUN, [
+                (*tuple(run), file_name, offsets[file_name]) for run, file_name, _ in rollups
+            ])
+            conn.executemany("DELETE FROM run_articles WHERE run_id = ?", [(run['id'],) for run in runs])
+            conn.executemany("DELETE FROM analysis_runs WHERE id = ?", [(run['id'],) for run in runs])
+        return len(runs), article_ids
+
+    def _compact_articles(self, conn, article_ids):
+        """Drop the text of articles no remaining analysis includes"""
+        rows = [
+            tuple(row) for article_id in article_ids for row in conn.execute(
+                SELECT_ORPHAN_ARTICLE, (article_id,)
+            )
+        ]
+        with conn:
+            # Deleting and re-inserting the short row (same id and key) lets
+            # SQLite merge the emptied pages; shrinking it in place would
+            # leave them mostly empty
+            conn.executemany("DELETE FROM articles WHERE id = ?", [(row[0],) for row in rows])
+            conn.executemany(INSERT_ARTICLE_STUB, rows)
+        return len(rows)
+
+    def vacuum(self):
+        """
+        Return up to vacuum_pages free pages to the file system
+
+        Returns:
+            int: Pages freed
+        """
+        with self.pool.connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                # Free pages are still reused by later writes
+                return 0
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # execute() stops after the first freed page; a script runs to the end
+            conn.executescript(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)});")
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            # Keep the WAL from holding on to the space just released
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        return before - after
+
+    def run(self, now=None):
+        """
+        Apply the policy once
+
+        Args:
+            now (datetime): Reference time (default: now)
+
+        Returns:
+            dict: archived analyses, compacted_articles and freed_pages
+        """
+        if self.retention_days <= 0:
+            return {'archived': 0, 'compacted_articles': 0, 'freed_pages': 0}
+        self.history.writer.flush()
+        cutoff = ((now or datetime.now()) - timedelta(days=self.retention_days)).isoformat(
+            sep=' ', timespec='seconds'
+        )
+
+        archived = 0
+        compacted = 0
+        with self.pool.connection() as conn:
+            while True:
+                count, article_ids = self._archive_batch(conn, cutoff)
+                if not count:
+                    break
+                archived += count
+                compacted += self._compact_articles(conn, article_ids)
+            if compacted:
+                # Merge the search index so entries of the dropped text are
+                # removed rather than kept as delete markers
+                with conn:
+                    conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('optimize')")
+        freed = self.vacuum()
+        if archived:
+            print(f"Archived {archived} analyses older than {cutoff}, freed {freed} pages")
+        return {'archived': archived, 'compacted_articles': compacted, 'freed_pages': freed}
+
+
+class RetentionWorker(threading.Thread):
+    """Daemon thread that applies the retention policy on an interval"""
+
+    def __init__(self, interval=HISTORY_RETENTION_INTERVAL):
+        super().__init__(name="history-retention", daemon=True)
+        self.interval = interval
+        self.retention = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        # Built here so starting the worker never waits on the database
+        history = get_analysis_history()
+        history.writer.flush()
+        self.retention = HistoryRetention(history)
+        while not self._stop_event.is_set():
+            try:
+                self.retention.run()
+            except (sqlite3.Error, OSError) as e:
+                # Retried on the next round
+                print(f"History retention failed: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        """Ask the thread to finish after the current run"""
+        self._stop_event.set()
+
+
+# Singleton instances for easy import
+_pools = {}
+_history_instance = None
+_instance_lock = threading.Lock()
+
+def get_connection_pool(db_path=DATABASE_PATH):
+    """Get the shared ConnectionPool for a database file"""
+    with _instance_lock:
+        pool = _pools.get(db_path)
+        if pool is None:
+            pool = _pools[db_path] = ConnectionPool(db_path)
+        return pool
+
+_retention_instance = None
+
+def start_retention_worker():
+    """
+    Start the history retention thread once per process
+
+    Returns:
+        RetentionWorker: The running worker, or None if retention is off
+    """
+    global _retention_instance
+    with _instance_lock:
+        if _retention_instance is None and HISTORY_RETENTION_DAYS > 0:
+            _retention_instance = RetentionWorker()
+            _retention_instance.start()
+        return _retention_instance
+
+def get_analysis_history():
+    """Get singleton AnalysisHistory for the app database"""
+    global _history_instance
+    pool = get_connection_pool()
+    with _instance_lock:
+        if _history_instance is None:
+            _history_instance = AnalysisHistory(pool)
+        return _history_instance
+
+def save_analysis_to_db(username, party, state, articles, analysis_results):
+    """
+    Record an analysis in the user's search history
+
+    Returns immediately; the rows are written by a background thread.
+
+    Args:
+        username (str): User who ran the analysis
+        party (str): Political party
+        state (str): State/UT name
+        articles (list): Article dictionaries
+        analysis_results (dict): Result in the analyze_articles_batch format
+    """
+    get_analysis_history().writer.save(username, party, state, articles, analysis_results)
+
+def get_user_analyses(username, limit=50):
+    """
+    Get a user's most recent analyses, including ones not yet written
+
+    Returns:
+        list: Summary dicts (id, party, state, counts, percentages,
+            overall_sentiment, average_confidence, search_date), newest first
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.user_analyses(username, limit)
+
+def get_history_page(username, limit=20, cursor=None):
+    """
+    Get one page of a user's analysis summaries, newest first
+
+    Args:
+        username (str): User whose history to read
+        limit (int): Page size
+        cursor (tuple): next_cursor returned for the previous page
+
+    Returns:
+        tuple: (summary dicts, next_cursor or None on the last page)
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.history_page(username, limit, cursor)
+
+def get_analysis_by_id(analysis_id):
+    """
+    Get one analysis with its articles
+
+    Returns:
+        dict: Summary fields plus 'articles' and 'individual_results', or
+            None if there is no such analysis
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.analysis(analysis_id)
+
+def find_stored_articles(**filters):
+    """
+    Search stored article scores by party, state, username, classification
+    and publication date (see AnalysisHistory.find_articles)
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.find_articles(**filters)
+
+def get_sentiment_trend(party, state="All States", start_date=None, end_date=None, period="day"):
+    """
+    Get a party's sentiment over time (see AnalysisHistory.sentiment_trend)
+
+    Each stored article counts once per party and state, on the day it was
+    published.
+
+    Returns:
+        list: One dict per day, week or month, oldest first
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.sentiment_trend(party, state, start_date, end_date, period)
+
+def search_stored_articles(query, limit=20, offset=0, **filters):
+    """
+    Full-text search over stored articles with their sentiment scores
+    (see AnalysisHistory.search_articles for the filters)
+
+    Returns:
+        list: Result dicts, best match first
+    """
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.search_articles(query, limit=limit, offset=offset, **filters)
+
+def count_stored_articles(query, **filters):
+    """Get the total number of results for a search_stored_articles query"""
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.count_search_results(query, **filters)
+
+def get_article_history(url):
+    """Get summaries of every stored analysis that included an article"""
+    history = get_analysis_history()
+    history.writer.flush()
+    return history.article_runs(url)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analysis history maintenance")
+    parser.add_argument('--enable-incremental-vacuum', action='store_true',
+                        help='One-time full VACUUM so retention runs can return space (stop the app first)')
+    parser.add_argument('--apply-retention', action='store_true',
+                        help='Archive analyses older than HISTORY_RETENTION_DAYS now')
+    args = parser.parse_args()
+
+    history = get_analysis_history()
+    history.writer.flush()
+    retention = HistoryRetention(history)
+    if args.enable_incremental_vacuum:
+        retention.enable_incremental_vacuum()
+        print(f"auto_vacuum=INCREMENTAL enabled on {DATABASE_PATH}")
+    if args.apply_retention:
+        if retention.retention_days <= 0:
+            print("HISTORY_RETENTION_DAYS is 0, nothing to archive")
+        else:
+            print(f"Retention: {retention.run()}")
+    if not (args.enable_incremental_vacuum or args.apply_retention):
+        parser.print_help()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Analysis History Archive
+Cold analyses moved out of the database by the retention policy, kept as
+gzip-compressed JSON lines with one append-only file per month, and read
+back lazily when an archived analysis is opened
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections import OrderedDict
+
+from config import HISTORY_ARCHIVE_DIR
+
+
+class HistoryArchive:
+    """
+    Monthly gzip JSONL files of archived analyses
+
+    Each line is one analysis in the get_analysis_by_id format. Appending
+    adds a gzip member to the end of the month's file, so earlier data is
+    never rewritten. Reading starts at the member that holds the analysis
+    and keeps the last few loaded analyses in memory.
+    """
+
+    def __init__(self, archive_dir=HISTORY_ARCHIVE_DIR, cache_entries=16):
+        self.archive_dir = archive_dir
+        self.cache_entries = cache_entries
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+
+    def file_name(self, search_date):
+        """Archive file (relative to archive_dir) for an analysis date"""
+        return f"history-{(search_date or '0000-00')[:7]}.jsonl.gz"
+
+    def append(self, file_name, records):
+        """
+        Append analyses to one archive file and sync it to disk
+
+        Args:
+            file_name (str): Name returned by file_name()
+            records (list): Analysis dicts with 'id', summary fields,
+                'articles' and 'individual_results'
+
+        Returns:
+            int: Byte offset of the new gzip member, for load()
+        """
+        os.makedirs(self.archive_dir, exist_ok=True)
+        path = os.path.join(self.archive_dir, file_name)
+        with open(path, 'ab') as raw:
+            offset = raw.seek(0, os.SEEK_END)
+            with gzip.GzipFile(fileobj=raw, mode='wb') as f:
+                for record in records:
+                    f.write(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+        return offset
+
+    def load(self, file_name, analysis_id, offset=0):
+        """
+        Read one archived analysis
+
+        Args:
+            file_name (str): Archive file holding the analysis
+            analysis_id (int): Analysis id
+            offset (int): Offset returned by append(); decompression starts
+                there instead of at the beginning of the month
+
+        Returns:
+            dict: The analysis, or None if the file does not contain it
+        """
+        key = (file_name, analysis_id)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        record = None
+        path = os.path.join(self.archive_dir, file_name)
+        try:
+            with open(path, 'rb') as raw:
+                raw.seek(offset)
+                with gzip.GzipFile(fileobj=raw, mode='rb') as f:
+                    prefix = f'{{"id":{analysis_id},'.encode()
+                    for line in f:
+                        # Records are written with "id" first; only the
+                        # matching line is parsed
+                        if line.startswith(prefix):
+                            record = json.loads(line)
+                            break
+        except (OSError, EOFError, ValueError) as e:
+            print(f"Error reading archived analysis {analysis_id} from {path}: {e}")
+            return None
+
+        if record is not None:
+            with self._lock:
+                self._cache[key] = record
+                while len(self._cache) > self.cache_entries:
+                    self._cache.popitem(last=False)
+        return record
+
+    def iter_records(self, file_name):
+        """Stream every analysis in one archive file"""
+        with gzip.open(os.path.join(self.archive_dir, file_name), 'rt', encoding='utf-8') as f:
+            for line in f:
+                yield json.loads(line)
@@ -0,0 +1,249 @@
+"""
+Article Image Cache
+Downloads each article image once, stores a downscaled thumbnail on disk
+(with an LRU size limit) and serves the local bytes to st.image
+"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+from config import (
+    IMAGE_CACHE_DIR, IMAGE_CACHE_MAX_MB, IMAGE_THUMBNAIL_SIZE,
+    IMAGE_FETCH_TIMEOUT, IMAGE_FETCH_WORKERS, IMAGE_RETRY_AFTER
+)
+
+# Publisher images larger than this are not worth downloading for a thumbnail
+MAX_DOWNLOAD_BYTES = 10 * 1024 * 1024
+
+
+def make_thumbnail(data, size=IMAGE_THUMBNAIL_SIZE):
+    """
+    Downscale image bytes to a JPEG thumbnail
+
+    Returns the original bytes unchanged if Pillow is not available.
+    """
+    try:
+        from PIL import Image
+    except ImportError:
+        return data
+
+    with Image.open(io.BytesIO(data)) as image:
+        image.thumbnail((size, size))
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=80, optimize=True)
+        return output.getvalue()
+
+
+def make_placeholder(size=IMAGE_THUMBNAIL_SIZE):
+    """Plain light-gray placeholder image (None if Pillow is not available)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+
+    output = io.BytesIO()
+    Image.new("RGB", (size, size * 2 // 3), (224, 224, 224)).save(output, format="PNG")
+    return output.getvalue()
+
+
+class ImageCache:
+    """
+    Disk-backed LRU cache of image thumbnails
+
+    Downloads run on a small thread pool, and every URL is fetched at most once
+    at a time. get() waits only a short time; if the image is not ready it
+    returns the placeholder and the download keeps going for the next rerun.
+    A failed URL is not requested again until retry_after seconds have passed.
+    """
+
+    def __init__(self, cache_dir=IMAGE_CACHE_DIR, max_bytes=IMAGE_CACHE_MAX_MB * 1024 * 1024,
+                 timeout=IMAGE_FETCH_TIMEOUT, max_workers=IMAGE_FETCH_WORKERS,
+                 retry_after=IMAGE_RETRY_AFTER):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="image-cache")
+        self._lock = threading.Lock()
+        self._pending = {}
+        # url -> time.monotonic() of the failed download
+        self._failed = {}
+        self._placeholder = None
+        self._placeholder_ready = False
+
+        # Least recently used first: file name -> size in bytes
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name.endswith(".jpg") and os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._index[name] = size
+            self._total_bytes += size
+
+    @staticmethod
+    def _file_name(url):
+        return hashlib.sha1(url.encode()).hexdigest() + ".jpg"
+
+    def placeholder(self):
+        """Bytes shown for missing, failed or slow images"""
+        if not self._placeholder_ready:
+            self._placeholder = make_placeholder()
+            self._placeholder_ready = True
+        return self._placeholder
+
+    def _download(self, url, name):
+        import requests
+
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with requests.get(url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                chunks = []
+                received = 0
+                for chunk in response.iter_content(64 * 1024):
+                    received += len(chunk)
+                    if received > MAX_DOWNLOAD_BYTES:
+                        raise ValueError("image too large")
+                    chunks.append(chunk)
+            thumbnail = make_thumbnail(b"".join(chunks))
+
+            with open(tmp_path, "wb") as f:
+                f.write(thumbnail)
+            os.replace(tmp_path, path)
+            with self._lock:
+                self._total_bytes += len(thumbnail) - self._index.pop(name, 0)
+                self._index[name] = len(thumbnail)
+                self._evict()
+        except Exception as e:
+            with self._lock:
+                self._failed[url] = time.monotonic()
+            print(f"Image cache: could not fetch {url}: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return None
+        finally:
+            # Never leave the URL pending, or every later get() would wait
+            # on this finished future
+            with self._lock:
+                self._pending.pop(url, None)
+        return thumbnail
+
+    def _evict(self):
+        """Drop least recently used thumbnails until under the size limit"""
+        while self._total_bytes > self.max_bytes and len(self._index) > 1:
+            name, size = self._index.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+    def _submit(self, url):
+        """Start downloading url unless it is cached, pending or known bad"""
+        name = self._file_name(url)
+        with self._lock:
+            if name in self._index:
+                return None
+            failed_at = self._failed.get(url)
+            if failed_at is not None:
+                if time.monotonic() - failed_at < self.retry_after:
+                    return None
+                del self._failed[url]
+            future = self._pending.get(url)
+            if future is None:
+                future = self._executor.submit(self._download, url, name)
+                self._pending[url] = future
+            return future
+
+    def prefetch(self, urls):
+        """Queue downloads for images about to be displayed"""
+        for url in urls:
+            if url:
+                self._submit(url)
+
+    def get(self, url, timeout=None):
+        """
+        Get thumbnail bytes for an image URL
+
+        Args:
+            url (str): Remote image URL
+            timeout (float): Seconds to wait for a download in progress
+
+        Returns:
+            bytes: Thumbnail, or the placeholder if the image is missing,
+                failed or not ready in time (None if no placeholder exists)
+        """
+        if not url:
+            return self.placeholder()
+
+        name = self._file_name(url)
+        with self._lock:
+            cached = name in self._index
+            if cached:
+                self._index.move_to_end(name)
+        if cached:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                # Keep recency across restarts, the index is rebuilt by mtime
+                os.utime(path)
+                return data
+            except OSError:
+                with self._lock:
+                    self._total_bytes -= self._index.pop(name, 0)
+
+        future = self._submit(url)
+        if future is None:
+            return self.placeholder()
+        try:
+            thumbnail = future.result(timeout=self.timeout if timeout is None else timeout)
+        except TimeoutError:
+            return self.placeholder()
+        return thumbnail or self.placeholder()
+
+    def get_many(self, urls):
+        """
+        Get thumbnails for a page of images, downloading them concurrently
+
+        All images share one timeout, so a page with several slow publishers
+        waits at most `timeout` seconds in total.
+
+        Returns:
+            dict: url -> thumbnail or placeholder bytes
+        """
+        urls = [url for url in dict.fromkeys(urls) if url]
+        self.prefetch(urls)
+        deadline = time.monotonic() + self.timeout
+        return {
+            url: self.get(url, timeout=max(deadline - time.monotonic(), 0))
+            for url in urls
+        }
+
+
+# Singleton instance for easy import
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+def get_image_cache():
+    """Get singleton instance of ImageCache built from config"""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = ImageCache()
+        return _cache_instance
@@ -0,0 +1,234 @@
+"""
+News Fetcher Module
+Fetches political news from News API, one page or many pages at a time
+"""
+
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+from api_key_pool import NoAvailableKeyError
+from news_sources import NewsSourceError
+from config import (
+    NEWS_API_BASE_URL, NEWS_API_RECORD_DIR,
+    NEWS_API_RESULT_LIMIT, NEWS_API_PAGE_SIZE, NEWS_API_FETCH_WORKERS
+)
+
+# Map sort_by option to API parameter
+SORT_MAPPING = {
+    "Latest": "publishedAt",
+    "Relevance": "relevancy",
+    "Popularity": "popularity"
+}
+
+
+class NewsAPIError(NewsSourceError):
+    """Raised when News API cannot return articles"""
+
+
+def build_query(party, state):
+    """Construct the News API search query for a party/state selection"""
+    query = f"{party}"
+    if state != "All States":
+        query += f" {state}"
+    query += " India politics"
+    return query
+
+
+def request_everything(params, key_pool, base_url=NEWS_API_BASE_URL):
+    """
+    Call the /v2/everything endpoint through the key pool
+
+    A key answering 401/429 is quarantined by the pool and the request is
+    retried with the next key, so each key gets at most one attempt.
+
+    Args:
+        params (dict): Query parameters without the API key
+        key_pool (APIKeyPool): Pool to draw keys from
+        base_url (str): News API server, e.g. a local stand-in
+
+    Returns:
+        dict: Decoded JSON response with status 'ok'
+
+    Raises:
+        NewsAPIError: If no key could complete the request
+    """
+    import requests
+    
+    if len(key_pool) == 0:
+        raise NewsAPIError("No News API key configured")
+
+    for _ in range(len(key_pool)):
+        try:
+            api_key = key_pool.acquire()
+        except NoAvailableKeyError as e:
+            raise NewsAPIError(str(e))
+
+        try:
+            response = requests.get(f"{base_url}/v2/everything",
+                                    params={**params, 'apiKey': api_key}, timeout=10)
+        except requests.exceptions.RequestException as e:
+            raise NewsAPIError(str(e))
+
+        if response.status_code in (401, 429):
+            try:
+                error_code = response.json().get('code')
+            except ValueError:
+                error_code = None
+            key_pool.report(api_key, response.status_code, error_code)
+            continue
+        key_pool.report(api_key, response.status_code)
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            raise NewsAPIError(str(e))
+
+        try:
+            data = response.json()
+        except ValueError:
+            raise NewsAPIError(f"News API returned a non-JSON response (HTTP {response.status_code})")
+        if data.get('status') != 'ok':
+            raise NewsAPIError(data.get('message', 'News API returned an error'))
+        if NEWS_API_RECORD_DIR:
+            from newsapi_standin import record_fixture
+            record_fixture(NEWS_API_RECORD_DIR, params, data)
+        return data
+
+    raise NewsAPIError("All News API keys were rejected or rate limited")
+
+
+def fetch_news(party, state, key_pool, max_articles=10, sort_by="Latest",
+               base_url=NEWS_API_BASE_URL):
+    """
+    Fetch a single page of news articles
+
+    Args:
+        party (str): Political party to search for
+        state (str): State/UT name or "All States"
+        key_pool (APIKeyPool): Pool to draw keys from
+        max_articles (int): Page size (News API allows up to 100)
+        sort_by (str): "Latest", "Relevance" or "Popularity"
+        base_url (str): News API server
+
+    Returns:
+        list: Article dictionaries as returned by News API
+
+    Raises:
+        NewsAPIError: If the request fails
+    """
+    params = {
+        'q': build_query(party, state),
+        'language': 'en',
+        'sortBy': SORT_MAPPING.get(sort_by, 'publishedAt'),
+        'pageSize': max_articles
+    }
+    return request_everything(params, key_pool, base_url)['articles']
+
+
+def fetch_news_pages(party, state, key_pool, max_articles=100, sort_by="Latest",
+                     oldest=None, newest=None, page_size=NEWS_API_PAGE_SIZE,
+                     max_workers=NEWS_API_FETCH_WORKERS, info=None,
+                     base_url=NEWS_API_BASE_URL):
+    """
+    Fetch many pages of news articles, yielding each page as it is ready
+
+    The first page tells us how many results exist; the remaining pages
+    (capped by max_articles and the account's result limit) are requested
+    concurrently but yielded in page order, so callers can score page 1
+    while later pages are still downloading. Articles are deduplicated by
+    URL across pages.
+
+    Args:
+        party (str): Political party to search for
+        state (str): State/UT name or "All States"
+        key_pool (APIKeyPool): Pool to draw keys from
+        max_articles (int): Stop once this many unique articles were yielded
+        sort_by (str): "Latest", "Relevance" or "Popularity"
+        oldest (str): Optional ISO date/time cut-off; older articles are dropped
+            and, when sorting by date, fetching stops at the first one
+        newest (str): Optional ISO date/time; only articles published up to
+            then are requested (News API's `to`), to page back past the
+            result limit
+        page_size (int): Articles per request (News API allows up to 100)
+        max_workers (int): Concurrent page requests
+        info (dict): Optional; 'total_results' is set from the first
+            response, so callers can tell a capped fetch from a complete one
+        base_url (str): News API server
+
+    Yields:
+        list: New unique articles from each page (possibly empty)
+
+    Raises:
+        NewsAPIError: If the first page cannot be fetched
+    """
+    page_size = max(1, min(page_size, 100, max_articles))
+    params = {
+        'q': build_query(party, state),
+        'language': 'en',
+        'sortBy': SORT_MAPPING.get(sort_by, 'publishedAt'),
+        'pageSize': page_size
+    }
+    if oldest:
+        params['from'] = oldest
+    if newest:
+        params['to'] = newest
+    by_date = params['sortBy'] == 'publishedAt'
+
+    seen_urls = set()
+    yielded = 0
+
+    def take(articles):
+        """Filter a page down to new articles; return (articles, stop)"""
+        nonlocal yielded
+        fresh = []
+        for article in articles:
+            published = article.get('publishedAt') or ''
+            if oldest and published and published < oldest:
+                if by_date:
+                    return fresh, True
+                continue
+            url = article.get('url')
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            fresh.append(article)
+            yielded += 1
+            if yielded >= max_articles:
+                return fresh, True
+        return fresh, False
+
+    first = request_everything({**params, 'page': 1}, key_pool, base_url)
+    if info is not None:
+        info['total_results'] = first.get('totalResults', 0)
+    fresh, stop = take(first.get('articles', []))
+    yield fresh
+    if stop:
+        return
+
+    reachable = min(first.get('totalResults', 0), NEWS_API_RESULT_LIMIT, max_articles)
+    last_page = math.ceil(reachable / page_size)
+    if last_page <= 1:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    futures = [
+        executor.submit(request_everything, {**params, 'page': page}, key_pool, base_url)
+        for page in range(2, last_page + 1)
+    ]
+    try:
+        for future in futures:
+            try:
+                data = future.result()
+            except NewsAPIError:
+                # A later page failing (e.g. quota ran out) ends the stream
+                # but keeps what was already fetched
+                break
+            fresh, stop = take(data.get('articles', []))
+            yield fresh
+            if stop:
+                break
+    finally:
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
@@ -0,0 +1,344 @@
+"""
+Background News Ingester
+Polls a watch-list of party/state queries, scores new articles as they
+arrive and keeps them in the local database so pages can load instantly
+"""
+
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from config import (
+    DATABASE_PATH, INGEST_WATCH_LIST, INGEST_INTERVAL, INGEST_MAX_ARTICLES,
+    NEWS_API_BASE_URL, NEWS_API_RESULT_LIMIT
+)
+from news_fetcher import fetch_news_pages, NewsAPIError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingested_articles (
+    party VARCHAR(100) NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    url TEXT NOT NULL,
+    published_at VARCHAR(30),
+    article_json JSON NOT NULL,
+    sentiment_json JSON NOT NULL,
+    ingested_at DATETIME,
+    PRIMARY KEY (party, state, url)
+);
+CREATE INDEX IF NOT EXISTS ix_ingested_articles_recent
+    ON ingested_articles (party, state, published_at);
+CREATE TABLE IF NOT EXISTS ingest_state (
+    party VARCHAR(100) NOT NULL,
+    state VARCHAR(100) NOT NULL,
+    last_published_at VARCHAR(30),
+    last_polled_at DATETIME,
+    PRIMARY KEY (party, state)
+);
+"""
+
+
+def _connect(db_path):
+    conn = sqlite3.connect(db_path, timeout=30)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def get_last_seen(party, state, db_path=DATABASE_PATH):
+    """Get the newest publishedAt already ingested for a query (or None)"""
+    conn = _connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT last_published_at FROM ingest_state WHERE party = ? AND state = ?",
+            (party, state)
+        ).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def store_articles(party, state, articles, sentiments, db_path=DATABASE_PATH):
+    """
+    Store scored articles for a query
+
+    The last-seen marker is not moved here; see advance_last_seen.
+
+    Args:
+        party (str): Watched party
+        state (str): Watched state
+        articles (list): Article dictionaries
+        sentiments (list): Matching results from analyze_article
+        db_path (str): SQLite database file
+
+    Returns:
+        int: Number of articles that were not stored before
+    """
+    now = datetime.now().isoformat(timespec='seconds')
+    rows = [
+        (party, state, article['url'], article.get('publishedAt'),
+         json.dumps(article), json.dumps(sentiment), now)
+        for article, sentiment in zip(articles, sentiments)
+        if article.get('url')
+    ]
+
+    conn = _connect(db_path)
+    try:
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO ingested_articles "
+                "(party, state, url, published_at, article_json, sentiment_json, ingested_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            return conn.total_changes - before
+    finally:
+        conn.close()
+
+
+def advance_last_seen(party, state, newest, db_path=DATABASE_PATH):
+    """
+    Record a finished poll and move the query's last-seen marker forward
+
+    Args:
+        party (str): Watched party
+        state (str): Watched state
+        newest (str): Newest publishedAt now stored (None keeps the marker)
+        db_path (str): SQLite database file
+    """
+    now = datetime.now().isoformat(timespec='seconds')
+    conn = _connect(db_path)
+    try:
+        with conn:
+            conn.execute(
+                "INSERT INTO ingest_state (party, state, last_published_at, last_polled_at) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (party, state) DO UPDATE SET "
+                "last_published_at = NULLIF(MAX(COALESCE(last_published_at, ''), "
+                "COALESCE(excluded.last_published_at, '')), ''), "
+                "last_polled_at = excluded.last_polled_at",
+                (party, state, newest or None, now)
+            )
+    finally:
+        conn.close()
+
+
+def get_ingested_articles(party, state, limit=None, db_path=DATABASE_PATH):
+    """
+    Read stored articles and their scores for a query, newest first
+
+    Args:
+        party (str): Watched party
+        state (str): Watched state
+        limit (int): Optional maximum number of articles
+        db_path (str): SQLite database file
+
+    Returns:
+        tuple: (articles, analysis_results) in the analyze_articles_batch
+            format, or (None, None) if nothing is stored yet
+    """
+    from sentiment_analyzer import SentimentStats
+
+    sql = (
+        "SELECT article_json, sentiment_json FROM ingested_articles "
+        "WHERE party = ? AND state = ? ORDER BY published_at DESC"
+    )
+    params = [party, state]
+    if limit:
+        sql += " LIMIT ?"
+        params.append(limit)
+
+    conn = _connect(db_path)
+    try:
+        rows = conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+    if not rows:
+        return None, None
+
+    articles = []
+    individual_results = []
+    stats = SentimentStats()
+    for article_json, sentiment_json in rows:
+        sentiment = json.loads(sentiment_json)
+        articles.append(json.loads(article_json))
+        individual_results.append(sentiment)
+        stats.add(sentiment)
+
+    return articles, {
+        'individual_results': individual_results,
+        'overall_statistics': stats.to_dict()
+    }
+
+
+def count_ingested_articles(party, state, db_path=DATABASE_PATH):
+    """Count the articles stored for a query"""
+    conn = _connect(db_path)
+    try:
+        return conn.execute(
+            "SELECT COUNT(*) FROM ingested_articles WHERE party = ? AND state = ?",
+            (party, state)
+        ).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def iter_ingested_articles(party, state, db_path=DATABASE_PATH, batch_size=500):
+    """
+    Stream stored articles and their scores for a query, newest first
+
+    Rows are read batch_size at a time, so any number of stored articles
+    can be walked without loading them all.
+
+    Yields:
+        tuple: (article, sentiment) in the analyze_article format
+    """
+    conn = _connect(db_path)
+    try:
+        cursor = conn.execute(
+            "SELECT article_json, sentiment_json FROM ingested_articles "
+            "WHERE party = ? AND state = ? ORDER BY published_at DESC",
+            (party, state)
+        )
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for article_json, sentiment_json in rows:
+                yield json.loads(article_json), json.loads(sentiment_json)
+    finally:
+        conn.close()
+
+
+def is_watched(party, state, watch_list=INGEST_WATCH_LIST):
+    """Check whether a party/state selection is on the watch-list"""
+    return (party, state) in watch_list
+
+
+class NewsIngester(threading.Thread):
+    """
+    Daemon thread that polls every watched query on an interval
+
+    Each poll passes the query's last-seen publishedAt as News API's `from`
+    parameter, so only articles newer than what is already stored are pulled.
+    """
+
+    def __init__(self, key_pool, watch_list=INGEST_WATCH_LIST, interval=INGEST_INTERVAL,
+                 max_articles=INGEST_MAX_ARTICLES, db_path=DATABASE_PATH,
+                 base_url=NEWS_API_BASE_URL):
+        super().__init__(name="news-ingester", daemon=True)
+        self.key_pool = key_pool
+        self.watch_list = list(watch_list)
+        self.interval = interval
+        self.max_articles = max_articles
+        self.db_path = db_path
+        self.base_url = base_url
+        self._stop_event = threading.Event()
+        self.last_errors = {}
+
+    def poll_query(self, party, state):
+        """
+        Pull, score and store new articles for one query
+
+        Results come newest first and each fetch is capped, so when more
+        articles arrived since the last poll than one fetch returns, the
+        query pages back (News API's `to`) until it reaches the last-seen
+        marker, i.e. until News API reports no more results than one fetch
+        takes. The marker only moves once that gap is closed; a poll that
+        fails part way repeats it next round.
+
+        Returns:
+            int: Number of newly stored articles
+        """
+        from sentiment_analyzer import get_analyzer
+
+        analyzer = get_analyzer()
+        last_seen = get_last_seen(party, state, self.db_path)
+        full_fetch = min(self.max_articles, NEWS_API_RESULT_LIMIT)
+
+        inserted = 0
+        newest = None
+        upper = None
+        while True:
+            info = {}
+            pages = fetch_news_pages(
+                party, state, self.key_pool, self.max_articles, "Latest",
+                oldest=last_seen, newest=upper, info=info, base_url=self.base_url
+            )
+            fetch_oldest = None
+            for page, page_results, _ in analyzer.analyze_pages(pages, target_party=party):
+                if not page:
+                    continue
+                inserted += store_articles(party, state, page, page_results, self.db_path)
+                dates = [article['publishedAt'] for article in page if article.get('publishedAt')]
+                if dates:
+                    newest = max(newest or '', max(dates))
+                    fetch_oldest = min(fetch_oldest or max(dates), min(dates))
+
+            # Every result since last_seen fit in this fetch. On the first
+            # poll there is no marker to reach; take the newest.
+            if (last_seen is None or info.get('total_results', 0) <= full_fetch
+                    or fetch_oldest is None or (upper is not None and fetch_oldest >= upper)):
+                break
+            upper = fetch_oldest
+
+        advance_last_seen(party, state, newest, self.db_path)
+        return inserted
+
+    def poll_once(self):
+        """
+        Poll every watched query once
+
+        Returns:
+            dict: Newly stored article count per (party, state)
+        """
+        counts = {}
+        for party, state in self.watch_list:
+            if self._stop_event.is_set():
+                break
+            try:
+                counts[(party, state)] = self.poll_query(party, state)
+                self.last_errors.pop((party, state), None)
+            except NewsAPIError as e:
+                # Keep polling the other queries; this one retries next round
+                self.last_errors[(party, state)] = str(e)
+                print(f"Ingestion failed for {party} / {state}: {e}")
+            except Exception as e:
+                # e.g. "database is locked" or a malformed response: log it
+                # and move on rather than let the thread die silently
+                self.last_errors[(party, state)] = f"{e.__class__.__name__}: {e}"
+                print(f"Unexpected ingestion error for {party} / {state}: "
+                      f"{e.__class__.__name__}: {e}")
+        return counts
+
+    def run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                print(f"Ingestion round failed: {e.__class__.__name__}: {e}")
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        """Ask the thread to finish after the current query"""
+        self._stop_event.set()
+
+
+# Singleton instance for easy import
+_ingester_instance = None
+_ingester_lock = threading.Lock()
+
+def start_ingester(key_pool):
+    """
+    Start the background ingester once per process
+
+    Returns:
+        NewsIngester: The running ingester, or None if nothing is watched
+    """
+    global _ingester_instance
+    with _ingester_lock:
+        if _ingester_instance is None and INGEST_WATCH_LIST and len(key_pool) > 0:
+            _ingester_instance = NewsIngester(key_pool)
+            _ingester_instance.start()
+        return _ingester_instance
@@ -0,0 +1,358 @@
+"""
+News Source Adapters
+Common interface over News API and RSS/Atom feeds; every source yields
+pages of article dicts in the News API shape that analyze_article consumes
+"""
+
+import abc
+import html
+import os
+import re
+import threading
+import xml.etree.ElementTree as ET
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+from config import RSS_FEEDS, RSS_MAX_ITEMS_PER_FEED
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+DC_NS = "{http://purl.org/dc/elements/1.1/}"
+CONTENT_NS = "{http://purl.org/rss/1.0/modules/content/}"
+MEDIA_NS = "{http://search.yahoo.com/mrss/}"
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+class NewsSourceError(Exception):
+    """Raised when a news source cannot return articles"""
+
+
+class NewsSource(abc.ABC):
+    """
+    Base class for news sources
+
+    Subclasses implement fetch() and yield pages (lists) of article dicts with
+    the keys source/author/title/description/url/urlToImage/publishedAt/content.
+    """
+
+    name = "source"
+
+    @abc.abstractmethod
+    def fetch(self, party, state, max_articles=100, sort_by="Latest", oldest=None):
+        """
+        Fetch articles about a party/state selection
+
+        Args:
+            party (str): Political party to search for
+            state (str): State/UT name or "All States"
+            max_articles (int): Maximum number of articles to yield
+            sort_by (str): "Latest", "Relevance" or "Popularity" (if supported)
+            oldest (str): Optional ISO date/time cut-off
+
+        Yields:
+            list: Pages of article dictionaries
+
+        Raises:
+            NewsSourceError: If the source cannot be read
+        """
+
+
+class NewsAPISource(NewsSource):
+    """News API adapter built on fetch_news_pages"""
+
+    name = "News API"
+
+    def __init__(self, key_pool):
+        self.key_pool = key_pool
+
+    def fetch(self, party, state, max_articles=100, sort_by="Latest", oldest=None):
+        from news_fetcher import fetch_news_pages
+        return fetch_news_pages(party, state, self.key_pool, max_articles, sort_by, oldest=oldest)
+
+
+def query_terms(party):
+    """
+    Split a party label into lowercase search terms
+
+    "Bharatiya Janata Party (BJP)" -> ["bharatiya janata party", "bjp"]
+    """
+    terms = []
+    full_name = re.sub(r"\([^)]*\)", "", party).strip()
+    if full_name:
+        terms.append(full_name.lower())
+    for abbreviation in re.findall(r"\(([^)]+)\)", party):
+        for part in re.split(r"[/-]", abbreviation):
+            if part.strip():
+                terms.append(part.strip().lower())
+        terms.append(abbreviation.strip().lower())
+    return terms
+
+
+def matches_query(article, party, state):
+    """Check whether a feed item is about the selected party (and state)"""
+    text = f"{article.get('title') or ''} {article.get('description') or ''}".lower()
+    if party and party != "Other":
+        if not any(re.search(rf"\b{re.escape(term)}\b", text) for term in query_terms(party)):
+            return False
+    if state and state != "All States" and state.lower() not in text:
+        return False
+    return True
+
+
+def _clean_text(text):
+    """Strip markup and entities from feed text"""
+    if not text:
+        return ""
+    return " ".join(html.unescape(_TAG_RE.sub(" ", text)).split())
+
+
+def _to_iso(value):
+    """Convert RSS (RFC 822) or Atom (RFC 3339) dates to News API's ISO format"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _normalize_item(elem, feed_title):
+    """Turn an RSS <item> or Atom <entry> element into an article dict"""
+    if elem.tag == f"{ATOM_NS}entry":
+        link = None
+        for link_elem in elem.findall(f"{ATOM_NS}link"):
+            if link_elem.get("rel", "alternate") == "alternate":
+                link = link_elem.get("href")
+                break
+        author = elem.findtext(f"{ATOM_NS}author/{ATOM_NS}name")
+        summary = elem.findtext(f"{ATOM_NS}summary")
+        content = elem.findtext(f"{ATOM_NS}content")
+        published = elem.findtext(f"{ATOM_NS}published") or elem.findtext(f"{ATOM_NS}updated")
+        title = elem.findtext(f"{ATOM_NS}title")
+    else:
+        link = elem.findtext("link")
+        author = elem.findtext(f"{DC_NS}creator") or elem.findtext("author")
+        summary = elem.findtext("description")
+        content = elem.findtext(f"{CONTENT_NS}encoded")
+        published = elem.findtext("pubDate") or elem.findtext(f"{DC_NS}date")
+        title = elem.findtext("title")
+
+    image = None
+    for media in elem.iter():
+        if media.tag in (f"{MEDIA_NS}content", f"{MEDIA_NS}thumbnail") and media.get("url"):
+            image = media.get("url")
+            break
+        if media.tag == "enclosure" and (media.get("type") or "").startswith("image"):
+            image = media.get("url")
+            break
+
+    description = _clean_text(summary or content)
+    return {
+        'source': {'id': None, 'name': feed_title or "RSS"},
+        'author': _clean_text(author) or None,
+        'title': _clean_text(title),
+        'description': description,
+        'url': (link or "").strip() or None,
+        'urlToImage': image,
+        'publishedAt': _to_iso(published),
+        'content': _clean_text(content) or description
+    }
+
+
+def iter_feed_items(stream, max_items=RSS_MAX_ITEMS_PER_FEED):
+    """
+    Incrementally parse an RSS 2.0 or Atom feed
+
+    Items are normalized and detached from the tree as soon as they are
+    complete, so memory stays flat however large the feed is.
+
+    Args:
+        stream: Binary file-like object with the feed XML
+        max_items (int): Stop after this many items
+
+    Yields:
+        dict: Normalized article dictionaries
+    """
+    feed_title = None
+    stack = []
+    count = 0
+    try:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            if elem.tag in ("item", f"{ATOM_NS}entry"):
+                yield _normalize_item(elem, feed_title)
+                count += 1
+                # Drop the finished item from its parent to keep memory flat
+                if stack:
+                    stack[-1].remove(elem)
+                if count >= max_items:
+                    return
+            elif (feed_title is None and elem.tag in ("title", f"{ATOM_NS}title")
+                    and stack and stack[-1].tag in ("channel", f"{ATOM_NS}feed")):
+                feed_title = _clean_text(elem.text)
+    except ET.ParseError as e:
+        raise NewsSourceError(f"Malformed feed: {e}")
+
+
+class RSSSource(NewsSource):
+    """
+    RSS/Atom feed adapter
+
+    Remote feeds are requested with If-None-Match/If-Modified-Since; on a 304
+    the items parsed last time are reused. Local files (plain paths or
+    file:// URLs) use the file's modification time the same way.
+    """
+
+    def __init__(self, feed_url, max_items=RSS_MAX_ITEMS_PER_FEED):
+        self.feed_url = feed_url
+        self.name = urlparse(feed_url).netloc or os.path.basename(feed_url)
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._etag = None
+        self._last_modified = None
+        self._items = []
+
+    def _local_path(self):
+        parsed = urlparse(self.feed_url)
+        if parsed.scheme == "file":
+            return url2pathname(parsed.path)
+        if parsed.scheme in ("http", "https"):
+            return None
+        return self.feed_url
+
+    def _load_local(self, path):
+        try:
+            modified = os.stat(path).st_mtime
+        except OSError as e:
+            raise NewsSourceError(f"Cannot read feed {path}: {e}")
+        if modified == self._last_modified:
+            return self._items
+        with open(path, "rb") as f:
+            items = list(iter_feed_items(f, self.max_items))
+        self._last_modified = modified
+        self._items = items
+        return items
+
+    def _load_remote(self):
+        import requests
+        import urllib3
+
+        headers = {}
+        if self._etag:
+            headers['If-None-Match'] = self._etag
+        if self._last_modified:
+            headers['If-Modified-Since'] = self._last_modified
+
+        try:
+            response = requests.get(self.feed_url, headers=headers, timeout=10, stream=True)
+            if response.status_code == 304:
+                response.close()
+                return self._items
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with response:
+                items = list(iter_feed_items(response.raw, self.max_items))
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            # The body is streamed while parsing, so a dropped connection
+            # surfaces as a urllib3 or socket error part way through
+            raise NewsSourceError(f"Error fetching feed {self.feed_url}: {e}")
+
+        self._etag = response.headers.get('ETag')
+        self._last_modified = response.headers.get('Last-Modified')
+        self._items = items
+        return items
+
+    def load_items(self):
+        """
+        Get all current feed items, re-downloading only if the feed changed
+
+        Returns:
+            list: Normalized article dictionaries
+        """
+        with self._lock:
+            path = self._local_path()
+            if path is not None:
+                return self._load_local(path)
+            return self._load_remote()
+
+    def fetch(self, party, state, max_articles=100, sort_by="Latest", oldest=None):
+        page = []
+        for article in self.load_items():
+            if oldest and (article.get('publishedAt') or '') < oldest:
+                continue
+            if matches_query(article, party, state):
+                page.append(article)
+                if len(page) >= max_articles:
+                    break
+        if sort_by == "Latest":
+            page.sort(key=lambda a: a.get('publishedAt') or '', reverse=True)
+        yield page
+
+
+def fetch_from_sources(sources, party, state, max_articles=100, sort_by="Latest", oldest=None):
+    """
+    Fetch from several sources in turn, deduplicating by URL across them
+
+    A failing source is skipped as long as another one returns articles.
+
+    Yields:
+        list: Pages of new unique articles
+
+    Raises:
+        NewsSourceError: If every source failed
+    """
+    seen_urls = set()
+    remaining = max_articles
+    errors = []
+    for source in sources:
+        if remaining <= 0:
+            break
+        try:
+            for page in source.fetch(party, state, remaining, sort_by, oldest):
+                fresh = []
+                for article in page:
+                    url = article.get('url')
+                    if url:
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                    fresh.append(article)
+                fresh = fresh[:remaining]
+                remaining -= len(fresh)
+                yield fresh
+                if remaining <= 0:
+                    break
+        except NewsSourceError as e:
+            errors.append(f"{source.name}: {e}")
+
+    if errors and len(errors) == len(sources):
+        raise NewsSourceError("; ".join(errors))
+
+
+# Singleton instances for easy import
+_rss_sources = None
+
+def get_sources(key_pool):
+    """
+    Get the configured sources: News API (if keys exist) plus RSS_FEEDS
+
+    RSS sources are created once so their conditional-GET state persists.
+    """
+    global _rss_sources
+    if _rss_sources is None:
+        _rss_sources = [RSSSource(url) for url in RSS_FEEDS]
+    sources = [NewsAPISource(key_pool)] if len(key_pool) > 0 else []
+    return sources + _rss_sources
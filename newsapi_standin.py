@@ -0,0 +1,272 @@
+"""
+News API Stand-in Server
+Serves the /v2/everything contract from local fixture files so fetching,
+caching and scoring can be load-tested offline without spending quota
+
+Usage:
+    python newsapi_standin.py --fixtures fixtures/newsapi --port 8765 \\
+        --latency 80 --jitter 40 --error-rate 0.01 --rate-limit-rate 0.05
+
+Then point the app at it:
+    NEWS_API_BASE_URL=http://127.0.0.1:8765 NEWS_API_KEYS=test streamlit run app.py
+
+Fixtures are recorded from the real API by running the app with
+NEWS_API_RECORD_DIR=fixtures/newsapi. A request with a recorded fixture is
+replayed exactly; any other request is answered from the pooled articles of
+all fixtures (plus --synthetic generated ones), paginated like News API.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Parameters that select different results; everything else (apiKey) is ignored
+FIXTURE_PARAMS = ('q', 'language', 'sortBy', 'pageSize', 'page', 'from', 'to')
+
+
+def _normalize_params(params):
+    """Reduce request parameters to the ones that identify a response"""
+    normalized = {
+        name: str(params[name]) for name in FIXTURE_PARAMS
+        if params.get(name) not in (None, '')
+    }
+    normalized.setdefault('page', '1')
+    normalized.setdefault('pageSize', '100')
+    return normalized
+
+
+def fixture_key(params):
+    """Stable file name stem for a request's parameters"""
+    canonical = json.dumps(_normalize_params(params), sort_keys=True)
+    return hashlib.sha1(canonical.encode()).hexdigest()[:16]
+
+
+def record_fixture(fixture_dir, params, data):
+    """
+    Save one News API response as a replay fixture
+
+    Args:
+        fixture_dir (str): Directory holding fixture files
+        params (dict): Request parameters (the API key is never stored)
+        data (dict): Decoded JSON response
+    """
+    os.makedirs(fixture_dir, exist_ok=True)
+    path = os.path.join(fixture_dir, f"{fixture_key(params)}.json")
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({'params': _normalize_params(params), 'response': data}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_fixtures(fixture_dir):
+    """
+    Load fixture files from a directory
+
+    Returns:
+        tuple: (responses keyed by fixture_key, pooled unique articles)
+    """
+    responses = {}
+    pooled = {}
+    if fixture_dir and os.path.isdir(fixture_dir):
+        for name in sorted(os.listdir(fixture_dir)):
+            if not name.endswith('.json'):
+                continue
+            with open(os.path.join(fixture_dir, name)) as f:
+                fixture = json.load(f)
+            responses[fixture_key(fixture['params'])] = fixture['response']
+            for article in fixture['response'].get('articles', []):
+                pooled.setdefault(article.get('url'), article)
+    return responses, list(pooled.values())
+
+
+def synthetic_articles(count, seed=0):
+    """Generate deterministic fake articles for load tests"""
+    rng = random.Random(seed)
+    subjects = ['BJP', 'Congress', 'AAP', 'TMC', 'DMK', 'Shiv Sena', 'SP', 'BSP']
+    events = [
+        'wins by-election', 'faces criticism over policy', 'announces welfare scheme',
+        'suffers setback in polls', 'holds rally', 'slammed by opposition',
+        'celebrates historic victory', 'questioned over scandal'
+    ]
+    states = ['Maharashtra', 'Punjab', 'West Bengal', 'Tamil Nadu', 'Uttar Pradesh', 'Delhi']
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    articles = []
+    for i in range(count):
+        subject, event, state = rng.choice(subjects), rng.choice(events), rng.choice(states)
+        published = start + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        articles.append({
+            'source': {'id': None, 'name': f"Standin News {i % 7}"},
+            'author': f"Reporter {i % 13}",
+            'title': f"{subject} {event} in {state}",
+            'description': f"{subject} {event} as leaders in {state} react to the development.",
+            'url': f"https://standin.invalid/articles/{i}",
+            'urlToImage': None,
+            'publishedAt': published.strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'content': f"{subject} {event} in {state}. Full text unavailable in stand-in."
+        })
+    return articles
+
+
+class StandinConfig:
+    """Behaviour knobs shared by all request handlers"""
+
+    def __init__(self, responses, corpus, latency=0, jitter=0, error_rate=0.0,
+                 rate_limit_rate=0.0, invalid_keys=(), seed=0):
+        self.responses = responses
+        # Pooled articles, newest first, for requests without an exact fixture
+        self.corpus = sorted(corpus, key=lambda a: a.get('publishedAt') or '', reverse=True)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.invalid_keys = set(invalid_keys)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'replayed': 0, 'pooled': 0, 'errors': 0, 'rate_limited': 0, 'unauthorized': 0}
+
+    def roll(self):
+        """Draw (delay_seconds, fault) deterministically for the next request"""
+        with self._lock:
+            self.stats['requests'] += 1
+            delay = max(self.latency + self._rng.uniform(-self.jitter, self.jitter), 0) / 1000
+            draw = self._rng.random()
+            if draw < self.rate_limit_rate:
+                fault = 429
+            elif draw < self.rate_limit_rate + self.error_rate:
+                fault = 500
+            else:
+                fault = None
+            return delay, fault
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def pooled_response(self, params):
+        """Answer from the pooled corpus, honouring from/to and pagination"""
+        articles = self.corpus
+        if params.get('from'):
+            articles = [a for a in articles if (a.get('publishedAt') or '') >= params['from']]
+        if params.get('to'):
+            articles = [a for a in articles if (a.get('publishedAt') or '') <= params['to']]
+        page_size = min(int(params.get('pageSize', 100)), 100)
+        page = max(int(params.get('page', 1)), 1)
+        start = (page - 1) * page_size
+        return {
+            'status': 'ok',
+            'totalResults': len(articles),
+            'articles': articles[start:start + page_size]
+        }
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    """HTTP handler implementing GET /v2/everything"""
+
+    config = None  # Set on the server-specific subclass by make_server
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/v2/everything':
+            self._send_json(404, {'status': 'error', 'code': 'notFound', 'message': 'Unknown endpoint'})
+            return
+
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        config = self.config
+        delay, fault = config.roll()
+        if delay:
+            time.sleep(delay)
+
+        if not params.get('apiKey') or params['apiKey'] in config.invalid_keys:
+            config.count('unauthorized')
+            self._send_json(401, {'status': 'error', 'code': 'apiKeyInvalid',
+                                  'message': 'Your API key is invalid or incorrect.'})
+        elif fault == 429:
+            config.count('rate_limited')
+            self._send_json(429, {'status': 'error', 'code': 'rateLimited',
+                                  'message': 'You have made too many requests recently.'})
+        elif fault == 500:
+            config.count('errors')
+            self._send_json(500, {'status': 'error', 'code': 'unexpectedError',
+                                  'message': 'Injected stand-in failure.'})
+        else:
+            data = config.responses.get(fixture_key(params))
+            if data is not None:
+                config.count('replayed')
+            else:
+                config.count('pooled')
+                data = config.pooled_response(params)
+            self._send_json(200, data)
+
+    def log_message(self, format, *args):
+        # Keep load-test output readable
+        pass
+
+
+def make_server(config, host='127.0.0.1', port=8765):
+    """
+    Create a threaded stand-in server (call serve_forever to run it)
+
+    Args:
+        config (StandinConfig): Fixtures and fault-injection settings
+        host (str): Interface to bind
+        port (int): Port to bind (0 picks a free port)
+
+    Returns:
+        ThreadingHTTPServer: The server; server.server_address has the port
+    """
+    handler = type('BoundStandinHandler', (StandinHandler,), {'config': config})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline stand-in for News API /v2/everything")
+    parser.add_argument('--fixtures', default='fixtures/newsapi', help='Directory of recorded fixtures')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0, help='Mean added latency in ms')
+    parser.add_argument('--jitter', type=float, default=0, help='Latency jitter in ms (+/-)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 500')
+    parser.add_argument('--rate-limit-rate', type=float, default=0.0, help='Fraction of requests answered with 429')
+    parser.add_argument('--invalid-key', action='append', default=[], help='API key to answer with 401 (repeatable)')
+    parser.add_argument('--synthetic', type=int, default=0, help='Add N generated articles to the pooled corpus')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for latency, faults and synthetic data')
+    args = parser.parse_args()
+
+    responses, corpus = load_fixtures(args.fixtures)
+    corpus += synthetic_articles(args.synthetic, args.seed)
+    config = StandinConfig(
+        responses, corpus, latency=args.latency, jitter=args.jitter,
+        error_rate=args.error_rate, rate_limit_rate=args.rate_limit_rate,
+        invalid_keys=args.invalid_key, seed=args.seed
+    )
+    server = make_server(config, args.host, args.port)
+    print(f"News API stand-in on http://{args.host}:{server.server_address[1]} "
+          f"({len(responses)} fixtures, {len(config.corpus)} pooled articles)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"Served: {config.stats}")
+
+
+if __name__ == '__main__':
+    main()
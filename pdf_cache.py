@@ -0,0 +1,261 @@
+"""
+PDF Report Cache
+Keeps rendered report bytes keyed by a fingerprint of the report data, in a
+small in-memory LRU backed by a larger on-disk LRU, so repeat exports of
+the same analysis are instant; the user and time are stamped onto a cached
+report when it is downloaded
+"""
+
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+from config import PDF_CACHE_DIR, PDF_CACHE_MEMORY_MB, PDF_CACHE_DISK_MB, PDF_CHART_BACKEND
+
+# Bump when the report layout changes so old cached reports are not served
+REPORT_VERSION = "3"
+
+# Per-download report fields are drawn through form XObjects named
+# "<prefix>_<field>_<n>" (see pdf_generator.StampField)
+STAMP_FORM_PREFIX = "stamp"
+REPORT_TIME_FORMAT = "%B %d, %Y at %I:%M %p"
+
+
+def report_fingerprint(data):
+    """
+    Hash the report data into a cache key
+
+    The generation time is not part of the data and the username is
+    dropped, so users exporting the same analysis share one report;
+    stamp_report writes both onto it at download time.
+
+    Args:
+        data (dict): Report data as taken by generate_sentiment_pdf
+
+    Returns:
+        str: Hex digest; equal data gives equal keys
+    """
+    data = {k: v for k, v in data.items() if k != 'username'}
+    canonical = json.dumps(data, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha256()
+    digest.update(f"{REPORT_VERSION}|{PDF_CHART_BACKEND}|".encode())
+    digest.update(canonical.encode())
+    return digest.hexdigest()
+
+
+def _pdf_string(text):
+    """Encode text as a PDF literal string for a WinAnsi-encoded font"""
+    raw = text.encode("cp1252", errors="replace")
+    return b"(" + re.sub(rb"([\\()])", rb"\\\1", raw) + b")"
+
+
+def _decode_stream(header, raw):
+    """Undo the ASCII85/Flate filters ReportLab applies to a stream"""
+    match = re.search(rb"/Filter\s*(\[[^\]]*\]|/\w+)", header)
+    for name in re.findall(rb"/(\w+)", match.group(1)) if match else []:
+        if name == b"ASCII85Decode":
+            raw = raw.strip()
+            raw = base64.a85decode(raw[:-2] if raw.endswith(b"~>") else raw)
+        elif name == b"FlateDecode":
+            raw = zlib.decompress(raw)
+        else:
+            raise ValueError(f"unsupported PDF filter {name.decode()}")
+    return raw
+
+
+def stamp_report(pdf, **fields):
+    """
+    Write per-download fields onto a rendered report
+
+    Each field's form XObject gets a new version with the text replaced,
+    appended as an incremental update (new objects, xref section and
+    trailer), so the report is not rendered again and the cached bytes are
+    left untouched.
+
+    Args:
+        pdf (bytes): Report from generate_sentiment_pdf_bytes
+        **fields: Text by field name, e.g. username="alice"
+
+    Returns:
+        bytes: The stamped report (pdf itself if there is nothing to stamp)
+    """
+    pattern = rb"/FormXob\.%s_(\w+?)_\d+ (\d+) 0 R" % STAMP_FORM_PREFIX.encode()
+    objects = {}
+    for match in re.finditer(pattern, pdf):
+        field = match.group(1).decode()
+        if field in fields:
+            objects[int(match.group(2))] = fields[field]
+
+    updates = []
+    for number, text in sorted(objects.items()):
+        match = re.search(rb"\n%d 0 obj\s*<<(.*?)>>\s*stream\r?\n" % number, pdf, re.S)
+        if match is None:
+            continue
+        header = match.group(1)
+        length = int(re.search(rb"/Length (\d+)", header).group(1))
+        content = _decode_stream(header, pdf[match.end():match.end() + length])
+        content = re.sub(rb"\((?:\\.|[^\\)])*\) Tj", lambda _: _pdf_string(text) + b" Tj",
+                         content, count=1)
+        header = re.sub(rb"/Filter\s*(\[[^\]]*\]|/\w+)", b"", header)
+        header = re.sub(rb"/Length \d+", b"/Length %d" % len(content), header)
+        updates.append((number, header, content))
+    if not updates:
+        return pdf
+
+    trailer = list(re.finditer(rb"trailer\s*<<(.*?)>>\s*startxref\s*(\d+)", pdf, re.S))[-1]
+    out = bytearray(pdf)
+    if not out.endswith(b"\n"):
+        out += b"\n"
+    offsets = []
+    for number, header, content in updates:
+        offsets.append((number, len(out)))
+        out += b"%d 0 obj\n<<%s>>\nstream\n%s\nendstream\nendobj\n" % (number, header, content)
+    xref = len(out)
+    out += b"xref\n"
+    for number, offset in offsets:
+        out += b"%d 1\n%010d 00000 n \n" % (number, offset)
+    body = re.sub(rb"/Prev \d+", b"", trailer.group(1))
+    out += b"trailer\n<<%s/Prev %s\n>>\nstartxref\n%d\n%%%%EOF\n" % (body, trailer.group(2), xref)
+    return bytes(out)
+
+
+class PDFCache:
+    """
+    Two-tier LRU cache of rendered reports
+
+    Memory holds the most recently used reports up to memory_bytes; every
+    report is also written to cache_dir, which is trimmed to disk_bytes and
+    survives restarts (its LRU order is rebuilt from file modification times).
+    """
+
+    def __init__(self, cache_dir=PDF_CACHE_DIR, memory_bytes=PDF_CACHE_MEMORY_MB * 1024 * 1024,
+                 disk_bytes=PDF_CACHE_DISK_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.memory_bytes = memory_bytes
+        self.disk_bytes = disk_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # Least recently used first: key -> bytes / key -> size on disk
+        self._memory = OrderedDict()
+        self._memory_total = 0
+        self._disk = OrderedDict()
+        self._disk_total = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        entries = []
+        for name in os.listdir(cache_dir):
+            path = os.path.join(cache_dir, name)
+            if name.endswith(".pdf") and os.path.isfile(path):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name[:-4], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._disk[key] = size
+            self._disk_total += size
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pdf")
+
+    def _remember(self, key, pdf_bytes):
+        """Put bytes in the memory tier (call with the lock held)"""
+        self._memory_total += len(pdf_bytes) - len(self._memory.pop(key, b""))
+        self._memory[key] = pdf_bytes
+        while self._memory_total > self.memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_total -= len(evicted)
+
+    def get(self, key):
+        """
+        Get a cached report
+
+        Returns:
+            bytes: The PDF, or None if it is not cached
+        """
+        with self._lock:
+            pdf_bytes = self._memory.get(key)
+            if pdf_bytes is not None:
+                self._memory.move_to_end(key)
+                if key in self._disk:
+                    self._disk.move_to_end(key)
+                self.hits += 1
+                return pdf_bytes
+            on_disk = key in self._disk
+            if on_disk:
+                self._disk.move_to_end(key)
+
+        if on_disk:
+            path = self._path(key)
+            try:
+                with open(path, "rb") as f:
+                    pdf_bytes = f.read()
+                # Keep recency across restarts, the index is rebuilt by mtime
+                os.utime(path)
+            except OSError:
+                with self._lock:
+                    self._disk_total -= self._disk.pop(key, 0)
+                    self.misses += 1
+                return None
+            with self._lock:
+                self._remember(key, pdf_bytes)
+                self.hits += 1
+            return pdf_bytes
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, pdf_bytes):
+        """Store a rendered report in both tiers"""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(pdf_bytes)
+            os.replace(tmp_path, path)
+            stored = True
+        except OSError as e:
+            print(f"PDF cache: could not write {path}: {e}")
+            stored = False
+
+        with self._lock:
+            self._remember(key, pdf_bytes)
+            if stored:
+                self._disk_total += len(pdf_bytes) - self._disk.pop(key, 0)
+                self._disk[key] = len(pdf_bytes)
+                while self._disk_total > self.disk_bytes and len(self._disk) > 1:
+                    evicted, size = self._disk.popitem(last=False)
+                    self._disk_total -= size
+                    try:
+                        os.remove(self._path(evicted))
+                    except OSError:
+                        pass
+
+    def get_stats(self):
+        """Hit/miss counts and tier sizes for monitoring"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'memory_reports': len(self._memory),
+                'memory_bytes': self._memory_total,
+                'disk_reports': len(self._disk),
+                'disk_bytes': self._disk_total
+            }
+
+
+# Singleton instance for easy import
+_cache_instance = None
+_cache_lock = threading.Lock()
+
+def get_pdf_cache():
+    """Get singleton instance of PDFCache built from config"""
+    global _cache_instance
+    with _cache_lock:
+        if _cache_instance is None:
+            _cache_instance = PDFCache()
+        return _cache_instance
@@ -5,26 +5,154 @@ Generates professional PDF reports with analysis results
 
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, Image, PageBreak, Flowable
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from itertools import count
+from xml.sax.saxutils import escape
 import os
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
 from colors import SENTIMENT_COLORS, MAIN_BLUE
+from config import PDF_CHART_BACKEND, LARGE_REPORT_TOP_SOURCES
+from pdf_cache import STAMP_FORM_PREFIX, REPORT_TIME_FORMAT
+
+CHART_WIDTH = 3*inch
+CHART_HEIGHT = 2.4*inch
+
+LOGO_PATH = "assets/svgviewer-png-output.png"
+LOGO_SIZE = 1.5*inch
+LOGO_PIXELS = 300  # 200 dpi at LOGO_SIZE
+
+REPORT_ARTICLE_LIMIT = 10  # Articles detailed in a standard report
+
+@lru_cache(maxsize=None)
+def load_report_logo():
+    """
+    Read the logo once, downscaled to the size it is printed at
+    
+    Re-encoding the full-size PNG was most of the cost of a short report; the
+    small copy is shared by every document the process builds.
+    
+    Returns:
+        bytes: PNG data (the original file if Pillow is missing), or None
+            if there is no logo
+    """
+    if not os.path.exists(LOGO_PATH):
+        return None
+    with open(LOGO_PATH, 'rb') as f:
+        data = f.read()
+    try:
+        from PIL import Image as PILImage
+    except ImportError:
+        return data
+    
+    with PILImage.open(BytesIO(data)) as image:
+        image.thumbnail((LOGO_PIXELS, LOGO_PIXELS))
+        output = BytesIO()
+        image.save(output, format='PNG', optimize=True)
+        return output.getvalue()
+
+def create_sentiment_drawings(data):
+    """
+    Create sentiment charts as native ReportLab vector drawings
+    
+    Args:
+        data: Dictionary containing sentiment data
+        
+    Returns:
+        tuple: (pie_drawing, bar_drawing) flowables sized CHART_WIDTH x CHART_HEIGHT
+    """
+    from reportlab.graphics.shapes import Drawing, String, Circle
+    from reportlab.graphics.charts.piecharts import Pie
+    from reportlab.graphics.charts.barcharts import VerticalBarChart
+    
+    labels = ['Positive', 'Neutral', 'Negative']
+    counts = [data.get('positive_count', 0), data.get('neutral_count', 0), data.get('negative_count', 0)]
+    percentages = [data.get('positive_pct', 0), data.get('neutral_pct', 0), data.get('negative_pct', 0)]
+    slice_colors = [colors.HexColor(color) for color in SENTIMENT_COLORS]
+    title_color = colors.HexColor(MAIN_BLUE)
+    
+    # Pie chart
+    pie_drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+    pie_drawing.add(String(CHART_WIDTH / 2, CHART_HEIGHT - 14, 'Sentiment Distribution',
+                           fontName='Helvetica-Bold', fontSize=11, fillColor=title_color, textAnchor='middle'))
+    diameter = CHART_HEIGHT - 50
+    if sum(counts) > 0:
+        pie = Pie()
+        pie.x = (CHART_WIDTH - diameter) / 2
+        pie.y = 12
+        pie.width = pie.height = diameter
+        pie.startAngle = 90
+        pie.direction = 'clockwise'
+        # Zero-count slices are left out so their labels do not overlap
+        shown = [i for i, count in enumerate(counts) if count > 0]
+        pie.data = [counts[i] for i in shown]
+        total = sum(pie.data)
+        pie.labels = [f"{labels[i]} {counts[i] * 100 / total:.1f}%" for i in shown]
+        pie.simpleLabels = 1
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 1
+        pie.slices.fontName = 'Helvetica-Bold'
+        pie.slices.fontSize = 8
+        pie.slices.labelRadius = 1.15
+        for slot, i in enumerate(shown):
+            pie.slices[slot].fillColor = slice_colors[i]
+        pie_drawing.add(pie)
+    else:
+        pie_drawing.add(Circle(CHART_WIDTH / 2, 12 + diameter / 2, diameter / 2,
+                               fillColor=colors.HexColor('#E0E0E0'), strokeColor=None))
+        pie_drawing.add(String(CHART_WIDTH / 2, 12 + diameter / 2, 'No articles',
+                               fontName='Helvetica', fontSize=9, textAnchor='middle'))
+    
+    # Bar chart
+    bar_drawing = Drawing(CHART_WIDTH, CHART_HEIGHT)
+    bar_drawing.add(String(CHART_WIDTH / 2, CHART_HEIGHT - 14, 'Article Count by Sentiment',
+                           fontName='Helvetica-Bold', fontSize=11, fillColor=title_color, textAnchor='middle'))
+    chart = VerticalBarChart()
+    chart.x = 36
+    chart.y = 24
+    chart.width = CHART_WIDTH - 48
+    chart.height = CHART_HEIGHT - 60
+    chart.data = [counts]
+    chart.categoryAxis.categoryNames = labels
+    chart.categoryAxis.labels.fontName = 'Helvetica-Bold'
+    chart.categoryAxis.labels.fontSize = 8
+    chart.valueAxis.valueMin = 0
+    chart.valueAxis.valueMax = max(counts) * 1.2 if max(counts) > 0 else 10
+    chart.valueAxis.labels.fontSize = 7
+    chart.valueAxis.visibleGrid = 1
+    chart.valueAxis.gridStrokeColor = colors.HexColor('#D0D0D0')
+    chart.valueAxis.gridStrokeDashArray = (2, 2)
+    chart.bars.strokeColor = colors.black
+    chart.bars.strokeWidth = 1
+    for i, color in enumerate(slice_colors):
+        chart.bars[(0, i)].fillColor = color
+    # Percentage labels on top of the bars
+    chart.barLabelFormat = 'values'
+    chart.barLabelArray = [[f"{pct}%" for pct in percentages]]
+    chart.barLabels.fontName = 'Helvetica-Bold'
+    chart.barLabels.fontSize = 8
+    chart.barLabels.nudge = 6
+    bar_drawing.add(chart)
+    
+    return pie_drawing, bar_drawing
 
 def create_sentiment_charts(data):
     """
-    Create sentiment visualization charts and save as images using matplotlib
+    Create sentiment visualization charts as in-memory PNGs using matplotlib
+    
+    Raster fallback for create_sentiment_drawings; matplotlib is only
+    imported when this runs.
     
     Args:
         data: Dictionary containing sentiment data
         
     Returns:
-        tuple: (pie_chart_path, bar_chart_path)
+        tuple: (pie_chart_buffer, bar_chart_buffer) as BytesIO objects
     """
     positive_count = data.get('positive_count', 0)
     neutral_count = data.get('neutral_count', 0)
@@ -33,6 +161,10 @@ def create_sentiment_charts(data):
     neutral_pct = data.get('neutral_pct', 0)
     negative_pct = data.get('negative_pct', 0)
     
+    import matplotlib
+    matplotlib.use('Agg')  # No GUI backend on a server
+    import matplotlib.pyplot as plt
+    
     colors_list = SENTIMENT_COLORS  # Use new professional color palette
     labels = ['Positive', 'Neutral', 'Negative']
     counts = [positive_count, neutral_count, negative_count]
@@ -58,10 +190,11 @@ def create_sentiment_charts(data):
     ax1.axis('equal')
     
     # Save pie chart
-    pie_path = 'temp_pie_chart.png'
-    plt.tight_layout()
-    plt.savefig(pie_path, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    pie_buffer = BytesIO()
+    fig1.tight_layout()
+    fig1.savefig(pie_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+    plt.close(fig1)
+    pie_buffer.seek(0)
     
     # Create bar chart
     fig2, ax2 = plt.subplots(figsize=(5, 4))
@@ -81,72 +214,161 @@ def create_sentiment_charts(data):
     ax2.set_axisbelow(True)
     
     # Save bar chart
-    bar_path = 'temp_bar_chart.png'
-    plt.tight_layout()
-    plt.savefig(bar_path, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    bar_buffer = BytesIO()
+    fig2.tight_layout()
+    fig2.savefig(bar_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
+    plt.close(fig2)
+    bar_buffer.seek(0)
     
-    return pie_path, bar_path
+    return pie_buffer, bar_buffer
 
-def generate_sentiment_pdf(filename, data):
+def build_chart_flowables(data):
     """
-    Generate PDF report for sentiment analysis
+    Build the pie and bar chart flowables using the configured backend
     
-    Args:
-        filename: Output PDF filename
-        data: Dictionary containing analysis data
-            - party: Political party name
-            - state: State/UT name
-            - username: Logged in username
-            - articles_count: Number of articles analyzed
-            - positive_pct: Positive sentiment percentage
-            - neutral_pct: Neutral sentiment percentage
-            - negative_pct: Negative sentiment percentage
-            - articles: List of articles with sentiment scores
-            - insights: List of key insights
-    """
+    Vector drawings are used by default; matplotlib rasters are the
+    fallback when PDF_CHART_BACKEND is "matplotlib" or drawing fails.
     
-    # Create the PDF document
-    doc = SimpleDocTemplate(filename, pagesize=letter,
-                          rightMargin=72, leftMargin=72,
-                          topMargin=72, bottomMargin=18)
+    Returns:
+        tuple: (pie_flowable, bar_flowable)
+    """
+    if PDF_CHART_BACKEND != 'matplotlib':
+        try:
+            return create_sentiment_drawings(data)
+        except Exception as e:
+            print(f"Vector charts failed, falling back to matplotlib: {e}")
+    
+    pie_buffer, bar_buffer = create_sentiment_charts(data)
+    return (
+        Image(pie_buffer, width=CHART_WIDTH, height=CHART_HEIGHT),
+        Image(bar_buffer, width=CHART_WIDTH, height=CHART_HEIGHT)
+    )
+
+def generate_sentiment_pdf_bytes(data, progress=None):
+    """
+    Generate the sentiment analysis PDF report entirely in memory
     
-    # Container for the 'Flowable' objects
-    elements = []
+    Nothing touches the disk, so concurrent exports cannot clash.
     
-    # Get styles
-    styles = getSampleStyleSheet()
+    Args:
+        data: Dictionary containing analysis data (see generate_sentiment_pdf)
+        progress: Optional callback(fraction, message) for long exports
+        
+    Returns:
+        bytes: The PDF document
+    """
+    buffer = BytesIO()
+    generate_sentiment_pdf(buffer, data, progress)
+    return buffer.getvalue()
+
+@lru_cache(maxsize=None)
+def get_report_styles():
+    """
+    Build the paragraph and table styles shared by every report
     
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor(MAIN_BLUE),
-        spaceAfter=30,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
+    Styles are never modified after creation, so one set is built per process
+    and reused by every document and every article section.
     
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        textColor=colors.HexColor(MAIN_BLUE),
-        spaceAfter=12,
-        spaceBefore=12,
-        fontName='Helvetica-Bold'
-    )
+    Returns:
+        dict: ParagraphStyle and TableStyle objects by name
+    """
+    styles = getSampleStyleSheet()
+    main_blue = colors.HexColor(MAIN_BLUE)
+    
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=main_blue,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=main_blue,
+            spaceAfter=12,
+            spaceBefore=12,
+            fontName='Helvetica-Bold'
+        ),
+        'normal': ParagraphStyle(
+            'ReportNormal',
+            parent=styles['Normal'],
+            fontSize=10,
+            leading=14
+        ),
+        'footer': ParagraphStyle(
+            'Footer',
+            parent=styles['Normal'],
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=TA_CENTER
+        ),
+        'meta_table': TableStyle([
+            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8F4F8')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+        ]),
+        'sentiment_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), main_blue),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('TOPPADDING', (0, 1), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F0F0F0')]),
+        ]),
+        'chart_table': TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        'article_table': TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
+            ('FONTNAME', (1, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#F0F0F0')),
+        ]),
+    }
+
+def build_header_flowables(data, styles):
+    """
+    Logo, title and report metadata table
     
-    normal_style = styles['Normal']
-    normal_style.fontSize = 10
-    normal_style.leading = 14
+    Args:
+        data: Report data; party, state, username and any extra
+            (label, value) rows in 'meta_rows'
+        styles: Styles from get_report_styles
+        
+    Returns:
+        list: Flowables for the top of the first page
+    """
+    elements = []
     
     # Add logo if exists
-    logo_path = "assets/svgviewer-png-output.png"
-    if os.path.exists(logo_path):
+    logo = load_report_logo()
+    if logo:
         try:
-            img = Image(logo_path, width=1.5*inch, height=1.5*inch)
+            img = Image(BytesIO(logo), width=LOGO_SIZE, height=LOGO_SIZE)
             img.hAlign = 'CENTER'
             elements.append(img)
             elements.append(Spacer(1, 12))
@@ -154,43 +376,45 @@ def generate_sentiment_pdf(filename, data):
             pass
     
     # Title
-    title = Paragraph("Political News Sentiment Analysis Report", title_style)
+    title = Paragraph("Political News Sentiment Analysis Report", styles['title'])
     elements.append(title)
     elements.append(Spacer(1, 12))
     
     # Report metadata
-    overall_sentiment = data.get('overall_sentiment', 'N/A')
-    avg_confidence = data.get('average_confidence', 0)
-    
+    # Drawn as stampable fields so a cached report can carry the time and
+    # user of each download (pdf_cache.stamp_report)
     meta_data = [
-        ['Report Generated:', datetime.now().strftime("%B %d, %Y at %I:%M %p")],
-        ['Analyzed By:', data.get('username', 'N/A')],
+        ['Report Generated:', StampField('generated', datetime.now().strftime(REPORT_TIME_FORMAT))],
+        ['Analyzed By:', StampField('username', data.get('username', 'N/A'))],
         ['Political Party:', data.get('party', 'N/A')],
         ['State/UT:', data.get('state', 'N/A')],
-        ['Articles Analyzed:', str(data.get('articles_count', 0))],
-        ['Overall Sentiment:', overall_sentiment],
-        ['AI Confidence:', f"{avg_confidence}%"]
-    ]
+    ] + [list(row) for row in data.get('meta_rows', [])]
     
     meta_table = Table(meta_data, colWidths=[2*inch, 4*inch])
-    meta_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#E8F4F8')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-        ('FONTNAME', (1, 0), (1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-    ]))
+    meta_table.setStyle(styles['meta_table'])
     
     elements.append(meta_table)
     elements.append(Spacer(1, 20))
+    return elements
+
+def build_sentiment_summary_flowables(data, styles):
+    """
+    Sentiment results table, quality note and charts
+    
+    Args:
+        data: Dictionary with the *_pct, *_count, average_confidence and
+            overall_sentiment keys
+        styles: Styles from get_report_styles
+        
+    Returns:
+        list: Flowables for the summary section
+    """
+    elements = []
+    overall_sentiment = data.get('overall_sentiment', 'N/A')
+    avg_confidence = data.get('average_confidence', 0)
     
     # Overall Sentiment Summary with real data
-    heading = Paragraph("� AI-Powered Sentiment Analysis Results", heading_style)
+    heading = Paragraph("� AI-Powered Sentiment Analysis Results", styles['heading'])
     elements.append(heading)
     elements.append(Spacer(1, 12))
     
@@ -206,20 +430,7 @@ def generate_sentiment_pdf(filename, data):
     ]
     
     sentiment_table = Table(sentiment_data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1*inch])
-    sentiment_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(MAIN_BLUE)),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#F0F0F0')]),
-    ]))
+    sentiment_table.setStyle(styles['sentiment_table'])
     
     elements.append(sentiment_table)
     elements.append(Spacer(1, 15))
@@ -229,44 +440,275 @@ def generate_sentiment_pdf(filename, data):
         f"<b>Analysis Method:</b> VADER + TextBlob Ensemble AI Model | "
         f"<b>Average Confidence:</b> {avg_confidence}% | "
         f"<b>Overall Result:</b> {overall_sentiment}",
-        normal_style
+        styles['normal']
     )
     elements.append(quality_note)
     elements.append(Spacer(1, 20))
     
     # Generate and add visualization charts
     try:
-        pie_path, bar_path = create_sentiment_charts(data)
+        pie_chart, bar_chart = build_chart_flowables(data)
         
         # Add charts heading
-        heading = Paragraph("📊 Visual Analysis", heading_style)
+        heading = Paragraph("📊 Visual Analysis", styles['heading'])
         elements.append(heading)
         elements.append(Spacer(1, 12))
         
         # Create table with two charts side by side
-        chart_table_data = []
+        chart_table = Table([[pie_chart, bar_chart]], colWidths=[3*inch, 3*inch])
+        chart_table.setStyle(styles['chart_table'])
         
-        # Add pie chart and bar chart
-        if os.path.exists(pie_path) and os.path.exists(bar_path):
-            pie_img = Image(pie_path, width=3*inch, height=2.4*inch)
-            bar_img = Image(bar_path, width=3*inch, height=2.4*inch)
-            chart_table_data.append([pie_img, bar_img])
-            
-            chart_table = Table(chart_table_data, colWidths=[3*inch, 3*inch])
-            chart_table.setStyle(TableStyle([
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            elements.append(chart_table)
-            elements.append(Spacer(1, 20))
+        elements.append(chart_table)
+        elements.append(Spacer(1, 20))
             
     except Exception as e:
         # If chart generation fails, skip silently
         pass
     
+    return elements
+
+def build_article_flowables(idx, article, sentiment_data, styles):
+    """
+    Flowables for one article: heading, score table and description
+    
+    Args:
+        idx: 1-based position of the article in the report
+        article: Article dictionary
+        sentiment_data: Result from analyze_article, or None if not scored
+        styles: Styles from get_report_styles
+        
+    Returns:
+        list: Flowables for the article
+    """
+    article_title = article.get('title') or 'No Title'
+    source = (article.get('source') or {}).get('name') or 'Unknown'
+    published = (article.get('publishedAt') or 'Unknown')[:10]
+    description = article.get('description') or 'No description available'
+    
+    # Get real sentiment data if available
+    if sentiment_data:
+        classification = sentiment_data.get('classification', 'Neutral')
+        confidence = sentiment_data.get('confidence', 0)
+        compound_score = sentiment_data.get('compound_score', 0)
+        positive = sentiment_data.get('positive', 0) * 100
+        neutral = sentiment_data.get('neutral', 0) * 100
+        negative = sentiment_data.get('negative', 0) * 100
+    else:
+        # Fallback to default
+        classification = 'Neutral'
+        confidence = 50
+        compound_score = 0
+        positive = neutral = negative = 33
+    
+    # Get emoji for sentiment
+    emoji = '😊' if classification == 'Positive' else '😢' if classification == 'Negative' else '😐'
+    
+    # Article title with emoji (feed text may contain markup characters)
+    short_title = escape(article_title[:80]) + ('...' if len(article_title) > 80 else '')
+    article_heading = Paragraph(f"<b>{emoji} {idx}. {short_title}</b>", styles['normal'])
+    
+    # Article details table with real sentiment scores
+    article_data = [
+        ['Source:', source, 'Published:', published],
+        ['Sentiment:', f"{classification} ({confidence:.1f}% confidence)", 'Score:', f"{compound_score:.4f}"],
+        ['Positive:', f"{positive:.1f}%", 'Neutral:', f"{neutral:.1f}%"],
+        ['Negative:', f"{negative:.1f}%", '', '']
+    ]
+    
+    article_table = Table(article_data, colWidths=[1.2*inch, 2.2*inch, 1.2*inch, 1.4*inch])
+    article_table.setStyle(styles['article_table'])
+    
+    # Description
+    short_description = escape(description[:250]) + ('...' if len(description) > 250 else '')
+    desc_text = Paragraph(f"<i>{short_description}</i>", styles['normal'])
+    
+    return [
+        article_heading, Spacer(1, 6),
+        article_table, Spacer(1, 6),
+        desc_text, Spacer(1, 12)
+    ]
+
+def iter_article_flowables(scored_articles, styles, stats=None):
+    """
+    Lazily yield the flowables for a sequence of articles
+    
+    A page break is inserted after every 3 articles (if more follow).
+    
+    Args:
+        scored_articles: Iterable of (article, sentiment_data) pairs
+        styles: Styles from get_report_styles
+        stats: Optional SentimentStats updated with each scored article
+        
+    Yields:
+        Flowable: One flowable at a time
+    """
+    for idx, (article, sentiment_data) in enumerate(scored_articles, 1):
+        if idx > 1 and (idx - 1) % 3 == 0:
+            yield PageBreak()
+        if stats is not None and sentiment_data:
+            stats.add(sentiment_data)
+        yield from build_article_flowables(idx, article, sentiment_data, styles)
+
+def build_footer_flowables(styles):
+    """Closing credit line"""
+    footer = Paragraph(
+        f"Report generated by Political News Sentiment Analysis System with AI (VADER + TextBlob)<br/>"
+        f"© {datetime.now().year} - For analytical and informational purposes only",
+        styles['footer']
+    )
+    return [Spacer(1, 30), footer]
+
+class OutlineEntry(Flowable):
+    """Zero-size flowable that adds the current page to the PDF outline"""
+    
+    def __init__(self, title, key, level=0):
+        super().__init__()
+        self.title = title
+        self.key = key
+        self.level = level
+    
+    def wrap(self, availWidth, availHeight):
+        return 0, 0
+    
+    def draw(self):
+        self.canv.bookmarkPage(self.key)
+        self.canv.addOutlineEntry(self.title, self.key, level=self.level, closed=False)
+
+class StampField(Flowable):
+    """
+    Single line of table text drawn through its own form XObject
+    
+    pdf_cache.stamp_report can replace the text in the finished PDF, which
+    is how a cached report gets the user and time of each download.
+    """
+    
+    _ids = count()
+    
+    def __init__(self, field, text, font_name='Helvetica', font_size=10):
+        super().__init__()
+        self.field = field
+        self.text = text
+        self.font_name = font_name
+        self.font_size = font_size
+        # Unique per document, as combined reports hold several headers
+        self.form_name = f"{STAMP_FORM_PREFIX}_{field}_{next(self._ids)}"
+    
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        self.height = self.font_size * 1.2
+        return self.width, self.height
+    
+    def draw(self):
+        if not self.canv.hasForm(self.form_name):
+            self.canv.beginForm(self.form_name, 0, 0, self.width, self.height)
+            self.canv.setFont(self.font_name, self.font_size)
+            self.canv.drawString(0, self.font_size * 0.25, self.text)
+            self.canv.endForm()
+        self.canv.doForm(self.form_name)
+
+class LazyStory(list):
+    """
+    Story list that pulls flowables from an iterator on demand
+    
+    doc.build() consumes its story from the front (reading, deleting and
+    re-inserting split pieces at index 0), so only a few flowables need to
+    exist at a time. At least `lookahead` flowables are kept buffered so
+    keepWithNext chains can still see the flowables that follow.
+    """
+    
+    def __init__(self, flowables, lookahead=8):
+        super().__init__()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+        self._exhausted = False
+    
+    def _fill(self, count):
+        while not self._exhausted and list.__len__(self) < count:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._exhausted = True
+    
+    def __len__(self):
+        self._fill(self._lookahead)
+        return list.__len__(self)
+    
+    def __getitem__(self, index):
+        stop = index.stop if isinstance(index, slice) else index + 1
+        if stop is None or stop <= 0:
+            # Counting from the end needs the whole story
+            self._fill(float('inf'))
+        else:
+            self._fill(stop)
+        return list.__getitem__(self, index)
+
+def generate_sentiment_pdf(filename, data, progress=None):
+    """
+    Generate PDF report for sentiment analysis
+    
+    Args:
+        filename: Output PDF filename or writable binary file object
+        data: Dictionary containing analysis data
+            - party: Political party name
+            - state: State/UT name
+            - username: Logged in username
+            - articles_count: Number of articles analyzed
+            - positive_pct: Positive sentiment percentage
+            - neutral_pct: Neutral sentiment percentage
+            - negative_pct: Negative sentiment percentage
+            - articles: List of articles with sentiment scores
+            - insights: List of key insights
+        progress: Optional callback(fraction, message) called as each
+            stage of the report starts
+    """
+    if progress is None:
+        progress = lambda fraction, message: None
+    
+    # Create the PDF document
+    doc = SimpleDocTemplate(filename, pagesize=letter,
+                          rightMargin=72, leftMargin=72,
+                          topMargin=72, bottomMargin=18)
+    
+    elements = build_report_story(data, get_report_styles(), progress)
+    
+    # Build PDF
+    progress(0.7, "Building PDF")
+    doc.build(elements)
+    progress(1.0, "Done")
+    
+    return True
+
+def build_report_story(data, styles, progress=None):
+    """
+    Build the flowables of one standard report (see generate_sentiment_pdf)
+    
+    Args:
+        data: Dictionary containing analysis data
+        styles: Styles from get_report_styles
+        progress: Optional callback(fraction, message)
+        
+    Returns:
+        list: Flowables, ready for doc.build() or to be joined with others
+    """
+    if progress is None:
+        progress = lambda fraction, message: None
+    progress(0.05, "Laying out summary")
+    
+    # Container for the 'Flowable' objects
+    elements = build_header_flowables({
+        **data,
+        'meta_rows': [
+            ['Articles Analyzed:', str(data.get('articles_count', 0))],
+            ['Overall Sentiment:', data.get('overall_sentiment', 'N/A')],
+            ['AI Confidence:', f"{data.get('average_confidence', 0)}%"]
+        ]
+    }, styles)
+    
+    progress(0.25, "Drawing charts")
+    elements += build_sentiment_summary_flowables(data, styles)
+    
     # AI-Generated Key Insights
-    heading = Paragraph("💡 AI-Generated Key Insights", heading_style)
+    heading = Paragraph("💡 AI-Generated Key Insights", styles['heading'])
     elements.append(heading)
     elements.append(Spacer(1, 12))
     
@@ -277,113 +719,130 @@ def generate_sentiment_pdf(filename, data):
     ])
     
     for insight in insights:
-        p = Paragraph(f"• {insight}", normal_style)
+        p = Paragraph(f"• {insight}", styles['normal'])
         elements.append(p)
         elements.append(Spacer(1, 6))
     
     elements.append(Spacer(1, 20))
     
     # Individual Article Analysis with real sentiment data
-    heading = Paragraph("📰 Detailed Article-by-Article Sentiment Analysis", heading_style)
+    progress(0.5, "Adding articles")
+    heading = Paragraph("📰 Detailed Article-by-Article Sentiment Analysis", styles['heading'])
     elements.append(heading)
     elements.append(Spacer(1, 12))
     
-    articles = data.get('articles', [])
+    articles = data.get('articles', [])[:REPORT_ARTICLE_LIMIT]
     individual_sentiments = data.get('individual_sentiments', [])
-    
-    for idx, article in enumerate(articles[:10], 1):  # Limit to 10 articles for PDF
-        article_title = article.get('title', 'No Title')
-        source = article.get('source', {}).get('name', 'Unknown')
-        published = article.get('publishedAt', 'Unknown')[:10]
-        description = article.get('description', 'No description available')
-        
-        # Get real sentiment data if available
-        if idx <= len(individual_sentiments):
-            sentiment_data = individual_sentiments[idx-1]
-            classification = sentiment_data.get('classification', 'Neutral')
-            confidence = sentiment_data.get('confidence', 0)
-            compound_score = sentiment_data.get('compound_score', 0)
-            positive = sentiment_data.get('positive', 0) * 100
-            neutral = sentiment_data.get('neutral', 0) * 100
-            negative = sentiment_data.get('negative', 0) * 100
-        else:
-            # Fallback to default
-            classification = 'Neutral'
-            confidence = 50
-            compound_score = 0
-            positive = neutral = negative = 33
-        
-        # Get emoji for sentiment
-        emoji = '😊' if classification == 'Positive' else '😢' if classification == 'Negative' else '😐'
-        
-        # Article title with emoji
-        article_heading = Paragraph(f"<b>{emoji} {idx}. {article_title[:80]}{'...' if len(article_title) > 80 else ''}</b>", normal_style)
-        elements.append(article_heading)
-        elements.append(Spacer(1, 6))
-        
-        # Article details table with real sentiment scores
-        article_data = [
-            ['Source:', source, 'Published:', published],
-            ['Sentiment:', f"{classification} ({confidence:.1f}% confidence)", 'Score:', f"{compound_score:.4f}"],
-            ['Positive:', f"{positive:.1f}%", 'Neutral:', f"{neutral:.1f}%"],
-            ['Negative:', f"{negative:.1f}%", '', '']
-        ]
-        
-        article_table = Table(article_data, colWidths=[1.2*inch, 2.2*inch, 1.2*inch, 1.4*inch])
-        article_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (2, 0), (2, -1), 'Helvetica-Bold'),
-            ('FONTNAME', (1, 0), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            ('TOPPADDING', (0, 0), (-1, -1), 4),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-            ('BACKGROUND', (0, 1), (-1, 1), colors.HexColor('#F0F0F0')),
-        ]))
-        
-        elements.append(article_table)
-        elements.append(Spacer(1, 6))
-        
-        # Description
-        desc_text = Paragraph(f"<i>{description[:250]}{'...' if len(description) > 250 else ''}</i>", normal_style)
-        elements.append(desc_text)
-        elements.append(Spacer(1, 12))
-        
-        # Add page break after every 3 articles
-        if idx % 3 == 0 and idx < len(articles):
-            elements.append(PageBreak())
+    scored_articles = [
+        (article, individual_sentiments[idx] if idx < len(individual_sentiments) else None)
+        for idx, article in enumerate(articles)
+    ]
+    elements += iter_article_flowables(scored_articles, styles)
     
     # Footer section
-    elements.append(Spacer(1, 30))
-    footer_style = ParagraphStyle(
-        'Footer',
-        parent=styles['Normal'],
-        fontSize=8,
-        textColor=colors.grey,
-        alignment=TA_CENTER
-    )
+    elements += build_footer_flowables(styles)
     
-    footer = Paragraph(
-        f"Report generated by Political News Sentiment Analysis System with AI (VADER + TextBlob)<br/>"
-        f"© {datetime.now().year} - For analytical and informational purposes only",
-        footer_style
-    )
-    elements.append(footer)
+    return elements
+
+def generate_large_sentiment_pdf(filename, data, scored_articles, progress=None):
+    """
+    Generate a report covering any number of articles in constant memory
     
-    # Build PDF
-    doc.build(elements)
+    Article sections are built from the iterator only as doc.build() lays
+    them out, so just a handful of flowables exist at any time. Statistics
+    are accumulated along the way (one SentimentStats per source, merged
+    into a total) and written as a summary appendix after the articles.
     
-    # Clean up temporary chart images
-    try:
-        if os.path.exists('temp_pie_chart.png'):
-            os.remove('temp_pie_chart.png')
-        if os.path.exists('temp_bar_chart.png'):
-            os.remove('temp_bar_chart.png')
-    except:
-        pass
+    Args:
+        filename: Output PDF filename or writable binary file object
+        data: Dictionary with party, state, username and optional insights
+        scored_articles: Iterable of (article, sentiment_data) pairs, e.g. from
+            SentimentAnalyzer.analyze_articles_stream; consumed once
+        progress: Optional callback(fraction, message); fraction stays at
+            0.5 while articles stream because their count is not known
+            
+    Returns:
+        dict: Overall statistics of the reported articles (to_dict format)
+    """
+    from sentiment_analyzer import SentimentStats
     
-    return True
+    if progress is None:
+        progress = lambda fraction, message: None
+    progress(0.05, "Laying out summary")
+    
+    doc = SimpleDocTemplate(filename, pagesize=letter,
+                          rightMargin=72, leftMargin=72,
+                          topMargin=72, bottomMargin=18)
+    styles = get_report_styles()
+    source_stats = {}
+    totals = {}
+    
+    def scored_with_stats():
+        for count, (article, sentiment_data) in enumerate(scored_articles, 1):
+            if sentiment_data:
+                name = (article.get('source') or {}).get('name') or 'Unknown'
+                source_stats.setdefault(name, SentimentStats()).add(sentiment_data)
+            if count % 100 == 0:
+                progress(0.5, f"Laid out {count} articles")
+            yield article, sentiment_data
+    
+    def appendix():
+        overall = SentimentStats()
+        for stats in source_stats.values():
+            overall.merge(stats)
+        totals.update(overall.to_dict())
+        
+        yield PageBreak()
+        yield Paragraph("📑 Summary Appendix", styles['heading'])
+        yield Spacer(1, 12)
+        yield from build_sentiment_summary_flowables({
+            'positive_pct': totals['positive_percentage'],
+            'neutral_pct': totals['neutral_percentage'],
+            'negative_pct': totals['negative_percentage'],
+            'positive_count': totals['positive_count'],
+            'neutral_count': totals['neutral_count'],
+            'negative_count': totals['negative_count'],
+            'average_confidence': totals['average_confidence'],
+            'overall_sentiment': totals['overall_sentiment']
+        }, styles)
+        
+        if source_stats:
+            yield Paragraph("Sentiment by Source", styles['heading'])
+            yield Spacer(1, 12)
+            rows = [['Source', 'Articles', 'Positive', 'Neutral', 'Negative']]
+            ranked = sorted(source_stats.items(), key=lambda item: -item[1].total_articles)
+            for name, stats in ranked[:LARGE_REPORT_TOP_SOURCES]:
+                rows.append([name[:40], str(stats.total_articles), str(stats.positive_count),
+                             str(stats.neutral_count), str(stats.negative_count)])
+            source_table = Table(rows, colWidths=[2.5*inch, 0.9*inch, 0.9*inch, 0.9*inch, 0.9*inch],
+                                 repeatRows=1)
+            source_table.setStyle(styles['sentiment_table'])
+            yield source_table
+        
+        yield from build_footer_flowables(styles)
+    
+    def story():
+        yield from build_header_flowables(data, styles)
+        
+        insights = data.get('insights') or []
+        if insights:
+            yield Paragraph("💡 AI-Generated Key Insights", styles['heading'])
+            yield Spacer(1, 12)
+            for insight in insights:
+                yield Paragraph(f"• {insight}", styles['normal'])
+                yield Spacer(1, 6)
+            yield Spacer(1, 20)
+        
+        yield Paragraph("📰 Detailed Article-by-Article Sentiment Analysis", styles['heading'])
+        yield Spacer(1, 12)
+        progress(0.5, "Adding articles")
+        yield from iter_article_flowables(scored_with_stats(), styles)
+        progress(0.9, "Writing summary appendix")
+        yield from appendix()
+    
+    doc.build(LazyStory(story()))
+    progress(1.0, "Done")
+    return totals
 
 def generate_quick_pdf(filename, party, state, username, articles_count):
     """
@@ -0,0 +1,285 @@
+"""
+PDF Export Jobs
+Renders PDF reports on a small process pool so an export never blocks the
+Streamlit script thread; pages keep a job handle and poll it for progress
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from config import PDF_EXPORT_WORKERS, PDF_EXPORT_MAX_PENDING, PDF_JOB_TTL
+from pdf_cache import get_pdf_cache, report_fingerprint
+
+# Set in each worker process by _init_worker
+_progress_queue = None
+
+
+class ExportError(Exception):
+    """Base class for exports that could not be queued"""
+
+
+class ExportQueueFullError(ExportError):
+    """Raised when too many exports are already queued or running"""
+
+
+class ExportUnavailableError(ExportError):
+    """Raised when the worker pool cannot take the export"""
+
+
+def _init_worker(progress_queue):
+    """Worker process setup: keep the progress queue, yield CPU to the app"""
+    global _progress_queue
+    _progress_queue = progress_queue
+    if hasattr(os, "nice"):
+        # Exports are batch work; interactive scoring should win the CPU
+        os.nice(5)
+
+
+def _render(job_id, data):
+    """Build one report inside a worker process and return its bytes"""
+    from pdf_generator import generate_sentiment_pdf_bytes
+
+    def report(fraction, message):
+        _progress_queue.put((job_id, fraction, message))
+
+    return generate_sentiment_pdf_bytes(data, progress=report)
+
+
+class PDFJob:
+    """
+    Handle for one export
+
+    status is "queued", "running", "done" or "failed"; result holds the PDF
+    bytes once done and error the message if it failed.
+    """
+
+    def __init__(self, job_id, key, owner=None):
+        self.id = job_id
+        self.key = key
+        self.owner = owner
+        self.status = "queued"
+        self.progress = 0.0
+        self.message = "Waiting for a free worker"
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        self.future = None
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed")
+
+
+class PDFJobQueue:
+    """
+    Process pool for PDF exports with a concurrency cap
+
+    At most max_workers reports render at once and at most max_pending are
+    queued or running; each owner has at most one export in flight, so
+    clicking "Export" twice returns the same job, and exporting a different
+    report replaces the owner's previous one. Reports found in the cache
+    (or already rendering for someone else) are not rendered again. Finished
+    jobs are kept for ttl seconds so the page can offer the download.
+    """
+
+    def __init__(self, max_workers=PDF_EXPORT_WORKERS, max_pending=PDF_EXPORT_MAX_PENDING,
+                 ttl=PDF_JOB_TTL, cache=None):
+        self.max_pending = max_pending
+        self.ttl = ttl
+        self.cache = cache
+        self.max_workers = max_workers
+        # spawn: forking a process that runs Streamlit's threads is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._progress = self._context.Queue()
+        self._executor = self._new_executor()
+        self._lock = threading.Lock()
+        self._jobs = {}
+        self._listener = threading.Thread(target=self._listen, name="pdf-progress", daemon=True)
+        self._listener.start()
+
+    def _new_executor(self):
+        return ProcessPoolExecutor(
+            max_workers=self.max_workers, mp_context=self._context,
+            initializer=_init_worker, initargs=(self._progress,)
+        )
+
+    def _start(self, job, data):
+        """
+        Hand a job to the pool, replacing the pool once if it is broken
+
+        A worker that dies (e.g. killed for memory on a large report) breaks
+        the whole ProcessPoolExecutor; its running jobs fail through
+        _finish and every later submit raises BrokenProcessPool.
+        """
+        executor = self._executor
+        try:
+            return executor.submit(_render, job.id, data)
+        except BrokenProcessPool:
+            with self._lock:
+                if self._executor is executor:
+                    print("PDF export pool broken, starting new workers")
+                    self._executor = self._new_executor()
+                    executor.shutdown(wait=False)
+            return self._executor.submit(_render, job.id, data)
+
+    def _listen(self):
+        """Apply progress messages sent by the worker processes"""
+        while True:
+            job_id, fraction, message = self._progress.get()
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None and not job.finished:
+                    job.status = "running"
+                    job.progress = fraction
+                    job.message = message
+
+    def _complete(self, job, result):
+        """Mark a job done with its PDF bytes (call with the lock held)"""
+        job.result = result
+        job.status = "done"
+        job.progress = 1.0
+        job.message = "Ready"
+        job.finished_at = time.time()
+
+    def _fail(self, job, error):
+        """Mark a job failed (call with the lock held)"""
+        job.status = "failed"
+        job.error = error
+        job.message = "Failed"
+        job.finished_at = time.time()
+
+    def _finish(self, job, future):
+        if future.cancelled():
+            with self._lock:
+                if not job.finished:
+                    self._fail(job, "Cancelled")
+            return
+        if self.cache is not None and future.exception() is None:
+            self.cache.put(job.key, future.result())
+        with self._lock:
+            if job.finished:
+                # Replaced while rendering; the result is still cached above
+                return
+            try:
+                self._complete(job, future.result())
+            except Exception as e:
+                self._fail(job, str(e) or e.__class__.__name__)
+                print(f"PDF export {job.id} failed: {job.error}")
+
+    def _replace(self, job):
+        """
+        Drop an owner's export in favour of a new one (call with the lock held)
+
+        A job still waiting for a worker is cancelled; one already rendering
+        cannot be stopped and finishes into the cache only.
+        """
+        if job.future is not None:
+            job.future.cancel()
+        self._fail(job, "Replaced by a newer export")
+
+    def _prune(self):
+        """Forget finished jobs older than the TTL (call with the lock held)"""
+        cutoff = time.time() - self.ttl
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def submit(self, data, owner=None):
+        """
+        Queue a report for rendering
+
+        Args:
+            data (dict): Report data as taken by generate_sentiment_pdf; any
+                'username' is dropped
+            owner (str): Optional user name; one export per owner at a time
+
+        Returns:
+            PDFJob: Handle to poll with get()
+
+        Raises:
+            ExportQueueFullError: If max_pending exports are already active
+            ExportUnavailableError: If the worker pool cannot be started
+        """
+        # Cached reports are shared between users, so never render a name
+        # into one; the app stamps the owner on at download time
+        data = {k: v for k, v in data.items() if k != 'username'}
+        key = report_fingerprint(data)
+        cached = self.cache.get(key) if self.cache is not None else None
+        with self._lock:
+            self._prune()
+            if cached is not None:
+                job = PDFJob(uuid.uuid4().hex, key, owner)
+                self._complete(job, cached)
+                self._jobs[job.id] = job
+                return job
+
+            active = [job for job in self._jobs.values() if not job.finished]
+            for job in active:
+                if job.key == key:
+                    if job.owner != owner:
+                        # Shared by several users now; no one of them may
+                        # replace it
+                        job.owner = None
+                    return job
+            for job in active:
+                if owner is not None and job.owner == owner:
+                    self._replace(job)
+            active = [job for job in active if not job.finished]
+            if len(active) >= self.max_pending:
+                raise ExportQueueFullError(
+                    f"{len(active)} reports are already being generated, please try again shortly"
+                )
+            job = PDFJob(uuid.uuid4().hex, key, owner)
+            self._jobs[job.id] = job
+
+        try:
+            future = self._start(job, data)
+        except Exception as e:
+            # Never leave a job "queued" that no worker will pick up: it
+            # would count against max_pending and be handed back to its
+            # owner on every click
+            with self._lock:
+                self._fail(job, str(e) or e.__class__.__name__)
+                self._jobs.pop(job.id, None)
+            print(f"PDF export {job.id} could not be started: {job.error}")
+            raise ExportUnavailableError(
+                "The PDF export workers are unavailable, please try again shortly"
+            ) from e
+        with self._lock:
+            job.future = future
+            if job.finished:
+                # Replaced before it reached the pool
+                future.cancel()
+        future.add_done_callback(lambda future: self._finish(job, future))
+        return job
+
+    def get(self, job_id):
+        """Get a job by id (None if unknown or expired)"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def discard(self, job_id):
+        """Drop a finished job once its result is no longer needed"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None and job.finished:
+                del self._jobs[job_id]
+
+
+# Singleton instance for easy import
+_queue_instance = None
+_queue_lock = threading.Lock()
+
+def get_pdf_job_queue():
+    """Get singleton instance of PDFJobQueue built from config"""
+    global _queue_instance
+    with _queue_lock:
+        if _queue_instance is None:
+            _queue_instance = PDFJobQueue(cache=get_pdf_cache())
+        return _queue_instance
@@ -3,8 +3,100 @@ Sentiment Analysis Module
 Implements VADER + TextBlob hybrid sentiment analysis for political news
 """
 
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-from textblob import TextBlob
+import hashlib
+import json
+
+# Bump whenever scoring changes, so cached results from older scoring are not reused
+SCORER_VERSION = "1.0"
+
+
+def fingerprint_articles(articles, target_party=None):
+    """
+    Build a stable fingerprint for scoring a list of articles
+    
+    Only the fields that affect scoring (plus the URL for identity) are
+    hashed, together with the target party and SCORER_VERSION.
+    
+    Args:
+        articles (list): Article dictionaries
+        target_party (str): Party the articles are scored for
+        
+    Returns:
+        str: Hex digest identifying this analysis input
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([SCORER_VERSION, target_party]).encode())
+    for article in articles:
+        digest.update(json.dumps(
+            [article.get('url'), article.get('title'), article.get('description')]
+        ).encode())
+    return digest.hexdigest()
+
+
+class SentimentStats:
+    """
+    Running sentiment statistics that can be updated one result at a time
+    
+    Only counts and sums are kept, so two SentimentStats built over different
+    articles can be merged and the result matches analyzing both together.
+    """
+    
+    def __init__(self):
+        self.positive_count = 0
+        self.neutral_count = 0
+        self.negative_count = 0
+        self.total_compound = 0.0
+        self.total_confidence = 0.0
+    
+    @property
+    def total_articles(self):
+        return self.positive_count + self.neutral_count + self.negative_count
+    
+    def add(self, sentiment):
+        """Add one result from analyze_article"""
+        if sentiment['classification'] == 'Positive':
+            self.positive_count += 1
+        elif sentiment['classification'] == 'Negative':
+            self.negative_count += 1
+        else:
+            self.neutral_count += 1
+        
+        self.total_compound += sentiment['compound_score']
+        self.total_confidence += sentiment['confidence']
+    
+    def merge(self, other):
+        """Fold another SentimentStats into this one"""
+        self.positive_count += other.positive_count
+        self.neutral_count += other.neutral_count
+        self.negative_count += other.negative_count
+        self.total_compound += other.total_compound
+        self.total_confidence += other.total_confidence
+        return self
+    
+    def to_dict(self):
+        """
+        Build the 'overall_statistics' dict used by analyze_articles_batch
+        
+        Returns:
+            dict: Percentages, counts, averages and overall sentiment
+        """
+        total_articles = self.total_articles
+        if total_articles == 0:
+            return SentimentAnalyzer._get_empty_batch_result()['overall_statistics']
+        
+        average_compound = self.total_compound / total_articles
+        return {
+            'positive_percentage': round((self.positive_count / total_articles) * 100, 2),
+            'neutral_percentage': round((self.neutral_count / total_articles) * 100, 2),
+            'negative_percentage': round((self.negative_count / total_articles) * 100, 2),
+            'positive_count': self.positive_count,
+            'neutral_count': self.neutral_count,
+            'negative_count': self.negative_count,
+            'total_articles': total_articles,
+            'average_compound_score': round(average_compound, 4),
+            'average_confidence': round(self.total_confidence / total_articles, 2),
+            'overall_sentiment': SentimentAnalyzer._classify_sentiment(average_compound)
+        }
 
 
 class SentimentAnalyzer:
@@ -13,7 +105,13 @@ class SentimentAnalyzer:
     """
     
     def __init__(self):
+        # Imported here so fingerprinting and statistics stay cheap to import;
+        # TextBlob pulls in NLTK
+        from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+        from textblob import TextBlob
+        
         self.vader = SentimentIntensityAnalyzer()
+        self._textblob = TextBlob
     
     def analyze_text(self, text):
         """
@@ -32,7 +130,7 @@ class SentimentAnalyzer:
         vader_scores = self.vader.polarity_scores(text)
         
         # TextBlob Analysis (good for general text)
-        blob = TextBlob(text)
+        blob = self._textblob(text)
         textblob_polarity = blob.sentiment.polarity  # -1 to 1
         textblob_subjectivity = blob.sentiment.subjectivity  # 0 to 1
         
@@ -202,46 +300,56 @@ class SentimentAnalyzer:
             return self._get_empty_batch_result()
         
         results = []
-        positive_count = 0
-        neutral_count = 0
-        negative_count = 0
-        total_compound = 0
-        total_confidence = 0
+        stats = SentimentStats()
         
         for article in articles:
             sentiment = self.analyze_article(article, target_party=target_party)
             results.append(sentiment)
-            
-            # Count classifications
-            if sentiment['classification'] == 'Positive':
-                positive_count += 1
-            elif sentiment['classification'] == 'Negative':
-                negative_count += 1
-            else:
-                neutral_count += 1
-            
-            total_compound += sentiment['compound_score']
-            total_confidence += sentiment['confidence']
-        
-        total_articles = len(articles)
+            stats.add(sentiment)
         
         return {
             'individual_results': results,
-            'overall_statistics': {
-                'positive_percentage': round((positive_count / total_articles) * 100, 2),
-                'neutral_percentage': round((neutral_count / total_articles) * 100, 2),
-                'negative_percentage': round((negative_count / total_articles) * 100, 2),
-                'positive_count': positive_count,
-                'neutral_count': neutral_count,
-                'negative_count': negative_count,
-                'total_articles': total_articles,
-                'average_compound_score': round(total_compound / total_articles, 4),
-                'average_confidence': round(total_confidence / total_articles, 2),
-                'overall_sentiment': self._classify_sentiment(total_compound / total_articles)
-            }
+            'overall_statistics': stats.to_dict()
         }
     
-    def _classify_sentiment(self, compound_score):
+    def analyze_articles_stream(self, articles, target_party=None):
+        """
+        Analyze articles one at a time from any iterable
+        
+        Args:
+            articles (iterable): Article dictionaries, possibly produced lazily
+            target_party (str): Optional party name for party-specific analysis
+            
+        Yields:
+            tuple: (article, sentiment) as soon as each article is scored
+        """
+        for article in articles:
+            yield article, self.analyze_article(article, target_party=target_party)
+    
+    def analyze_pages(self, pages, target_party=None):
+        """
+        Analyze articles page by page, e.g. straight from fetch_news_pages
+        
+        Scoring a page happens while later pages are still downloading, and
+        the running statistics are updated after every page.
+        
+        Args:
+            pages (iterable): Iterable of article lists
+            target_party (str): Optional party name for party-specific analysis
+            
+        Yields:
+            tuple: (page_articles, page_results, running SentimentStats)
+        """
+        stats = SentimentStats()
+        for page in pages:
+            page_results = []
+            for article, sentiment in self.analyze_articles_stream(page, target_party):
+                page_results.append(sentiment)
+                stats.add(sentiment)
+            yield page, page_results, stats
+    
+    @staticmethod
+    def _classify_sentiment(compound_score):
         """
         Classify sentiment based on compound score
         
@@ -301,7 +409,8 @@ class SentimentAnalyzer:
             'textblob_polarity': 0.0
         }
     
-    def _get_empty_batch_result(self):
+    @staticmethod
+    def _get_empty_batch_result():
         """Return empty result for batch analysis with no articles"""
         return {
             'individual_results': [],
@@ -0,0 +1,124 @@
+import os
+import re
+import shutil
+import tempfile
+
+from bulk_reports import generate_combined_report, generate_report_files, load_ingested_analyses
+from news_ingester import store_articles
+
+# (party, state, stored articles); the last pair is over the large-report threshold
+PAIRS = [
+    ("Bharatiya Janata Party (BJP)", "Delhi", 4),
+    ("Indian National Congress (INC)", "Goa", 3),
+    ("Bharatiya Janata Party (BJP)", "Goa", 12),
+]
+LARGE_THRESHOLD = 8
+
+
+def store_sample_articles(db_path):
+    """Store scored sample articles for every pair in PAIRS"""
+    for party, state, count in PAIRS:
+        articles = [{
+            'title': f"{party} in {state}: story {i}",
+            'source': {'name': f"Source {i % 3}"},
+            'publishedAt': f"2025-01-{1 + i:02d}T10:00:00Z",
+            'description': "Leaders met to discuss the budget.",
+            'url': f"https://example.com/{state.lower()}/{party[-4:-1].lower()}/{i}"
+        } for i in range(count)]
+        sentiments = [{
+            'classification': ['Positive', 'Neutral', 'Negative'][i % 3],
+            'confidence': 60 + i, 'compound_score': 0.1,
+            'positive': 0.4, 'neutral': 0.4, 'negative': 0.2
+        } for i in range(count)]
+        store_articles(party, state, articles, sentiments, db_path)
+
+
+def outline_entries(pdf):
+    """
+    Outline items of a ReportLab PDF in file order
+
+    Returns:
+        list: (title, is_leaf) per item; leaves are the per-report entries
+    """
+    entries = []
+    for body in re.findall(rb"\n\d+ 0 obj\s*<<(.*?)>>\s*endobj", pdf, re.S):
+        title = re.search(rb"/Title \(((?:\\.|[^\\)])*)\)", body)
+        if title and b"/Parent" in body:
+            text = re.sub(rb"\\(.)", rb"\1", title.group(1)).decode()
+            entries.append((text, b"/First" not in body))
+    return entries
+
+
+def main():
+    print("\n" + "="*80)
+    print("BULK REPORTS TEST")
+    print("="*80)
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir, "app.db")
+        store_sample_articles(db_path)
+        pairs = [(party, state) for party, state, _ in PAIRS]
+
+        # Test 1: One file per pair on the worker pool
+        print("\n" + "-"*80)
+        print("TEST 1: Batch of report files")
+        print("-"*80)
+
+        analyses = load_ingested_analyses(pairs + [("Aam Aadmi Party (AAP)", "Punjab")], "tester",
+                                          large_threshold=LARGE_THRESHOLD, db_path=db_path)
+        assert len(analyses) == 3
+        assert [bool(data.get('large_report')) for data in analyses] == [False, False, True]
+
+        out_dir = os.path.join(tmp_dir, "reports")
+        done = []
+        # Workers are capped at one per CPU; pretend there are two so the
+        # spawn pool is used even on a single-CPU machine
+        real_cpu_count = os.cpu_count
+        os.cpu_count = lambda: 2
+        try:
+            paths = generate_report_files(analyses, out_dir, max_workers=2,
+                                          progress=lambda count, total, path: done.append(path))
+        finally:
+            os.cpu_count = real_cpu_count
+        assert sorted(done) == sorted(paths) and len(paths) == 3
+        for path in paths:
+            with open(path, "rb") as f:
+                assert f.read(5) == b"%PDF-"
+            print(f"   {os.path.basename(path)}: {os.path.getsize(path) // 1024} KB")
+        assert sorted(os.listdir(out_dir)) == sorted(os.path.basename(path) for path in paths)
+        print("   Every pair rendered, the large one from the store, no temp files left")
+
+        # Test 2: Combined report with an outline
+        print("\n" + "-"*80)
+        print("TEST 2: Combined report outline")
+        print("-"*80)
+
+        analyses = load_ingested_analyses(pairs, "tester", db_path=db_path)
+        combined = os.path.join(tmp_dir, "combined.pdf")
+        generate_combined_report(analyses, combined)
+        with open(combined, "rb") as f:
+            entries = outline_entries(f.read())
+        reports = [title for title, is_leaf in entries if is_leaf]
+        parties = [title for title, is_leaf in entries if not is_leaf]
+        assert len(reports) == len(analyses)
+        # Grouped by party in order of first appearance
+        assert reports == ["Delhi", "Goa", "Goa"]
+        assert parties == ["Bharatiya Janata Party (BJP)", "Indian National Congress (INC)"]
+        print(f"   {len(reports)} report entries under {len(parties)} parties")
+    finally:
+        shutil.rmtree(tmp_dir)
+
+    print("\n" + "="*80)
+    print("✅ Bulk reports are working!")
+    print("="*80 + "\n")
+
+
+# pytest collects this; running the file as a script calls main() directly
+def test_bulk_reports():
+    main()
+
+
+# The worker pool spawns fresh interpreters that import this module
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from database import ConnectionPool, AnalysisWriter, AnalysisHistory, HistoryRetention, SCHEMA
+from history_archive import HistoryArchive
+
+
+def make_analysis(count, label="Positive"):
+    """Articles and an analyze_articles_batch-style result for tests"""
+    articles = [
+        {'source': {'id': None, 'name': 'Example'}, 'author': None, 'title': f"Story {i}",
+         'description': f"About story {i}", 'url': f"https://example.com/{label}/{i}",
+         'urlToImage': None, 'publishedAt': f"2025-01-{i % 28 + 1:02d}T10:00:00Z",
+         'content': f"Full text of story {i}"}
+        for i in range(count)
+    ]
+    sentiments = [{'classification': label, 'compound_score': 0.5, 'confidence': 80.0} for _ in range(count)]
+    stats = {
+        'total_articles': count, 'positive_count': count, 'neutral_count': 0, 'negative_count': 0,
+        'positive_percentage': 100.0, 'neutral_percentage': 0.0, 'negative_percentage': 0.0,
+        'average_compound': 0.5, 'average_confidence': 80.0, 'overall_sentiment': label
+    }
+    return articles, {'individual_results': sentiments, 'overall_statistics': stats}
+
+
+print("\n" + "="*80)
+print("ANALYSIS HISTORY DATABASE TEST")
+print("="*80)
+
+tmp_dir = tempfile.mkdtemp()
+db_path = os.path.join(tmp_dir, "app.db")
+
+try:
+    # A search_history row saved with the old articles_data blob
+    legacy_articles, legacy_results = make_analysis(3, "Neutral")
+    legacy = sqlite3.connect(db_path)
+    legacy.executescript(SCHEMA)
+    with legacy:
+        legacy.execute(
+            "INSERT INTO search_history (username, party, state, articles_count, positive_pct, "
+            "neutral_pct, negative_pct, overall_sentiment, average_confidence, search_date, articles_data) "
+            "VALUES ('carol', 'INC', 'Kerala', 3, 0, 100, 0, 'Neutral', 80, '2024-12-31 09:00:00', ?)",
+            (json.dumps([{'article': a, 'sentiment': r} for a, r in
+                         zip(legacy_articles, legacy_results['individual_results'])]),)
+        )
+        # Blobs that cannot be migrated: truncated JSON and a missing 'article'
+        legacy.executemany(
+            "INSERT INTO search_history (username, party, state, articles_count, search_date, articles_data) "
+            "VALUES ('dave', 'AAP', 'Punjab', 1, '2024-12-30 09:00:00', ?)",
+            [('[{"article": {"title"',), (json.dumps([{'sentiment': {}}]),)]
+        )
+    legacy.close()
+
+    pool = ConnectionPool(db_path, size=3)
+    archive = HistoryArchive(os.path.join(tmp_dir, "archive"))
+    history = AnalysisHistory(pool, AnalysisWriter(pool, batch_size=10), archive)
+
+    # Test 1: WAL mode and the existing table layout
+    print("\n" + "-"*80)
+    print("TEST 1: Pool setup")
+    print("-"*80)
+
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(search_history)")]
+    assert columns[-1] == "articles_data"
+    print("   search_history created, journal_mode=wal")
+
+    # Setup runs on the writer thread; reads flush the writer first
+    history.writer.flush()
+    with pool.connection() as conn:
+        # Unreadable legacy rows are skipped and kept
+        assert [row[0] for row in conn.execute("SELECT username FROM search_history")] == ["dave", "dave"]
+        assert conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'articles_fts'"
+        ).fetchone() is not None
+    print("   Legacy rows migrated (unreadable ones kept) and search index built by the writer thread")
+
+    # Test 2: save() returns at once; rows appear after the writer flushes
+    print("\n" + "-"*80)
+    print("TEST 2: Background saving")
+    print("-"*80)
+
+    articles, results = make_analysis(200)
+    started = time.perf_counter()
+    for _ in range(25):
+        history.writer.save("alice", "BJP", "All States", articles, results)
+    queued_ms = (time.perf_counter() - started) * 1000
+    history.writer.flush()
+    print(f"   Queued 25 analyses of 200 articles in {queued_ms:.2f} ms")
+
+    summaries = history.user_analyses("alice", limit=50)
+    assert len(summaries) == 25
+    assert summaries[0]['articles_count'] == 200
+    assert 'articles_data' not in summaries[0]
+    assert history.user_analyses("bob") == []
+    print("   All 25 rows written")
+
+    # Test 3: Detail round trip
+    print("\n" + "-"*80)
+    print("TEST 3: get_analysis_by_id")
+    print("-"*80)
+
+    detail = history.analysis(summaries[0]['id'])
+    assert detail['articles'] == articles
+    assert detail['individual_results'] == results['individual_results']
+    assert history.analysis(10**6) is None
+    print("   Articles and scores read back intact")
+
+    # Test 4: Threads share the pool while the writer is busy
+    print("\n" + "-"*80)
+    print("TEST 4: Concurrent readers")
+    print("-"*80)
+
+    errors = []
+    def reader():
+        try:
+            for _ in range(20):
+                history.user_analyses("alice", limit=5)
+        except sqlite3.Error as e:
+            errors.append(e)
+    threads = [threading.Thread(target=reader) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for _ in range(10):
+        history.writer.save("bob", "AAP", "Punjab", *make_analysis(20, "Negative"))
+    for thread in threads:
+        thread.join()
+    history.writer.flush()
+    assert not errors, errors
+    assert pool._opened <= 3
+    assert len(history.user_analyses("bob")) == 10
+    print(f"   6 readers and the writer shared {pool._opened} connections")
+
+    # Test 5: Blob migration and article deduplication
+    print("\n" + "-"*80)
+    print("TEST 5: Normalized storage")
+    print("-"*80)
+
+    carol = history.user_analyses("carol")
+    assert len(carol) == 1 and carol[0]['search_date'] == '2024-12-31 09:00:00'
+    assert history.analysis(carol[0]['id'])['articles'] == legacy_articles
+    with pool.connection() as conn:
+        # Unreadable legacy rows are skipped and kept
+        assert [row[0] for row in conn.execute("SELECT username FROM search_history")] == ["dave", "dave"]
+    print("   Legacy articles_data row moved into the normalized tables")
+
+    stats = history.get_stats()
+    # 25 x 200 + 10 x 20 + 3 article scores, but only 200 + 20 + 3 articles
+    assert stats['run_articles'] == 5203
+    assert stats['articles'] == 223
+    assert stats['analysis_runs'] == 36
+    print(f"   {stats['run_articles']} stored scores share {stats['articles']} unique articles")
+
+    # Test 6: Query API
+    print("\n" + "-"*80)
+    print("TEST 6: Article queries")
+    print("-"*80)
+
+    found = history.find_articles(party="AAP", state="Punjab", classification="Negative",
+                                  published_after="2025-01-05", published_before="2025-01-06", limit=500)
+    assert len(found) == 10
+    assert all(entry['article']['publishedAt'].startswith("2025-01-05") for entry in found)
+    assert found[0]['sentiment']['classification'] == "Negative"
+    assert history.find_articles(username="carol", limit=10)[0]['party'] == "INC"
+    runs = history.article_runs("https://example.com/Positive/7")
+    assert len(runs) == 25 and runs[0]['username'] == "alice"
+    print("   Filters by party, state, class, date and article work")
+
+    with pool.connection() as conn:
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM analysis_runs WHERE username = ? ORDER BY search_date DESC",
+            ("alice",)))
+    assert "ix_analysis_runs_username" in plan, plan
+    print("   History lookups use the username index")
+
+    # Test 7: Daily rollups
+    print("\n" + "-"*80)
+    print("TEST 7: Sentiment trend")
+    print("-"*80)
+
+    daily = history.sentiment_trend("BJP")
+    # 200 articles over Jan 1-28, counted once despite 25 runs
+    assert len(daily) == 28
+    assert sum(day['total_articles'] for day in daily) == 200
+    assert daily[0]['date'] == "2025-01-01" and daily[0]['positive_pct'] == 100.0
+    weekly = history.sentiment_trend("BJP", start_date="2025-01-06", end_date="2025-01-19", period="week")
+    assert [week['date'] for week in weekly] == ["2025-01-06", "2025-01-13"]
+    assert sum(week['total_articles'] for week in weekly) == sum(
+        day['total_articles'] for day in daily if "2025-01-06" <= day['date'] <= "2025-01-19")
+    monthly = history.sentiment_trend("AAP", state=None, period="month")
+    assert monthly == [dict(monthly[0], date="2025-01-01", total_articles=20, negative_pct=100.0)]
+    print(f"   {len(daily)} days, {len(weekly)} weeks and 1 month from the rollups")
+
+    history.rebuild_rollups()
+    assert history.sentiment_trend("BJP") == daily
+    print("   Rebuilding from the runs gives the same rollups")
+
+    # The same articles analyzed for a state are counted once across states
+    history.writer.save("erin", "BJP", "Delhi", articles, results)
+    history.writer.flush()
+    assert history.sentiment_trend("BJP", state="Delhi") == daily
+    assert history.sentiment_trend("BJP", state=None) == daily
+    print("   Articles under both All States and a state counted once overall")
+
+    # Test 8: Full-text search
+    print("\n" + "-"*80)
+    print("TEST 8: Article search")
+    print("-"*80)
+
+    farm_articles, farm_results = make_analysis(4, "Negative")
+    for i, article in enumerate(farm_articles):
+        article['url'] = f"https://example.com/farm/{i}"
+    farm_articles[0].update(title="Farm laws protest reaches Punjab", publishedAt="2025-03-02T08:00:00Z")
+    farm_articles[1].update(content="Leaders said the farm law was withdrawn", publishedAt="2025-03-05T08:00:00Z")
+    farm_articles[2].update(description="Farmers protest again", publishedAt="2024-11-20T08:00:00Z")
+    farm_articles[3].update(url="https://example.com/farm-laws", publishedAt="2025-03-09T08:00:00Z",
+                            title="Budget session", content="No mention of farm laws here either")
+    history.writer.save("dave", "AAP", "Punjab", farm_articles, farm_results)
+    history.writer.flush()
+
+    query = dict(query='"farm laws"', party="AAP", state="Punjab", published_after="2025-01-01")
+    assert history.count_search_results(**query) == 3
+    found = history.search_articles(**query, limit=2)
+    assert found[0]['article']['title'] == "Farm laws protest reaches Punjab"
+    assert found[0]['snippet'] == "**Farm laws** protest reaches Punjab"
+    assert found[0]['classification'] == "Negative"
+    assert len(history.search_articles(**query, limit=2, offset=2)) == 1
+    assert history.search_articles('"farm laws"', party="BJP") == []
+    print("   Phrase, party, state and date filters; title matches rank first")
+
+    assert history.count_search_results("protest", published_after="2024-01-01") == 2
+    assert history.search_articles('story 1', party="INC")[0]['state'] == "Kerala"
+    assert history.search_articles('AND ( "') == []
+    print("   Stemming, backfilled articles and operator characters handled")
+
+    # Test 9: Keyset-paginated history
+    print("\n" + "-"*80)
+    print("TEST 9: History pages")
+    print("-"*80)
+
+    expected = [row['id'] for row in history.user_analyses("alice", limit=100)]
+    seen = []
+    page, cursor = history.history_page("alice", limit=7)
+    while True:
+        seen += [row['id'] for row in page]
+        if cursor is None:
+            break
+        if len(seen) == 14:
+            # A new analysis saved while paging does not shift later pages
+            history.writer.save("alice", "BJP", "All States", *make_analysis(1))
+            history.writer.flush()
+        page, cursor = history.history_page("alice", limit=7, cursor=cursor)
+    # Many runs share one search_date second; the id breaks the ties
+    assert seen == expected, (seen, expected)
+    assert len(history.history_page("alice", limit=26)[0]) == 26
+    assert history.history_page("nobody") == ([], None)
+    print(f"   {len(seen)} analyses in pages of 7, each exactly once, newest first")
+
+    with pool.connection() as conn:
+        plan = " ".join(row[3] for row in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM analysis_runs WHERE username = ? "
+            "AND (search_date, id) < (?, ?) ORDER BY search_date DESC, id DESC LIMIT 8",
+            ("alice", "2030-01-01", 1)))
+    assert "ix_analysis_runs_username" in plan and "TEMP B-TREE" not in plan, plan
+    print("   Pages seek on the (username, search_date, id) index without sorting")
+
+    # Test 10: Retention, archive and vacuum
+    print("\n" + "-"*80)
+    print("TEST 10: History retention")
+    print("-"*80)
+
+    trend = history.sentiment_trend("BJP")
+    alice_ids = [row['id'] for row in history.user_analyses("alice", limit=100)]
+    carol_id = history.user_analyses("carol")[0]['id']
+    retention = HistoryRetention(history, retention_days=90, vacuum_pages=100000, batch_size=7)
+    retention.enable_incremental_vacuum()
+
+    result = retention.run(now=datetime(2025, 6, 1))
+    assert result['archived'] == 1 and result['compacted_articles'] == 3
+    assert os.listdir(archive.archive_dir) == ["history-2024-12.jsonl.gz"]
+    assert history.user_analyses("carol")[0]['id'] == carol_id
+    assert history.analysis(carol_id)['articles'] == legacy_articles
+    print("   Analysis past the cutoff archived; still listed and opened lazily")
+
+    result = retention.run(now=datetime.now() + timedelta(days=91))
+    stats = history.get_stats()
+    # The newest run stays so its id is never reused
+    assert stats['analysis_runs'] == 1 and stats['archived_runs'] == 38
+    assert result['freed_pages'] > 0
+    assert [row['id'] for row in history.user_analyses("alice", limit=100)] == alice_ids
+    assert history.analysis(alice_ids[-1])['articles'] == articles
+    assert history.sentiment_trend("BJP") == trend
+    history.rebuild_rollups()
+    assert history.sentiment_trend("BJP") == trend
+    with pool.connection() as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+        assert conn.execute(
+            "SELECT COUNT(*) FROM articles WHERE title IS NOT NULL").fetchone()[0] == 1
+    print(f"   {stats['archived_runs']} analyses archived, {result['freed_pages']} pages freed; "
+          "pages and trends unchanged")
+
+    history.writer.save("alice", "BJP", "All States", articles, results)
+    history.writer.flush()
+    newest = history.user_analyses("alice", limit=1)[0]
+    assert newest['id'] > max(alice_ids)
+    assert history.analysis(newest['id'])['articles'] == articles
+    assert history.sentiment_trend("BJP") == trend
+    print("   Articles saved again get their text back without being recounted")
+
+    history.writer.close()
+    pool.close()
+finally:
+    shutil.rmtree(tmp_dir)
+
+print("\n" + "="*80)
+print("✅ Analysis history database is working!")
+print("="*80 + "\n")
@@ -0,0 +1,106 @@
+import ast
+import os
+import subprocess
+import sys
+
+from config import STARTUP_IMPORT_BUDGET_MS
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Libraries the login page must not load
+HEAVY_MODULES = ['vaderSentiment', 'textblob', 'nltk', 'reportlab', 'matplotlib', 'plotly']
+
+
+def startup_imports():
+    """Modules imported at the top level of app.py (streamlit excluded)"""
+    with open(os.path.join(ROOT, "app.py")) as f:
+        tree = ast.parse(f.read())
+    modules = []
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0:
+            modules.append(node.module)
+    return [name for name in dict.fromkeys(modules) if name.split('.')[0] != 'streamlit']
+
+
+def profile_imports(modules, preload=()):
+    """
+    Import modules in a fresh interpreter under -X importtime
+
+    Returns:
+        tuple: (milliseconds spent importing `modules`, heavy modules they
+            loaded; ones already loaded by `preload` are not counted)
+    """
+    code = "; ".join(
+        [f"import {name}" for name in preload]
+        + ["import sys", "preloaded = set(sys.modules)", "print('IMPORTS-DONE', file=sys.stderr)"]
+        + [f"import {name}" for name in modules]
+        + [f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in preloaded))"]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    total_us = 0
+    measuring = False
+    for line in result.stderr.splitlines():
+        if line == 'IMPORTS-DONE':
+            measuring = True
+            continue
+        if not measuring or not line.startswith("import time:"):
+            continue
+        _, cumulative, package = line.split("|")
+        # Only top-level entries; nested ones are included in their parent
+        if not package.startswith("  "):
+            total_us += int(cumulative)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total_us / 1000, loaded
+
+
+print("\n" + "="*80)
+print("STARTUP IMPORT BUDGET TEST")
+print("="*80)
+
+# Test 1: Heavy libraries stay out of the login page
+print("\n" + "-"*80)
+print("TEST 1: No NLP, PDF or plotting libraries at startup")
+print("-"*80)
+
+modules = startup_imports()
+print(f"   app.py imports: {', '.join(modules)}")
+timings = []
+for _ in range(3):
+    elapsed_ms, loaded = profile_imports(modules, preload=['streamlit'])
+    assert not loaded, f"Startup imports load heavy libraries: {loaded}"
+    timings.append(elapsed_ms)
+print("   None of the heavy libraries were imported")
+
+# Test 2: Startup import time fits the budget (best of 3 runs to skip noise)
+print("\n" + "-"*80)
+print("TEST 2: Startup import time")
+print("-"*80)
+
+best_ms = min(timings)
+print(f"   {best_ms:.1f} ms (budget {STARTUP_IMPORT_BUDGET_MS} ms)")
+assert best_ms <= STARTUP_IMPORT_BUDGET_MS, (
+    f"Startup imports took {best_ms:.1f} ms, over the {STARTUP_IMPORT_BUDGET_MS} ms budget"
+)
+
+# Test 3: Worker-side modules do not drag in streamlit or the NLP stack
+print("\n" + "-"*80)
+print("TEST 3: Worker and tool imports")
+print("-"*80)
+
+for name in ['config', 'sentiment_analyzer', 'pdf_jobs', 'news_ingester']:
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {name}; print('streamlit' in sys.modules, 'textblob' in sys.modules)"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ['False', 'False'], f"import {name} loads streamlit or textblob"
+    print(f"   import {name}: no streamlit, no textblob")
+
+print("\n" + "="*80)
+print("✅ Startup imports are within budget!")
+print("="*80 + "\n")
@@ -0,0 +1,182 @@
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from api_key_pool import APIKeyPool
+from config import NEWS_API_RESULT_LIMIT
+from news_fetcher import fetch_news_pages, NewsAPIError
+from news_ingester import NewsIngester, advance_last_seen, get_ingested_articles
+from newsapi_standin import StandinConfig, make_server, synthetic_articles
+
+
+class CaptivePortalHandler(BaseHTTPRequestHandler):
+    """Answers every request with an HTML page, like a proxy login screen"""
+
+    def do_GET(self):
+        body = b"<html><body>Please sign in</body></html>"
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def expect_news_api_error(pool, base_url):
+    """Run a one-page fetch that must fail; return the error message"""
+    try:
+        list(fetch_news_pages("BJP", "All States", pool, max_articles=10, page_size=10,
+                              base_url=base_url))
+    except NewsAPIError as e:
+        return str(e)
+    raise AssertionError("expected NewsAPIError")
+
+
+def main():
+    corpus = synthetic_articles(250)
+    # Two copies of the newest article, as syndicated stories show up in News API
+    duplicate = max(corpus, key=lambda article: article['publishedAt'])
+    corpus.append(dict(duplicate))
+    config = StandinConfig({}, corpus)
+    server = make_server(config, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    newest_first = config.corpus
+
+    print("\n" + "="*80)
+    print("NEWS API FETCHING TEST (stand-in server)")
+    print("="*80)
+
+    try:
+        # Test 1: Pages are fetched concurrently but yielded in order
+        print("\n" + "-"*80)
+        print("TEST 1: Paginated fetch")
+        print("-"*80)
+
+        pool = APIKeyPool(["key-one", "key-two"])
+        pages = list(fetch_news_pages("BJP", "All States", pool, max_articles=100, page_size=20,
+                                      base_url=base_url))
+        articles = [article for page in pages for article in page]
+        urls = [article['url'] for article in articles]
+        assert len(pages) == 5
+        # 100 results requested; the second copy of the duplicate is dropped
+        assert len(urls) == 99 and len(set(urls)) == 99
+        assert [a['publishedAt'] for a in articles] == sorted((a['publishedAt'] for a in articles), reverse=True)
+        assert urls.count(duplicate['url']) == 1
+        assert urls[-1] == newest_first[99]['url']
+        print(f"   {len(urls)} unique articles in {len(pages)} pages, newest first")
+
+        stats = pool.get_usage_stats()
+        assert sum(key['requests_today'] for key in stats) == 5
+        assert all(key['requests_today'] > 0 for key in stats)
+        print("   Requests spread over both keys")
+
+        # Test 2: Stop rules
+        print("\n" + "-"*80)
+        print("TEST 2: Stop rules")
+        print("-"*80)
+
+        requests_before = config.stats['requests']
+        pages = list(fetch_news_pages("BJP", "All States", pool, max_articles=30, page_size=20,
+                                      base_url=base_url))
+        assert sum(len(page) for page in pages) == 30
+        assert config.stats['requests'] - requests_before == 2
+        print("   max_articles: 30 articles from 2 requests")
+
+        pages = list(fetch_news_pages("BJP", "All States", pool, max_articles=1000, page_size=50,
+                                      base_url=base_url))
+        reachable = min(NEWS_API_RESULT_LIMIT, len(corpus))
+        assert sum(len(page) for page in pages) == reachable - 1
+        print(f"   Result limit: {reachable} results reachable, {reachable - 1} unique")
+
+        cutoff = newest_first[40]['publishedAt']
+        pages = list(fetch_news_pages("BJP", "All States", pool, max_articles=1000, page_size=20,
+                                      oldest=cutoff, base_url=base_url))
+        fetched = [article for page in pages for article in page]
+        assert fetched and all(article['publishedAt'] >= cutoff for article in fetched)
+        assert len(fetched) == sum(1 for a in newest_first if a['publishedAt'] >= cutoff) - 1
+        print(f"   oldest: {len(fetched)} articles published since {cutoff}")
+
+        # Test 3: Key pool quarantine
+        print("\n" + "-"*80)
+        print("TEST 3: Rejected and rate-limited keys")
+        print("-"*80)
+
+        config.invalid_keys.add("revoked")
+        pool = APIKeyPool(["revoked", "good"], daily_quota=100)
+        # The pool alternates between keys with equal quota left, so one of
+        # two single-page fetches tries the revoked key whichever goes first
+        for _ in range(2):
+            pages = list(fetch_news_pages("BJP", "All States", pool, max_articles=10, page_size=10,
+                                          base_url=base_url))
+            assert pages and pages[0]
+        revoked, good = pool.get_usage_stats()
+        assert revoked['quarantined'] and revoked['last_status'] == 401
+        assert not good['quarantined'] and good['last_status'] == 200
+        print("   401: key quarantined, request retried with the next key")
+
+        config.rate_limit_rate = 1.0
+        pool = APIKeyPool(["busy"], daily_quota=100, cooldown=600)
+        expect_news_api_error(pool, base_url)
+        busy = pool.get_usage_stats()[0]
+        assert busy['quarantined'] and busy['last_status'] == 429
+        assert 590 < busy['cooldown_remaining'] <= 600
+        # Rate limited is not out of quota: the key is back after the cooldown
+        assert busy['remaining_today'] == 99
+        config.rate_limit_rate = 0.0
+        print("   429: key cools down without losing its daily quota")
+
+        assert "No News API key configured" in expect_news_api_error(APIKeyPool([]), base_url)
+        print("   No keys: reported as not configured")
+
+        portal = HTTPServer(("127.0.0.1", 0), CaptivePortalHandler)
+        threading.Thread(target=portal.serve_forever, daemon=True).start()
+        try:
+            message = expect_news_api_error(APIKeyPool(["key"]),
+                                            f"http://127.0.0.1:{portal.server_address[1]}")
+            assert "non-JSON" in message
+        finally:
+            portal.shutdown()
+            portal.server_close()
+        print("   200 with an HTML body: NewsAPIError, not a bare ValueError")
+
+        # Test 4: Ingester pages back to its last-seen marker
+        print("\n" + "-"*80)
+        print("TEST 4: Ingesting more new articles than one fetch returns")
+        print("-"*80)
+
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            db_path = os.path.join(tmp_dir, "app.db")
+            marker = newest_first[220]['publishedAt']
+            advance_last_seen("BJP", "All States", marker, db_path)
+            ingester = NewsIngester(APIKeyPool(["key"]), watch_list=[], max_articles=100,
+                                    db_path=db_path, base_url=base_url)
+            ingester.poll_query("BJP", "All States")
+            stored, _ = get_ingested_articles("BJP", "All States", db_path=db_path)
+            expected = {a['url'] for a in newest_first if a['publishedAt'] >= marker}
+            assert {article['url'] for article in stored} == expected
+            print(f"   {len(stored)} new articles stored with a 100-article fetch cap")
+        finally:
+            shutil.rmtree(tmp_dir)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("\n" + "="*80)
+    print("✅ News API fetching is working!")
+    print("="*80 + "\n")
+
+
+# pytest collects this; running the file as a script calls main() directly
+def test_news_api():
+    main()
+
+
+if __name__ == '__main__':
+    main()
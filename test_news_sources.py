@@ -0,0 +1,143 @@
+import os
+import shutil
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from news_sources import RSSSource, NewsSourceError, iter_feed_items, fetch_from_sources, matches_query
+
+FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "feeds")
+RSS_FEED = os.path.join(FEEDS_DIR, "sample_rss.xml")
+ATOM_FEED = os.path.join(FEEDS_DIR, "sample_atom.xml")
+
+print("\n" + "="*80)
+print("RSS/ATOM SOURCE ADAPTER TEST")
+print("="*80)
+
+# Test 1: RSS items are normalized into the News API article shape
+print("\n" + "-"*80)
+print("TEST 1: Parsing RSS 2.0 feed")
+print("-"*80)
+
+with open(RSS_FEED, "rb") as f:
+    rss_items = list(iter_feed_items(f))
+
+assert len(rss_items) == 3
+first = rss_items[0]
+assert first['title'] == 'BJP wins massive victory in Maharashtra elections'
+assert first['description'] == 'The party celebrates historic success with record turnout & rallies.'
+assert first['source']['name'] == 'Sample National News'
+assert first['author'] == 'Staff Reporter'
+assert first['publishedAt'] == '2025-01-06T05:00:00Z'
+assert first['urlToImage'] == 'https://example.com/img/bjp.jpg'
+assert rss_items[2]['urlToImage'] == 'https://example.com/img/aap.png'
+for item in rss_items:
+    print(f"   {item['publishedAt']}  {item['title']}")
+
+# Test 2: Atom entries
+print("\n" + "-"*80)
+print("TEST 2: Parsing Atom feed")
+print("-"*80)
+
+with open(ATOM_FEED, "rb") as f:
+    atom_items = list(iter_feed_items(f))
+
+assert len(atom_items) == 2
+assert atom_items[0]['url'] == 'https://example.org/tmc-rally'
+assert atom_items[0]['description'] == 'Thousands gather to hear TMC leaders speak.'
+assert atom_items[0]['author'] == 'Desk Editor'
+assert atom_items[1]['publishedAt'] == '2025-01-05T11:10:00Z'
+for item in atom_items:
+    print(f"   {item['publishedAt']}  {item['title']}")
+
+# Test 3: max_items stops parsing early
+with open(RSS_FEED, "rb") as f:
+    assert len(list(iter_feed_items(f, max_items=1))) == 1
+
+# Test 4: Party/state filtering
+print("\n" + "-"*80)
+print("TEST 3: Party and state matching")
+print("-"*80)
+
+assert matches_query(rss_items[0], "Bharatiya Janata Party (BJP)", "Maharashtra")
+assert not matches_query(rss_items[0], "Bharatiya Janata Party (BJP)", "Punjab")
+assert matches_query(rss_items[2], "Aam Aadmi Party (AAP)", "All States")
+assert not matches_query(rss_items[1], "Aam Aadmi Party (AAP)", "All States")
+print("   Matching works for full names, abbreviations and states")
+
+# Test 5: Sources are combined and deduplicated by URL
+print("\n" + "-"*80)
+print("TEST 4: Combining sources")
+print("-"*80)
+
+sources = [RSSSource(RSS_FEED), RSSSource(ATOM_FEED), RSSSource("file://" + RSS_FEED)]
+pages = list(fetch_from_sources(sources, "Bharatiya Janata Party (BJP)", "All States", max_articles=10))
+urls = [article['url'] for page in pages for article in page]
+assert urls == ['https://example.com/news/bjp-maharashtra-victory', 'https://example.org/bjp-delhi-budget']
+print(f"   {len(urls)} unique BJP articles from {len(sources)} sources")
+
+pages = list(fetch_from_sources(sources, "Bharatiya Janata Party (BJP)", "All States",
+                                max_articles=10, oldest="2025-01-06"))
+assert [article['url'] for page in pages for article in page] == ['https://example.com/news/bjp-maharashtra-victory']
+
+# Test 6: Unchanged local files are not re-parsed
+print("\n" + "-"*80)
+print("TEST 5: Conditional reload of local feed")
+print("-"*80)
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    feed_copy = os.path.join(tmp_dir, "feed.xml")
+    shutil.copy(RSS_FEED, feed_copy)
+    source = RSSSource(feed_copy)
+    first_load = source.load_items()
+    assert source.load_items() is first_load
+
+    shutil.copy(ATOM_FEED, feed_copy)
+    os.utime(feed_copy, (1, 1))
+    assert len(source.load_items()) == 2
+    print("   Feed is re-parsed only after it changes")
+finally:
+    shutil.rmtree(tmp_dir)
+
+# Test 6: A remote feed cut off part way through
+print("\n" + "-"*80)
+print("TEST 6: Connection dropped while streaming a remote feed")
+print("-"*80)
+
+with open(RSS_FEED, "rb") as f:
+    feed_bytes = f.read()
+
+
+class TruncatedFeedHandler(BaseHTTPRequestHandler):
+    """Promises the whole feed, sends half of it, then hangs up"""
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(feed_bytes)))
+        self.end_headers()
+        self.wfile.write(feed_bytes[:len(feed_bytes) // 2])
+        self.wfile.flush()
+        self.close_connection = True
+
+    def log_message(self, *args):
+        pass
+
+
+server = HTTPServer(("127.0.0.1", 0), TruncatedFeedHandler)
+threading.Thread(target=server.serve_forever, daemon=True).start()
+try:
+    source = RSSSource(f"http://127.0.0.1:{server.server_address[1]}/feed.xml")
+    try:
+        source.load_items()
+        raise AssertionError("expected NewsSourceError")
+    except NewsSourceError as e:
+        print(f"   NewsSourceError: {e}")
+finally:
+    server.shutdown()
+    server.server_close()
+
+print("\n" + "="*80)
+print("✅ RSS/Atom source adapters are working!")
+print("="*80 + "\n")
@@ -0,0 +1,199 @@
+import builtins
+import os
+import re
+import shutil
+import tempfile
+import tracemalloc
+
+from io import BytesIO
+
+from reportlab.graphics.shapes import Drawing
+from reportlab.lib.pagesizes import letter
+from reportlab.platypus import Image, SimpleDocTemplate
+
+import pdf_generator
+from pdf_generator import (
+    build_chart_flowables, build_header_flowables, generate_large_sentiment_pdf,
+    generate_sentiment_pdf_bytes, get_report_styles, iter_article_flowables
+)
+from sentiment_analyzer import SentimentStats
+
+CLASSIFICATIONS = ['Positive', 'Neutral', 'Negative', 'Positive']
+
+
+def sample_scored(count):
+    """Yield (article, sentiment) pairs shaped like analyze_articles_stream output"""
+    for i in range(count):
+        article = {
+            'title': f"Sample article {i} on the state assembly session",
+            'source': {'name': f"Source {i % 7}"},
+            'publishedAt': f"2025-01-{1 + i % 28:02d}T10:00:00Z",
+            'description': "Leaders met to discuss the budget and new welfare schemes. " * 4,
+            'url': f"https://example.com/articles/{i}"
+        }
+        sentiment = {
+            'classification': CLASSIFICATIONS[i % len(CLASSIFICATIONS)],
+            'confidence': 50 + i % 40,
+            'compound_score': (i % 11 - 5) / 10,
+            'positive': 0.3, 'neutral': 0.5, 'negative': 0.2
+        }
+        yield article, sentiment
+
+
+def sample_report_data(count=10):
+    """Report data as the app's PDF export builds it"""
+    scored = list(sample_scored(count))
+    stats = SentimentStats()
+    for _, sentiment in scored:
+        stats.add(sentiment)
+    overall = stats.to_dict()
+    return {
+        'party': 'Bharatiya Janata Party (BJP)',
+        'state': 'Delhi',
+        'username': 'tester',
+        'articles_count': overall['total_articles'],
+        'positive_pct': overall['positive_percentage'],
+        'neutral_pct': overall['neutral_percentage'],
+        'negative_pct': overall['negative_percentage'],
+        'positive_count': overall['positive_count'],
+        'neutral_count': overall['neutral_count'],
+        'negative_count': overall['negative_count'],
+        'insights': ["Coverage is mostly positive", "Budget debates dominate"],
+        'articles': [article for article, _ in scored],
+        'individual_sentiments': [sentiment for _, sentiment in scored],
+        'average_confidence': overall['average_confidence'],
+        'overall_sentiment': overall['overall_sentiment']
+    }
+
+
+def page_count(pdf):
+    """Number of page objects in a PDF"""
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+def image_count(pdf):
+    """Number of raster image objects (including alpha masks) in a PDF"""
+    return len(re.findall(rb"/Subtype /Image\b", pdf))
+
+
+def peak_memory(render):
+    """Peak traced allocation while render() runs, in bytes"""
+    tracemalloc.start()
+    try:
+        render()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+print("\n" + "="*80)
+print("PDF GENERATOR TEST")
+print("="*80)
+
+# Test 1: Reports are rendered in memory
+print("\n" + "-"*80)
+print("TEST 1: In-memory report")
+print("-"*80)
+
+written = []
+real_open = builtins.open
+
+def recording_open(file, mode='r', *args, **kwargs):
+    if any(flag in mode for flag in 'wax+'):
+        written.append(file)
+    return real_open(file, mode, *args, **kwargs)
+
+temp_before = set(os.listdir(tempfile.gettempdir()))
+builtins.open = recording_open
+try:
+    pdf = generate_sentiment_pdf_bytes(sample_report_data())
+finally:
+    builtins.open = real_open
+
+assert pdf.startswith(b"%PDF-") and pdf.rstrip().endswith(b"%%EOF")
+# Summary and charts take two pages, then three articles a page
+assert page_count(pdf) == 6
+assert written == [], written
+assert set(os.listdir(tempfile.gettempdir())) - temp_before == set()
+print(f"   {len(pdf) // 1024} KB, {page_count(pdf)} pages, no file written")
+
+# Test 2: Charts are vector drawings, with matplotlib as the fallback
+print("\n" + "-"*80)
+print("TEST 2: Chart backends")
+print("-"*80)
+
+data = sample_report_data()
+header_only = BytesIO()
+SimpleDocTemplate(header_only, pagesize=letter).build(build_header_flowables(data, get_report_styles()))
+logo_images = image_count(header_only.getvalue())
+
+assert all(isinstance(chart, Drawing) for chart in build_chart_flowables(data))
+assert image_count(pdf) == logo_images
+print(f"   Default: vector drawings, no raster images besides the logo ({logo_images} objects)")
+
+real_backend = pdf_generator.PDF_CHART_BACKEND
+real_drawings = pdf_generator.create_sentiment_drawings
+try:
+    pdf_generator.PDF_CHART_BACKEND = 'matplotlib'
+    assert all(isinstance(chart, Image) for chart in build_chart_flowables(data))
+    raster_pdf = generate_sentiment_pdf_bytes(data)
+    assert image_count(raster_pdf) > logo_images
+    print(f"   PDF_CHART_BACKEND=matplotlib: {image_count(raster_pdf) - logo_images} raster chart objects")
+
+    def broken_drawings(data):
+        raise ValueError("drawing failed")
+
+    pdf_generator.PDF_CHART_BACKEND = 'reportlab'
+    pdf_generator.create_sentiment_drawings = broken_drawings
+    assert all(isinstance(chart, Image) for chart in build_chart_flowables(data))
+    assert page_count(generate_sentiment_pdf_bytes(data)) == page_count(pdf)
+    print("   Vector drawing failure: falls back to matplotlib")
+finally:
+    pdf_generator.PDF_CHART_BACKEND = real_backend
+    pdf_generator.create_sentiment_drawings = real_drawings
+
+tmp_dir = tempfile.mkdtemp()
+try:
+    # Test 3: Large reports stream their articles
+    print("\n" + "-"*80)
+    print("TEST 3: Large report memory and appendix totals")
+    print("-"*80)
+
+    data = {'party': 'Bharatiya Janata Party (BJP)', 'state': 'Delhi', 'username': 'tester'}
+    large_path = os.path.join(tmp_dir, "large.pdf")
+    # Warm the style, font and chart caches so they are not measured
+    generate_large_sentiment_pdf(large_path, data, sample_scored(10))
+
+    count = 300
+    totals = {}
+
+    def render_large():
+        totals.update(generate_large_sentiment_pdf(large_path, data, sample_scored(count)))
+
+    def render_eager():
+        doc = SimpleDocTemplate(os.path.join(tmp_dir, "eager.pdf"), pagesize=letter)
+        doc.build(list(iter_article_flowables(sample_scored(count), get_report_styles())))
+
+    lazy_peak = peak_memory(render_large)
+    eager_peak = peak_memory(render_eager)
+    # ReportLab still keeps each finished page until the file is written, but
+    # the article flowables must not pile up as they do when built up front
+    assert lazy_peak < 0.75 * eager_peak, (lazy_peak, eager_peak)
+    print(f"   {count} articles: peak {lazy_peak / 1e6:.1f} MB streamed, "
+          f"{eager_peak / 1e6:.1f} MB with all flowables built up front")
+
+    expected = SentimentStats()
+    for _, sentiment in sample_scored(count):
+        expected.add(sentiment)
+    assert totals == expected.to_dict()
+    assert totals['total_articles'] == count
+    with open(large_path, "rb") as f:
+        assert f.read(5) == b"%PDF-"
+    print(f"   Appendix totals match the input: {totals['positive_count']} positive, "
+          f"{totals['neutral_count']} neutral, {totals['negative_count']} negative")
+finally:
+    shutil.rmtree(tmp_dir)
+
+print("\n" + "="*80)
+print("✅ PDF generator is working!")
+print("="*80 + "\n")
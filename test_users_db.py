@@ -0,0 +1,121 @@
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from users_db import UserStore, LoginRecorder, hash_password
+
+print("\n" + "="*80)
+print("USER STORE TEST")
+print("="*80)
+
+tmp_dir = tempfile.mkdtemp()
+db_path = os.path.join(tmp_dir, "app.db")
+users_file = os.path.join(tmp_dir, "users_data.json")
+
+try:
+    # Test 1: One-shot migration from the legacy JSON file
+    print("\n" + "-"*80)
+    print("TEST 1: Migrating users_data.json")
+    print("-"*80)
+
+    with open(users_file, "w") as f:
+        json.dump({
+            "alice": {"password": hash_password("secret"), "email": "alice@example.com", "full_name": "Alice"},
+            "bob": {"password": hash_password("hunter2"), "email": "bob@example.com", "full_name": "Bob"}
+        }, f)
+
+    store = UserStore(db_path, users_file)
+    assert not os.path.exists(users_file)
+    assert os.path.exists(users_file + ".migrated")
+    assert store.usernames() == ["alice", "bob"]
+    assert store.get("alice")["email"] == "alice@example.com"
+    assert "login_count" not in store.get("alice")
+    print("   Users imported and JSON file retired")
+
+    # Test 2: Cached reads see writes from this store and from other connections
+    print("\n" + "-"*80)
+    print("TEST 2: Read cache invalidation")
+    print("-"*80)
+
+    assert store.get("bob")["full_name"] == "Bob"
+    assert store.update("bob", full_name="Robert")
+    assert store.get("bob")["full_name"] == "Robert"
+
+    other = sqlite3.connect(db_path)
+    with other:
+        other.execute("UPDATE users SET email = 'new@example.com' WHERE username = 'bob'")
+    other.close()
+    assert store.get("bob")["email"] == "new@example.com"
+
+    # Other tables in the shared app database do not invalidate the cache
+    other = sqlite3.connect(db_path)
+    with other:
+        other.execute("CREATE TABLE analysis_runs (id INTEGER PRIMARY KEY, username TEXT)")
+        other.execute("INSERT INTO analysis_runs (username) VALUES ('bob')")
+    other.close()
+    assert store.get("bob")["email"] == "new@example.com"
+    assert "bob" in store._cache
+
+    assert store.delete("bob")
+    assert store.get("bob") is None
+    print("   Cache follows local and external user writes, not other tables")
+
+    # Test 3: Concurrent signups for one username - exactly one wins
+    print("\n" + "-"*80)
+    print("TEST 3: Concurrent signups")
+    print("-"*80)
+
+    results = []
+    def signup():
+        results.append(store.add("carol", hash_password("pw"), "carol@example.com", "Carol"))
+    threads = [threading.Thread(target=signup) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results.count(True) == 1
+    assert store.usernames() == ["alice", "carol"]
+    print("   1 of 8 concurrent signups succeeded")
+
+    # Test 4: Login telemetry is buffered and written in batches
+    print("\n" + "-"*80)
+    print("TEST 4: Batched login telemetry")
+    print("-"*80)
+
+    store.get("alice")
+    version_before_logins = store._current_users_version()
+    recorder = LoginRecorder(store, flush_interval=3600, flush_size=5)
+    for minute in range(3):
+        recorder.record("alice", f"2025-01-01 10:0{minute}:00")
+    assert store.activity(username="alice")[0]['login_count'] == 0
+
+    recorder.record("carol", "2025-01-01 09:00:00")
+    recorder.record("alice", "2025-01-01 09:30:00")
+    for _ in range(50):
+        if store.activity(username="alice")[0]['login_count']:
+            break
+        time.sleep(0.02)
+    alice = store.activity(username="alice")[0]
+    assert alice['login_count'] == 4
+    # Telemetry does not touch the cached account columns
+    assert store._current_users_version() == version_before_logins
+    assert "alice" in store._cache
+    assert alice['last_login'] == "2025-01-01 10:02:00"
+    print("   Size threshold flushed 5 logins in one batch")
+
+    recorder.record("carol", "2025-01-02 08:00:00")
+    recorder.close()
+    assert store.activity(username="carol")[0]['login_count'] == 2
+    assert [row['username'] for row in store.activity(limit=2)] == ["carol", "alice"]
+    assert [row['username'] for row in store.activity(since="2025-01-02")] == ["carol"]
+    print("   Pending logins flushed on shutdown; activity queries see them")
+finally:
+    shutil.rmtree(tmp_dir)
+
+print("\n" + "="*80)
+print("✅ User store is working!")
+print("="*80 + "\n")
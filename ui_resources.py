@@ -0,0 +1,143 @@
+"""
+UI Resources for the Streamlit App
+Static option lists and memoized assets/figures. Streamlit re-executes
+app.py on every rerun, so anything built here (an imported module) is
+created once per process instead of once per interaction.
+"""
+
+import functools
+
+from colors import MAIN_BLUE, SENTIMENT_COLORS
+
+LOGO_PATH = "assets/svgviewer-png-output.png"
+
+# Indian Political Parties
+INDIAN_PARTIES = (
+    "Bharatiya Janata Party (BJP)",
+    "Indian National Congress (INC)",
+    "Aam Aadmi Party (AAP)",
+    "Trinamool Congress (TMC)",
+    "Dravida Munnetra Kazhagam (DMK)",
+    "All India Anna Dravida Munnetra Kazhagam (AIADMK)",
+    "Shiv Sena",
+    "Nationalist Congress Party (NCP)",
+    "Communist Party of India (Marxist) (CPI-M)",
+    "Communist Party of India (CPI)",
+    "Bahujan Samaj Party (BSP)",
+    "Samajwadi Party (SP)",
+    "Rashtriya Janata Dal (RJD)",
+    "Janata Dal (United) (JD-U)",
+    "Janata Dal (Secular) (JD-S)",
+    "Biju Janata Dal (BJD)",
+    "Telangana Rashtra Samithi (TRS/BRS)",
+    "YSR Congress Party (YSRCP)",
+    "Telugu Desam Party (TDP)",
+    "Shiromani Akali Dal (SAD)",
+    "Indian Union Muslim League (IUML)",
+    "All India Majlis-e-Ittehadul Muslimeen (AIMIM)",
+    "Other"
+)
+
+# Indian States and Union Territories
+INDIAN_STATES = (
+    "Andhra Pradesh",
+    "Arunachal Pradesh",
+    "Assam",
+    "Bihar",
+    "Chhattisgarh",
+    "Goa",
+    "Gujarat",
+    "Haryana",
+    "Himachal Pradesh",
+    "Jharkhand",
+    "Karnataka",
+    "Kerala",
+    "Madhya Pradesh",
+    "Maharashtra",
+    "Manipur",
+    "Meghalaya",
+    "Mizoram",
+    "Nagaland",
+    "Odisha",
+    "Punjab",
+    "Rajasthan",
+    "Sikkim",
+    "Tamil Nadu",
+    "Telangana",
+    "Tripura",
+    "Uttar Pradesh",
+    "Uttarakhand",
+    "West Bengal",
+    "Andaman and Nicobar Islands",
+    "Chandigarh",
+    "Dadra and Nagar Haveli and Daman and Diu",
+    "Delhi",
+    "Jammu and Kashmir",
+    "Ladakh",
+    "Lakshadweep",
+    "Puducherry",
+    "All States"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def load_logo_bytes():
+    """Read the logo file once and serve the same bytes afterwards"""
+    with open(LOGO_PATH, "rb") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=128)
+def build_sentiment_figures(counts, percentages):
+    """
+    Build the sentiment pie and bar charts, memoized by their data
+
+    Args:
+        counts (tuple): (positive, neutral, negative) article counts
+        percentages (tuple): (positive, neutral, negative) percentages
+
+    Returns:
+        tuple: (pie_figure, bar_figure) Plotly figures - treat as read-only
+    """
+    import plotly.graph_objects as go
+
+    # Pie chart - Sentiment distribution
+    fig_pie = go.Figure(data=[go.Pie(
+        labels=['Positive', 'Neutral', 'Negative'],
+        values=list(counts),
+        marker=dict(colors=SENTIMENT_COLORS),
+        hole=0.4,  # Donut chart for modern look
+        textinfo='label+percent',
+        textfont=dict(size=12),
+        hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
+    )])
+
+    fig_pie.update_layout(
+        showlegend=False,
+        margin=dict(t=30, b=0, l=0, r=0),
+        height=300,
+        title=dict(text="Sentiment Split", font=dict(size=14, color=MAIN_BLUE), x=0.5, xanchor='center')
+    )
+
+    # Bar chart - Sentiment counts
+    fig_bar = go.Figure(data=[
+        go.Bar(
+            x=['Positive', 'Neutral', 'Negative'],
+            y=list(counts),
+            marker=dict(color=SENTIMENT_COLORS),
+            text=list(counts),
+            textposition='auto',
+            hovertemplate='<b>%{x}</b><br>Articles: %{y}<br>Percentage: %{customdata}%<extra></extra>',
+            customdata=list(percentages)
+        )
+    ])
+
+    fig_bar.update_layout(
+        yaxis_title="Article Count",
+        margin=dict(t=30, b=40, l=40, r=0),
+        height=300,
+        showlegend=False,
+        title=dict(text="Article Count by Sentiment", font=dict(size=14, color=MAIN_BLUE), x=0.5, xanchor='center')
+    )
+
+    return fig_pie, fig_bar
@@ -1,40 +1,63 @@
 """
 User Database Module
-Stores usernames and passwords for authentication
-In a production environment, use a proper database and hash passwords
+Stores usernames and passwords for authentication in the `users` table of
+the app database, with an in-process read cache
+In a production environment, use a salted password hash
 """
 
+import atexit
 import hashlib
 import json
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
 
-# File to store user data
+from config import DATABASE_PATH, LOGIN_FLUSH_INTERVAL, LOGIN_FLUSH_SIZE
+
+# Legacy JSON user file, migrated into the database on first use
 USERS_FILE = "users_data.json"
 
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER NOT NULL,
+    username VARCHAR(50) NOT NULL,
+    password VARCHAR(64) NOT NULL,
+    email VARCHAR(100),
+    full_name VARCHAR(100),
+    created_at DATETIME,
+    last_login DATETIME,
+    login_count INTEGER,
+    PRIMARY KEY (id),
+    UNIQUE (username)
+);
+-- Bumped by every change to the account columns UserStore caches. PRAGMA
+-- data_version cannot tell the users table apart from the other tables
+-- sharing the app database, and login telemetry must not count either.
+CREATE TABLE IF NOT EXISTS users_version (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    version INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO users_version (id, version) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS users_version_insert AFTER INSERT ON users BEGIN
+    UPDATE users_version SET version = version + 1 WHERE id = 0;
+END;
+-- Databases created before the column list was added have the old trigger
+DROP TRIGGER IF EXISTS users_version_update;
+CREATE TRIGGER users_version_update
+AFTER UPDATE OF username, password, email, full_name, created_at ON users BEGIN
+    UPDATE users_version SET version = version + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS users_version_delete AFTER DELETE ON users BEGIN
+    UPDATE users_version SET version = version + 1 WHERE id = 0;
+END;
+"""
+
 def hash_password(password):
     """Hash a password for storing"""
     return hashlib.sha256(password.encode()).hexdigest()
 
-def load_users():
-    """Load users from JSON file"""
-    if os.path.exists(USERS_FILE):
-        try:
-            with open(USERS_FILE, 'r') as f:
-                return json.load(f)
-        except:
-            return get_default_users()
-    return get_default_users()
-
-def save_users(users):
-    """Save users to JSON file"""
-    try:
-        with open(USERS_FILE, 'w') as f:
-            json.dump(users, f, indent=4)
-        return True
-    except Exception as e:
-        print(f"Error saving users: {e}")
-        return False
-
 def get_default_users():
     """Get default users (admin account)"""
     return {
@@ -45,83 +68,402 @@ def get_default_users():
         }
     }
 
+def _now():
+    return datetime.now().isoformat(sep=' ')
+
+
+class UserStore:
+    """
+    User accounts in SQLite behind a read cache
+
+    Lookups by username hit the UNIQUE index once and are then served from
+    memory. Writes run in transactions and drop the affected cache entry;
+    changes to users by other connections are detected through the
+    trigger-maintained users_version counter, which clears the whole cache.
+    Only the account columns are cached, so login telemetry and writes to
+    the other tables of the app database leave the cache alone; activity()
+    reads login counts straight from the table.
+    """
+
+    def __init__(self, db_path=DATABASE_PATH, users_file=USERS_FILE):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._cache = {}
+        # One connection shared by Streamlit's threads, serialized by _lock
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.executescript(SCHEMA)
+        self._users_version = self._current_users_version()
+        if users_file and os.path.exists(users_file):
+            self.migrate_json(users_file)
+        if self._conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
+            self._insert_many(get_default_users())
+
+    def _current_users_version(self):
+        return self._conn.execute("SELECT version FROM users_version WHERE id = 0").fetchone()[0]
+
+    def _check_external_writes(self):
+        """Clear the cache if another connection changed the users table"""
+        version = self._current_users_version()
+        if version != self._users_version:
+            self._cache.clear()
+            self._users_version = version
+
+    @contextmanager
+    def _write(self):
+        """
+        Write transaction that keeps the cache's users version in step
+
+        The write lock is taken up front, so the version read before and
+        after the statements can only differ by this store's own changes.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._check_external_writes()
+                yield
+                self._users_version = self._current_users_version()
+
+    def _insert_many(self, users):
+        """Insert {username: record} entries, skipping existing usernames"""
+        rows = [
+            (username, record["password"], record.get("email", ""),
+             record.get("full_name", ""), record.get("created_at") or _now())
+            for username, record in users.items()
+        ]
+        with self._write():
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO users (username, password, email, full_name, created_at, login_count) "
+                "VALUES (?, ?, ?, ?, ?, 0)",
+                rows
+            )
+            return self._conn.total_changes - before
+
+    def migrate_json(self, users_file=USERS_FILE):
+        """
+        One-shot import of the legacy JSON user file
+
+        Users already in the table are kept as they are. The file is renamed
+        to <name>.migrated so the import does not run again.
+
+        Returns:
+            int: Number of users imported
+        """
+        try:
+            with open(users_file, 'r') as f:
+                users = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading {users_file} for migration: {e}")
+            return 0
+
+        imported = self._insert_many(users)
+        os.replace(users_file, f"{users_file}.migrated")
+        with self._lock:
+            self._cache.clear()
+        print(f"Migrated {imported} of {len(users)} users from {users_file}")
+        return imported
+
+    def get(self, username):
+        """
+        Get a user's record
+
+        Returns:
+            dict: username, password hash, email, full_name and created_at,
+                or None if there is no such user
+        """
+        with self._lock:
+            self._check_external_writes()
+            record = self._cache.get(username)
+            if record is None:
+                row = self._conn.execute(
+                    "SELECT username, password, email, full_name, created_at FROM users WHERE username = ?",
+                    (username,)
+                ).fetchone()
+                if row is None:
+                    return None
+                record = dict(row)
+                self._cache[username] = record
+            return record
+
+    def add(self, username, password_hash, email, full_name):
+        """
+        Insert a user; the UNIQUE index settles concurrent signups
+
+        Returns:
+            bool: False if the username is taken
+        """
+        with self._lock:
+            try:
+                with self._write():
+                    self._conn.execute(
+                        "INSERT INTO users (username, password, email, full_name, created_at, login_count) "
+                        "VALUES (?, ?, ?, ?, ?, 0)",
+                        (username, password_hash, email, full_name, _now())
+                    )
+            except sqlite3.IntegrityError:
+                return False
+            self._cache.pop(username, None)
+            return True
+
+    def update(self, username, **fields):
+        """Update columns of one user; returns False if there is no such user"""
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock:
+            with self._write():
+                updated = self._conn.execute(
+                    f"UPDATE users SET {assignments} WHERE username = ?",
+                    (*fields.values(), username)
+                ).rowcount
+            self._cache.pop(username, None)
+            return updated > 0
+
+    def delete(self, username):
+        """Delete a user; returns False if there is no such user"""
+        with self._lock:
+            with self._write():
+                deleted = self._conn.execute(
+                    "DELETE FROM users WHERE username = ?", (username,)
+                ).rowcount
+            self._cache.pop(username, None)
+            return deleted > 0
+
+    def usernames(self):
+        """All usernames in signup order"""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT username FROM users ORDER BY id")]
+
+    def apply_logins(self, logins):
+        """
+        Add buffered logins to login_count/last_login in one transaction
+
+        Args:
+            logins (dict): username -> (number of logins, latest login time)
+        """
+        rows = [(count, last_login, username) for username, (count, last_login) in logins.items()]
+        with self._lock:
+            with self._write():
+                self._conn.executemany(
+                    "UPDATE users SET login_count = COALESCE(login_count, 0) + ?, "
+                    "last_login = MAX(COALESCE(last_login, ''), ?) WHERE username = ?",
+                    rows
+                )
+
+    def activity(self, username=None, since=None, limit=None):
+        """
+        Login activity, most recent first
+
+        Args:
+            username (str): Only this user
+            since (str): Only users who logged in at or after this time
+            limit (int): Maximum number of users
+
+        Returns:
+            list: dicts with username, login_count, last_login and created_at
+        """
+        sql = "SELECT username, COALESCE(login_count, 0) AS login_count, last_login, created_at FROM users"
+        conditions, params = [], []
+        if username is not None:
+            conditions.append("username = ?")
+            params.append(username)
+        if since is not None:
+            conditions.append("last_login >= ?")
+            params.append(since)
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY last_login IS NULL, last_login DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return [dict(row) for row in self._conn.execute(sql, params)]
+
+
+class LoginRecorder:
+    """
+    Write-behind buffer for login telemetry
+
+    record() only updates a dict in memory. A background thread writes the
+    pending logins in one transaction every flush_interval seconds, or as
+    soon as flush_size logins are pending, and once more at interpreter
+    exit, so a login never waits on a database write.
+    """
+
+    def __init__(self, store, flush_interval=LOGIN_FLUSH_INTERVAL, flush_size=LOGIN_FLUSH_SIZE):
+        self.store = store
+        self.flush_interval = flush_interval
+        self.flush_size = flush_size
+        self._lock = threading.Lock()
+        # username -> [login count, latest login time]
+        self._pending = {}
+        self._pending_events = 0
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="login-recorder", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def record(self, username, when=None):
+        """Count one login for username (at `when`, default now)"""
+        when = when or _now()
+        with self._lock:
+            entry = self._pending.setdefault(username, [0, ""])
+            entry[0] += 1
+            entry[1] = max(entry[1], when)
+            self._pending_events += 1
+            if self._pending_events >= self.flush_size:
+                self._wake.set()
+
+    def flush(self):
+        """
+        Write all pending logins now
+
+        Returns:
+            int: Number of logins written
+        """
+        with self._lock:
+            pending = self._pending
+            events = self._pending_events
+            self._pending = {}
+            self._pending_events = 0
+        if not pending:
+            return 0
+
+        try:
+            self.store.apply_logins({username: tuple(entry) for username, entry in pending.items()})
+        except sqlite3.Error as e:
+            # Put them back so the next flush retries
+            with self._lock:
+                for username, (count, last_login) in pending.items():
+                    entry = self._pending.setdefault(username, [0, ""])
+                    entry[0] += count
+                    entry[1] = max(entry[1], last_login)
+                self._pending_events += events
+            print(f"Error writing login telemetry: {e}")
+            return 0
+        return events
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self):
+        """Stop the background thread and write what is still pending"""
+        self._stopped = True
+        self._wake.set()
+        self._thread.join(timeout=5)
+        self.flush()
+
+
+# Singleton instance for easy import
+_store_instance = None
+_store_lock = threading.Lock()
+
+def get_user_store():
+    """Get singleton instance of UserStore for the app database"""
+    global _store_instance
+    with _store_lock:
+        if _store_instance is None:
+            _store_instance = UserStore()
+        return _store_instance
+
+_recorder_instance = None
+
+def get_login_recorder():
+    """Get singleton LoginRecorder writing to the app's user store"""
+    global _recorder_instance
+    store = get_user_store()
+    with _store_lock:
+        if _recorder_instance is None:
+            _recorder_instance = LoginRecorder(store)
+        return _recorder_instance
+
+def record_login(username):
+    """Note a successful login (written to the database in the background)"""
+    get_login_recorder().record(username)
+
+def get_user_activity(username):
+    """
+    Get a user's login activity, including logins not yet written
+
+    Returns:
+        dict: username, login_count, last_login and created_at, or None
+    """
+    recorder = get_login_recorder()
+    recorder.flush()
+    rows = get_user_store().activity(username=username)
+    return rows[0] if rows else None
+
+def get_recent_logins(limit=10, since=None):
+    """
+    Get the most recently active users
+
+    Args:
+        limit (int): Maximum number of users
+        since (str): Optional "YYYY-MM-DD HH:MM:SS" lower bound on last_login
+
+    Returns:
+        list: Activity dicts, most recent login first
+    """
+    get_login_recorder().flush()
+    return get_user_store().activity(since=since, limit=limit)
+
 def add_user(username, password, email, full_name):
     """Add a new user to the database"""
-    users = load_users()
-    
-    # Check if username already exists
-    if username in users:
-        return False, "Username already exists"
-    
-    # Add new user
-    users[username] = {
-        "password": hash_password(password),
-        "email": email,
-        "full_name": full_name
-    }
-    
-    # Save to file
-    if save_users(users):
+    if get_user_store().add(username, hash_password(password), email, full_name):
         return True, "User created successfully"
-    else:
-        return False, "Error saving user data"
+    return False, "Username already exists"
 
 def verify_user(username, password):
     """Verify user credentials"""
-    users = load_users()
-    
-    if username not in users:
+    user = get_user_store().get(username)
+    if user is None:
         return False
-    
+
     hashed_password = hash_password(password)
-    return users[username]["password"] == hashed_password
+    return user["password"] == hashed_password
 
 def get_user_info(username):
     """Get user information"""
-    users = load_users()
-    
-    if username in users:
+    user = get_user_store().get(username)
+
+    if user is not None:
         return {
             "username": username,
-            "email": users[username].get("email", ""),
-            "full_name": users[username].get("full_name", "")
+            "email": user["email"] or "",
+            "full_name": user["full_name"] or ""
         }
     return None
 
 def user_exists(username):
     """Check if a username exists"""
-    users = load_users()
-    return username in users
+    return get_user_store().get(username) is not None
 
 def get_all_usernames():
     """Get list of all usernames"""
-    users = load_users()
-    return list(users.keys())
+    return get_user_store().usernames()
 
 def delete_user(username):
     """Delete a user from the database"""
-    users = load_users()
-    
-    if username in users:
-        del users[username]
-        return save_users(users)
-    return False
+    return get_user_store().delete(username)
 
 def update_password(username, old_password, new_password):
     """Update user password"""
-    users = load_users()
-    
-    if username not in users:
+    store = get_user_store()
+    user = store.get(username)
+
+    if user is None:
         return False, "User not found"
-    
+
     # Verify old password
-    if users[username]["password"] != hash_password(old_password):
+    if user["password"] != hash_password(old_password):
         return False, "Incorrect old password"
-    
+
     # Update password
-    users[username]["password"] = hash_password(new_password)
-    
-    if save_users(users):
+    if store.update(username, password=hash_password(new_password)):
         return True, "Password updated successfully"
     else:
         return False, "Error updating password"